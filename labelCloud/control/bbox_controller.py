@@ -341,8 +341,7 @@ class BoundingBoxController(object):
             x,
             y,
             self.bboxes,
-            self.view.gl_widget.modelview,
-            self.view.gl_widget.projection,
+            self.view.gl_widget.camera,
         )
         if intersected_bbox_id is not None:
             self.set_active_bbox(intersected_bbox_id)
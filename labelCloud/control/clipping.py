@@ -0,0 +1,76 @@
+"""
+A module for hiding parts of the point cloud without copying it. Points outside of a
+height band, outside of a slab around the active bounding box or in front of a cut
+plane are clipped by OpenGL and ignored when picking.
+"""
+
+import logging
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ..utils import math3d, oglhelper
+from .bbox_controller import BoundingBoxController
+
+if TYPE_CHECKING:
+    from ..view.gui import GUI
+
+
+class ClipManager(object):
+    BOX_SLAB_MARGIN = 0.2  # added above and below the active bounding box
+
+    def __init__(self, bbox_controller: BoundingBoxController) -> None:
+        self.bbox_controller = bbox_controller
+        self.view: GUI
+        self.height_band: Optional[Tuple[float, float]] = None  # minimum, maximum z
+        self.box_slab = False  # only show points at the height of the active box
+        self.cut_plane: Optional[npt.NDArray] = None  # (a, b, c, d)
+
+    def set_view(self, view: "GUI") -> None:
+        self.view = view
+        self.view.gl_widget.clip_manager = self
+
+    def set_height_band(self, band: Optional[Tuple[float, float]]) -> None:
+        self.height_band = band
+        logging.info(f"Set clipping height band to {band}.")
+
+    def set_box_slab(self, state: bool) -> None:
+        self.box_slab = state
+
+    def cut_at_cursor(self) -> None:
+        """Hide the points between the camera and the point under the crosshair."""
+        gl_widget = self.view.gl_widget
+        point = gl_widget.get_world_coords(*gl_widget.crosshair_pos, correction=True)
+        near, far = oglhelper.get_pick_ray(*gl_widget.crosshair_pos, gl_widget.camera)
+        self.cut_plane = math3d.get_plane(point, np.subtract(far, near))
+        logging.info(f"Cutting the point cloud at {np.round(point, 2)}.")
+
+    def remove_cut_plane(self) -> None:
+        self.cut_plane = None
+
+    def get_planes(self) -> npt.NDArray:
+        """Return all planes (n x 4) in point cloud coordinates, facing the kept points."""
+        planes: List[npt.NDArray] = []
+        if self.height_band is not None:
+            z_min, z_max = self.height_band
+            planes.extend(
+                math3d.get_slab_planes(
+                    (0, 0, (z_min + z_max) / 2), (0, 0, 1), z_max - z_min
+                )
+            )
+
+        bbox = self.bbox_controller.get_active_bbox()
+        if self.box_slab and bbox is not None:
+            rotation = math3d.get_rotation_matrix(*bbox.get_rotations(), degrees=True)
+            planes.extend(
+                math3d.get_slab_planes(
+                    bbox.get_center(),
+                    rotation[:, 2],  # upward axis of the box
+                    bbox.height + 2 * ClipManager.BOX_SLAB_MARGIN,
+                )
+            )
+
+        if self.cut_plane is not None:
+            planes.append(self.cut_plane)
+        return np.array(planes).reshape((-1, 4))
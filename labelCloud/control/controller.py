@@ -12,6 +12,7 @@ from ..utils import oglhelper
 from ..view.gui import GUI
 from .alignmode import AlignMode
 from .bbox_controller import BoundingBoxController
+from .clipping import ClipManager
 from .config_manager import config
 from .drawing_manager import DrawingManager
 from .pcd_manager import PointCloudManger
@@ -29,6 +30,7 @@ class Controller:
         # Drawing states
         self.drawing_mode = DrawingManager(self.bbox_controller)
         self.align_mode = AlignMode(self.pcd_manager)
+        self.clip_manager = ClipManager(self.bbox_controller)
 
         # Control states
         self.curr_cursor_pos: Optional[QPoint] = None  # updated by mouse movement
@@ -47,6 +49,7 @@ class Controller:
         self.pcd_manager.set_view(self.view)
         self.drawing_mode.set_view(self.view)
         self.align_mode.set_view(self.view)
+        self.clip_manager.set_view(self.view)
         self.view.gl_widget.set_bbox_controller(self.bbox_controller)
         self.bbox_controller.pcd_manager = self.pcd_manager
 
@@ -55,10 +58,13 @@ class Controller:
         self.next_pcd(save=False)
 
     def loop_gui(self) -> None:
-        """Function collection called during each event loop iteration."""
+        """Function collection called for each requested frame."""
         self.set_crosshair()
         self.set_selected_side()
         self.view.gl_widget.updateGL()
+        # Redraw until the camera stopped and all points are uploaded
+        if self.view.gl_widget.decimated:
+            self.view.request_repaint()
 
     # POINT CLOUD METHODS
     def next_pcd(self, save: bool = True) -> None:
@@ -130,8 +136,7 @@ class Controller:
                 self.curr_cursor_pos.x(),
                 self.curr_cursor_pos.y(),
                 self.bbox_controller.get_active_bbox(),  # type: ignore
-                self.view.gl_widget.modelview,
-                self.view.gl_widget.projection,
+                self.view.gl_widget.camera,
             )
         if (
             self.selected_side
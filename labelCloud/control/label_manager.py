@@ -1,7 +1,10 @@
+import copy
 import logging
 from pathlib import Path
 from typing import List, Optional
 
+import numpy.typing as npt
+
 from ..io.labels import BaseLabelFormat, CentroidFormat, KittiFormat, VerticesFormat
 from ..io.labels.config import LabelConfig
 from ..model import BBox
@@ -52,9 +55,12 @@ class LabelManager(object):
 
         self.label_strategy = get_label_strategy(strategy, self.label_folder)
 
-    def import_labels(self, pcd_path: Path) -> List[BBox]:
+    def import_labels(
+        self, pcd_path: Path, origin: Optional[npt.NDArray] = None
+    ) -> List[BBox]:
+        """Import the labels and move them relative to the origin of the point cloud."""
         try:
-            return self.label_strategy.import_labels(pcd_path)
+            bboxes = self.label_strategy.import_labels(pcd_path)
         except KeyError as key_error:
             logging.warning("Found a key error with %s in the dictionary." % key_error)
             logging.warning(
@@ -70,5 +76,20 @@ class LabelManager(object):
             )
             return []
 
-    def export_labels(self, pcd_path: Path, bboxes: List[BBox]) -> None:
+        if origin is not None and origin.any():
+            for bbox in bboxes:
+                bbox.translate_bbox(*(-origin).tolist())
+        return bboxes
+
+    def export_labels(
+        self,
+        pcd_path: Path,
+        bboxes: List[BBox],
+        origin: Optional[npt.NDArray] = None,
+    ) -> None:
+        """Export the labels in the coordinates of the point cloud file."""
+        if origin is not None and origin.any():
+            bboxes = [copy.copy(bbox) for bbox in bboxes]
+            for bbox in bboxes:
+                bbox.translate_bbox(*origin.tolist())
         self.label_strategy.export_labels(bboxes, pcd_path)
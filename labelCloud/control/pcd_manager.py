@@ -3,18 +3,23 @@ Module to manage the point clouds (loading, navigation, floor alignment).
 Sets the point cloud and original point cloud path. Initiate the writing to the virtual object buffer.
 """
 
+import bisect
 import logging
+import threading
 from pathlib import Path
+from queue import Empty, Queue
 from shutil import copyfile
 from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
 import numpy as np
-import open3d as o3d
 import pkg_resources
+from PyQt5 import QtCore
 
 from ..definitions import LabelingMode, Point3D
 from ..io.labels.config import LabelConfig
-from ..io.pointclouds import BasePointCloudHandler, Open3DHandler
+from ..io.pointclouds import AsciiHandler, BasePointCloudHandler, Open3DHandler
+from ..io.pointclouds.manifest import DatasetManifest
+from ..io.pointclouds.prefetch import PointCloudPrefetcher
 from ..model import BBox, Perspective, PointCloud
 from ..utils.logger import blue, green, print_column
 from .config_manager import config
@@ -29,6 +34,7 @@ class PointCloudManger(object):
     ORIGINALS_FOLDER = "original_pointclouds"
     TRANSLATION_FACTOR = config.getfloat("POINTCLOUD", "STD_TRANSLATION")
     ZOOM_FACTOR = config.getfloat("POINTCLOUD", "STD_ZOOM")
+    PREFETCH_COUNT = config.getint("POINTCLOUD", "prefetch_count", fallback=2)
     SEGMENTATION = LabelConfig().type == LabelingMode.SEMANTIC_SEGMENTATION
 
     def __init__(self) -> None:
@@ -36,6 +42,16 @@ class PointCloudManger(object):
         self.pcd_folder = config.getpath("FILE", "pointcloud_folder")
         self.pcds: List[Path] = []
         self.current_id = -1
+        self.manifest: Optional[DatasetManifest] = None
+        self.found_queue: "Queue[Optional[List[Path]]]" = Queue()
+        # Adds the files found by the folder enumeration
+        self.enumeration_timer = QtCore.QTimer()
+        self.enumeration_timer.setInterval(100)
+        self.enumeration_timer.timeout.connect(self.add_found_pcds)
+        # Keeps the previous, current and next point clouds decoded
+        self.prefetcher = PointCloudPrefetcher(
+            capacity=PointCloudManger.PREFETCH_COUNT + 2
+        )
 
         self.view: GUI
         self.label_manager = LabelManager()
@@ -58,11 +74,19 @@ class PointCloudManger(object):
 
     def read_pointcloud_folder(self) -> None:
         """Checks point cloud folder and sets self.pcds to all valid point cloud file names."""
+        self.stop_manifest_scan()
+        self.current_id = -1
         if self.pcd_folder.is_dir():
-            self.pcds = []
-            for file in sorted(self.pcd_folder.rglob("*")):
-                if file.suffix in PointCloudManger.PCD_EXTENSIONS:
-                    self.pcds.append(file)
+            self.manifest = DatasetManifest(
+                self.pcd_folder, PointCloudManger.PCD_EXTENSIONS
+            )
+            if self.manifest.is_up_to_date():
+                self.pcds = self.manifest.get_paths()
+                self.manifest.start_scan()
+            else:
+                self.pcds = []
+                self.start_enumeration()
+                self.add_found_pcds(block=True)  # returns with the first files
         else:
             logging.warning(
                 f"Point cloud path {self.pcd_folder} is not a valid directory."
@@ -80,17 +104,18 @@ class PointCloudManger(object):
             self.view.status_manager.set_message(
                 "Please set the point cloud folder to a location that contains point cloud files."
             )
-            self.pointcloud = PointCloud.from_file(
-                Path(
-                    pkg_resources.resource_filename(
-                        "labelCloud.resources", "labelCloud_icon.pcd"
+            self.set_pointcloud(
+                PointCloud.from_file(
+                    Path(
+                        pkg_resources.resource_filename(
+                            "labelCloud.resources", "labelCloud_icon.pcd"
+                        )
                     )
                 )
             )
             self.update_pcd_infos(pointcloud_label=" – (select folder!)")
 
         self.view.init_progress(min_value=0, max_value=len(self.pcds) - 1)
-        self.current_id = -1
 
     # GETTER
     def pcds_left(self) -> bool:
@@ -101,11 +126,14 @@ class PointCloudManger(object):
         if self.pcds_left():
             self.current_id += 1
             self.save_current_perspective()
-            self.pointcloud = PointCloud.from_file(
-                self.pcd_path,
-                self.saved_perspective,
-                write_buffer=self.pointcloud is not None,
+            self.set_pointcloud(
+                PointCloud.from_file(
+                    self.pcd_path,
+                    self.saved_perspective,
+                    prefetcher=self.prefetcher,
+                )
             )
+            self.prefetch_neighbours()
             self.update_pcd_infos()
         else:
             logging.warning("No point clouds left!")
@@ -115,11 +143,14 @@ class PointCloudManger(object):
         if pcd_index < len(self.pcds):
             self.current_id = pcd_index
             self.save_current_perspective()
-            self.pointcloud = PointCloud.from_file(
-                self.pcd_path,
-                self.saved_perspective,
-                write_buffer=self.pointcloud is not None,
+            self.set_pointcloud(
+                PointCloud.from_file(
+                    self.pcd_path,
+                    self.saved_perspective,
+                    prefetcher=self.prefetcher,
+                )
             )
+            self.prefetch_neighbours()
             self.update_pcd_infos()
         else:
             logging.warning("This point cloud does not exists!")
@@ -129,13 +160,110 @@ class PointCloudManger(object):
         if self.current_id > 0:
             self.current_id -= 1
             self.save_current_perspective()
-            self.pointcloud = PointCloud.from_file(
-                self.pcd_path, self.saved_perspective
+            self.set_pointcloud(
+                PointCloud.from_file(
+                    self.pcd_path, self.saved_perspective, prefetcher=self.prefetcher
+                )
             )
+            self.prefetch_neighbours()
             self.update_pcd_infos()
         else:
             raise Exception("No point cloud left for loading!")
 
+    def start_enumeration(self) -> None:
+        """Enumerates the point cloud folder on a worker, found files are queued."""
+        assert self.manifest is not None
+        found_queue: "Queue[Optional[List[Path]]]" = Queue()
+        self.found_queue = found_queue
+
+        def enumerate_folder(manifest: DatasetManifest) -> None:
+            try:
+                if not manifest.update_file_list(found_queue.put):
+                    return  # stopped, the folder was changed in the meantime
+            except Exception:
+                logging.exception("Enumerating the point cloud folder failed.")
+            found_queue.put(None)  # marks the end of the enumeration
+
+        threading.Thread(
+            target=enumerate_folder,
+            args=(self.manifest,),
+            name="pcd-enumeration",
+            daemon=True,
+        ).start()
+        self.enumeration_timer.start()
+
+    def add_found_pcds(self, block: bool = False) -> None:
+        """Inserts the point clouds that were found since the last call.
+
+        Is polled by a timer while enumerating; with `block`, it waits for the first
+        files or the end of the enumeration. The list is kept sorted, the current
+        point cloud keeps its position relative to the others.
+        """
+        found, finished = False, False
+        while True:
+            try:
+                batch = self.found_queue.get(block=block)
+            except Empty:
+                break
+            block = False
+            if batch is None:
+                finished = True
+                break
+            self.pcds.extend(batch)
+            found = True
+
+        if found:
+            current_path = self.pcd_path if self.current_id >= 0 else None
+            self.pcds.sort()  # merges the sorted list with the new files
+            if current_path is not None:
+                self.current_id = bisect.bisect_left(self.pcds, current_path)
+                self.prefetch_neighbours()  # the neighbours might have changed
+        if finished:
+            self.finish_enumeration()
+        elif found:
+            self.view.status_manager.set_message(
+                f"Found {len(self.pcds)} point clouds so far, still searching ..."
+            )
+            self.view.init_progress(min_value=0, max_value=len(self.pcds) - 1)
+            self.update_pcd_infos()
+
+    def finish_enumeration(self) -> None:
+        assert self.manifest is not None
+        self.enumeration_timer.stop()
+        if self.pcds:
+            self.view.status_manager.set_message(
+                f"Found {len(self.pcds)} point clouds in the point cloud folder."
+            )
+            self.view.init_progress(min_value=0, max_value=len(self.pcds) - 1)
+            self.update_pcd_infos()
+            self.manifest.start_scan()
+
+    def get_pcd_info(self, pcd_index: int) -> str:
+        """Describes the point cloud with the manifest, without loading it."""
+        pcd_path = self.pcds[pcd_index]
+        entry = self.manifest.get_entry(pcd_path) if self.manifest else None
+        if entry is None:
+            return pcd_path.name
+        return f"{pcd_path.name} ({entry.describe()})"
+
+    def stop_manifest_scan(self) -> None:
+        self.enumeration_timer.stop()
+        if self.manifest is not None:
+            self.manifest.stop()
+
+    def prefetch_neighbours(self) -> None:
+        """Decode the next and the previous point clouds in the background."""
+        neighbour_ids = [
+            *range(
+                self.current_id + 1,
+                self.current_id + 1 + PointCloudManger.PREFETCH_COUNT,
+            ),
+            self.current_id - 1,
+        ]
+        self.prefetcher.prefetch(
+            self.pcds[i] for i in neighbour_ids if 0 <= i < len(self.pcds)
+        )
+
     def populate_class_dropdown(self) -> None:
         # Add point label list
         self.view.current_class_dropdown.clear()
@@ -145,7 +273,8 @@ class PointCloudManger(object):
             self.view.current_class_dropdown.addItem(label_class.name)
 
     def get_labels_from_file(self) -> List[BBox]:
-        bboxes = self.label_manager.import_labels(self.pcd_path)
+        assert self.pointcloud is not None
+        bboxes = self.label_manager.import_labels(self.pcd_path, self.pointcloud.origin)
         logging.info(green("Loaded %s bboxes!" % len(bboxes)))
         return bboxes
 
@@ -153,13 +282,30 @@ class PointCloudManger(object):
     def set_view(self, view: "GUI") -> None:
         self.view = view
         self.view.gl_widget.set_pointcloud_controller(self)
+        AsciiHandler().progress_callback = self.view.status_manager.set_progress
         self.view.update_default_object_class_menu(
             set(LabelConfig().get_classes().keys())
         )  # TODO: Move to better location
 
+    def set_pointcloud(self, pointcloud: PointCloud) -> None:
+        """Replace the point cloud, the new one reuses the GPU buffers of the old one.
+
+        Before the OpenGL widget is initialized, the buffers are created by it.
+        """
+        buffer_pool = self.view.gl_widget.buffer_pool
+        if self.pointcloud is not None:
+            self.pointcloud.release_buffers()
+        self.pointcloud = pointcloud
+        if buffer_pool is not None:
+            pointcloud.create_buffers(buffer_pool)
+            buffer_pool.delete_free()
+
     def save_labels_into_file(self, bboxes: List[BBox]) -> None:
         if self.pcds:
-            self.label_manager.export_labels(self.pcd_path, bboxes)
+            assert self.pointcloud is not None
+            self.label_manager.export_labels(
+                self.pcd_path, bboxes, self.pointcloud.origin
+            )
             self.collected_object_classes.update(
                 {bbox.get_classname() for bbox in bboxes}
             )
@@ -223,6 +369,9 @@ class PointCloudManger(object):
         self, axis: List[float], angle: float, rotation_point: Point3D
     ) -> None:
         assert self.pointcloud is not None and self.pcd_name is not None
+        if self.pointcloud.is_decimated:
+            logging.warning("Decimated point clouds cannot be aligned and saved.")
+            return
         # Save current, original point cloud in ORIGINALS_FOLDER
         originals_path = self.pcd_folder.joinpath(PointCloudManger.ORIGINALS_FOLDER)
         originals_path.mkdir(parents=True, exist_ok=True)
@@ -233,6 +382,8 @@ class PointCloudManger(object):
         logging.info("Copyied the original point cloud to %s.", blue(originals_path))
 
         # Rotate and translate point cloud
+        import open3d as o3d  # imported lazily, as it takes a while to load
+
         rotation_matrix = o3d.geometry.get_rotation_matrix_from_axis_angle(
             np.multiply(axis, angle)
         )
@@ -253,11 +404,14 @@ class PointCloudManger(object):
             )
 
         points, colors = Open3DHandler.to_point_cloud(o3d_pointcloud)
-        self.pointcloud = PointCloud(
-            self.pcd_path,
-            points,
-            colors,
-            self.pointcloud.labels,
+        self.set_pointcloud(
+            PointCloud(
+                self.pcd_path,
+                points,
+                colors,
+                self.pointcloud.labels,
+                origin=self.pointcloud.origin,
+            )
         )
         self.pointcloud.to_file()
 
@@ -1,3 +1,7 @@
-from .base import BasePointCloudHandler
+from .base import BasePointCloudHandler, PointCloudInfo
+from .ascii import AsciiHandler
+from .las import LasHandler
 from .numpy import NumpyHandler
 from .open3d import Open3DHandler
+from .pcd import PcdHandler
+from .ply import PlyHandler
@@ -0,0 +1,131 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ...utils.color import normalize_colors, to_byte_colors
+from . import BasePointCloudHandler, PointCloudInfo
+
+if TYPE_CHECKING:
+    from ...model import PointCloud
+
+
+CHUNK_SIZE = 16 * 1024 * 1024  # bytes of text parsed per task
+
+
+def get_chunk_boundaries(path: Path, start: int, chunk_size: int) -> List[int]:
+    """Split the file after `start` into chunks that end on line boundaries."""
+    file_size = path.stat().st_size
+    boundaries = [start]
+    with path.open("rb") as stream:
+        for offset in range(start + chunk_size, file_size, chunk_size):
+            stream.seek(offset)
+            stream.readline()  # move to the start of the next line
+            if stream.tell() > boundaries[-1]:
+                boundaries.append(stream.tell())
+    if boundaries[-1] < file_size:
+        boundaries.append(file_size)
+    return sorted(set(boundaries))
+
+
+def parse_chunk(path: Path, start: int, end: int, columns: int) -> npt.NDArray:
+    """Parse whitespace separated numbers (numpy releases the GIL while parsing)."""
+    with path.open("rb") as stream:
+        stream.seek(start)
+        text = stream.read(end - start)
+    return np.fromstring(text, dtype=np.float32, sep=" ").reshape((-1, columns))
+
+
+class AsciiHandler(BasePointCloudHandler):
+    EXTENSIONS = {".pts", ".xyz", ".xyzn", ".xyzrgb"}
+
+    def __init__(self) -> None:
+        super().__init__()
+        # Called with a message and the progress (0..1) while parsing
+        self.progress_callback: Optional[Callable[[str, float], None]] = None
+
+    @staticmethod
+    def read_layout(path: Path) -> Tuple[int, int]:
+        """Return the offset of the first data line and the number of columns."""
+        with path.open("rb") as stream:
+            first_line = stream.readline()
+            if path.suffix == ".pts" and len(first_line.split()) == 1:
+                data_start = stream.tell()  # skip the point count of PTS files
+                first_line = stream.readline()
+            else:
+                data_start = 0
+        return data_start, len(first_line.split())
+
+    def read_info(self, path: Path) -> PointCloudInfo:
+        """Only PTS files state their point count (in the first line)."""
+        data_start, columns = self.read_layout(path)
+        point_count = None
+        if data_start > 0:
+            with path.open("rb") as stream:
+                point_count = int(stream.readline())
+        has_colors = path.suffix in (".xyzrgb", ".pts") and columns >= 6
+        return PointCloudInfo(point_count, has_colors)
+
+    def report_progress(self, path: Path, progress: float) -> None:
+        if self.progress_callback is not None:
+            self.progress_callback(f"Parsing {path.name}", progress)
+
+    def read_values(self, path: Path) -> npt.NDArray[np.float32]:
+        """Parse all lines in parallel chunks into one float32 array."""
+        data_start, columns = self.read_layout(path)
+        boundaries = get_chunk_boundaries(path, data_start, CHUNK_SIZE)
+        chunks = list(zip(boundaries[:-1], boundaries[1:]))
+        if not chunks:
+            return np.empty((0, max(columns, 3)), dtype=np.float32)
+
+        values: List[Optional[npt.NDArray]] = [None] * len(chunks)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = {
+                executor.submit(parse_chunk, path, start, end, columns): index
+                for index, (start, end) in enumerate(chunks)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                values[futures[future]] = future.result()
+                self.report_progress(path, done / len(chunks))
+        return np.concatenate(values)  # type: ignore
+
+    def read_point_cloud(self, path: Path) -> Tuple[npt.NDArray, Optional[npt.NDArray]]:
+        super().read_point_cloud(path)
+        values = self.read_values(path)
+        points = np.ascontiguousarray(values[:, :3])
+
+        colors = None
+        columns = values.shape[1]
+        if path.suffix == ".xyzrgb" and columns >= 6:
+            colors = np.ascontiguousarray(values[:, 3:6])
+        elif path.suffix == ".pts" and columns >= 6:
+            # PTS stores colors from 0 to 255 behind an optional intensity column
+            colors = values[:, columns - 3 :] / 255
+
+        if np.isnan(points.min(initial=0)):
+            valid = ~np.isnan(points).any(axis=1)
+            points = points[valid]
+            colors = colors[valid] if colors is not None else None
+        return points, colors
+
+    def write_point_cloud(self, path: Path, pointcloud: "PointCloud") -> None:
+        super().write_point_cloud(path, pointcloud)
+        columns: List[npt.NDArray] = [pointcloud.points + pointcloud.origin]
+        fmt = ["%.6f"] * 3
+        if path.suffix == ".xyzn":
+            logging.warning("Normals are not stored, writing zero normals.")
+            columns.append(np.zeros_like(pointcloud.points))
+            fmt += ["%d"] * 3
+        elif path.suffix == ".xyzrgb" and pointcloud.colors is not None:
+            columns.append(normalize_colors(pointcloud.colors))
+            fmt += ["%.6f"] * 3
+        elif path.suffix == ".pts" and pointcloud.colors is not None:
+            columns.append(to_byte_colors(pointcloud.colors))
+            fmt += ["%d"] * 3
+
+        header = str(len(pointcloud.points)) if path.suffix == ".pts" else ""
+        np.savetxt(path, np.hstack(columns), fmt=fmt, header=header, comments="")
@@ -1,7 +1,8 @@
 import logging
 from abc import abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Type
 
 import numpy as np
 
@@ -12,8 +13,25 @@ if TYPE_CHECKING:
     from ...model import PointCloud
 
 
+@dataclass
+class PointCloudInfo:
+    """Metadata of a point cloud file, as far as its header stores it."""
+
+    point_count: Optional[int]
+    has_colors: Optional[bool]
+    mins: Optional[List[float]] = None
+    maxs: Optional[List[float]] = None
+
+
 class BasePointCloudHandler(object, metaclass=SingletonABCMeta):
     EXTENSIONS: Set[str] = set()  # should be set in subclasses
+    CACHE_DECODED = True  # disable for formats that are already memory-mapped
+    _registry: Dict[str, Type["BasePointCloudHandler"]] = {}  # extension -> handler
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        for extension in cls.EXTENSIONS:
+            BasePointCloudHandler._registry.setdefault(extension, cls)
 
     @abstractmethod
     def read_point_cloud(self, path: Path) -> Tuple[np.ndarray, Optional[np.ndarray]]:  # type: ignore
@@ -23,6 +41,19 @@ class BasePointCloudHandler(object, metaclass=SingletonABCMeta):
         )
         pass
 
+    @property
+    def stride(self) -> int:
+        """Only every n-th point of the files is read (see `PointCloud.is_decimated`)."""
+        return 1
+
+    def get_origin(self, path: Path) -> np.ndarray:
+        """Offset subtracted from the read points, to keep them precise as float32."""
+        return np.zeros(3)
+
+    def read_info(self, path: Path) -> Optional[PointCloudInfo]:
+        """Read the metadata from the file header, without decoding the points."""
+        return None
+
     @abstractmethod
     def write_point_cloud(self, path: Path, pointcloud: "PointCloud") -> None:
         logging.info(
@@ -32,14 +63,13 @@ class BasePointCloudHandler(object, metaclass=SingletonABCMeta):
 
     @classmethod
     def get_supported_extensions(cls) -> Set[str]:
-        return set().union(*[handler.EXTENSIONS for handler in cls.__subclasses__()])
+        return set(BasePointCloudHandler._registry)
 
     @classmethod
     def get_handler(cls, file_extension: str) -> "BasePointCloudHandler":
         """Return a point cloud handler for the given file extension."""
-        for subclass in cls.__subclasses__():
-            if file_extension in subclass.EXTENSIONS:
-                return subclass()
+        if file_extension in BasePointCloudHandler._registry:
+            return BasePointCloudHandler._registry[file_extension]()
 
         raise ValueError(
             "No point cloud handler found for file extension %s.", file_extension
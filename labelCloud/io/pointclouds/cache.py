@@ -0,0 +1,106 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ...control.config_manager import config
+from ...utils.color import to_byte_colors
+from .base import BasePointCloudHandler
+
+PointCloudData = Tuple[npt.NDArray[np.float32], Optional[npt.NDArray]]
+
+
+class PointCloudCache(object):
+    """Stores decoded point clouds as `.npy` files next to a small validation file.
+
+    Points are saved as float32, colors as uint8 (and returned as bytes). Cached
+    entries are only used as long as size and modification time of the source file
+    did not change.
+    """
+
+    def __init__(self, folder: Path) -> None:
+        self.folder = folder
+
+    @classmethod
+    def from_config(cls) -> Optional["PointCloudCache"]:
+        folder = config.get("FILE", "pointcloud_cache_folder", fallback="")
+        return cls(Path(folder)) if folder else None
+
+    def get_entry_path(self, path: Path, suffix: str) -> Path:
+        digest = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()
+        return self.folder / f"{path.stem}_{digest[:12]}{suffix}"
+
+    @staticmethod
+    def get_source_stats(path: Path) -> dict:
+        stat = path.stat()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    @contextmanager
+    def replace_atomically(self, path: Path, suffix: str) -> Iterator[BinaryIO]:
+        target = self.get_entry_path(path, suffix)
+        tmp_path = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+        with tmp_path.open("wb") as stream:
+            yield stream
+        os.replace(tmp_path, target)
+
+    def load(self, path: Path) -> Optional[PointCloudData]:
+        meta_path = self.get_entry_path(path, ".json")
+        if not meta_path.is_file():
+            return None
+        try:
+            with meta_path.open("r") as stream:
+                meta = json.load(stream)
+            if meta["source"] != self.get_source_stats(path):
+                return None
+
+            points = np.load(self.get_entry_path(path, ".points.npy"), mmap_mode="r")
+            colors = None
+            if meta["colors"]:
+                colors = np.load(self.get_entry_path(path, ".colors.npy"))
+        except (OSError, ValueError, KeyError) as exception:
+            logging.warning("Ignoring invalid cache entry of %s (%s).", path, exception)
+            return None
+        logging.info("Loaded %s from point cloud cache.", path.name)
+        return points, colors
+
+    def store(self, path: Path, data: PointCloudData) -> None:
+        points, colors = data
+        self.folder.mkdir(parents=True, exist_ok=True)
+        arrays: Dict[str, npt.NDArray] = {
+            ".points.npy": np.asarray(points, dtype=np.float32)
+        }
+        if colors is not None:
+            arrays[".colors.npy"] = to_byte_colors(colors)
+        meta = {"source": self.get_source_stats(path), "colors": colors is not None}
+
+        try:
+            # Write to temporary files first, the validation file is replaced last
+            for suffix, array in arrays.items():
+                with self.replace_atomically(path, suffix) as stream:
+                    np.save(stream, array)
+            with self.replace_atomically(path, ".json") as stream:
+                stream.write(json.dumps(meta).encode("utf-8"))
+        except OSError as exception:
+            logging.warning("Could not cache %s (%s).", path.name, exception)
+
+
+def read_point_cloud(path: Path) -> PointCloudData:
+    """Read the point cloud with its handler, using the cache if it is configured."""
+    handler = BasePointCloudHandler.get_handler(path.suffix)
+    cache = PointCloudCache.from_config() if handler.CACHE_DECODED else None
+    if cache is not None:
+        data = cache.load(path)
+        if data is not None:
+            return data
+
+    data = handler.read_point_cloud(path=path)
+    if cache is not None:
+        cache.store(path, data)
+    return data
@@ -0,0 +1,224 @@
+import logging
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ...control.config_manager import config
+from ...utils.color import normalize_colors
+from . import BasePointCloudHandler, PointCloudInfo
+
+if TYPE_CHECKING:
+    from ...model import PointCloud
+
+
+# Point record fields of the point data formats 0 to 3 (without extra bytes)
+POINT_FORMAT_0 = [
+    ("X", "<i4"),
+    ("Y", "<i4"),
+    ("Z", "<i4"),
+    ("intensity", "<u2"),
+    ("return_bits", "u1"),
+    ("classification", "u1"),
+    ("scan_angle_rank", "i1"),
+    ("user_data", "u1"),
+    ("point_source_id", "<u2"),
+]
+GPS_TIME = [("gps_time", "<f8")]
+RGB = [("red", "<u2"), ("green", "<u2"), ("blue", "<u2")]
+POINT_FORMATS = {
+    0: POINT_FORMAT_0,
+    1: POINT_FORMAT_0 + GPS_TIME,
+    2: POINT_FORMAT_0 + RGB,
+    3: POINT_FORMAT_0 + GPS_TIME + RGB,
+}
+HEADER_SIZE_V12 = 227
+
+
+class LasHeader(object):
+    def __init__(self, buffer: bytes) -> None:
+        if buffer[:4] != b"LASF":
+            raise ValueError("File is not a LAS file (missing LASF signature).")
+        self.version: Tuple[int, int] = struct.unpack_from("<BB", buffer, 24)
+        self.generating_software = (
+            buffer[58:90].split(b"\0")[0].decode("ascii", errors="replace")
+        )
+        (
+            self.header_size,
+            self.point_offset,
+            _,  # number of variable length records
+            self.point_format,
+            self.record_length,
+            legacy_point_count,
+        ) = struct.unpack_from("<HIIBHI", buffer, 94)
+        self.scale = np.array(struct.unpack_from("<3d", buffer, 131))
+        self.offset = np.array(struct.unpack_from("<3d", buffer, 155))
+        max_x, min_x, max_y, min_y, max_z, min_z = struct.unpack_from(
+            "<6d", buffer, 179
+        )
+        self.mins = np.array([min_x, min_y, min_z])
+        self.maxs = np.array([max_x, max_y, max_z])
+
+        self.point_count = legacy_point_count
+        if self.version >= (1, 4) and self.header_size >= 255:
+            (self.point_count,) = struct.unpack_from("<Q", buffer, 247)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Dtype of a point record, extra bytes are covered by the item size."""
+        if self.point_format & 0x80:
+            raise ValueError("Compressed LAS (LAZ) point data is not supported.")
+        if self.point_format not in POINT_FORMATS:
+            raise ValueError(
+                f"LAS point data format {self.point_format} is not supported (0-3)."
+            )
+        fields = np.dtype(POINT_FORMATS[self.point_format])
+        return np.dtype(
+            {
+                "names": fields.names,
+                "formats": [fields[name] for name in fields.names],  # type: ignore
+                "offsets": [fields.fields[name][1] for name in fields.names],  # type: ignore
+                "itemsize": self.record_length,
+            }
+        )
+
+
+class LasHandler(BasePointCloudHandler):
+    EXTENSIONS = {".las"}
+    CACHE_DECODED = False
+
+    def __init__(self) -> None:
+        super().__init__()
+
+    @property
+    def stride(self) -> int:
+        return config.getint("POINTCLOUD", "las_point_stride", fallback=1)
+
+    @staticmethod
+    def read_header(path: Path) -> LasHeader:
+        with path.open("rb") as stream:
+            buffer = stream.read(375)  # size of the LAS 1.4 public header block
+        return LasHeader(buffer)
+
+    def get_origin(self, path: Path) -> npt.NDArray[np.float64]:
+        """Rounded minimum of the header bounds, georeferenced points are far from 0."""
+        return np.floor(self.read_header(path).mins)
+
+    @classmethod
+    def get_color_scale(cls, path: Path, header: LasHeader) -> int:
+        """Value of full intensity of the rgb fields.
+
+        The spec asks for 16 bit colors, but many writers of LAS < 1.4 store 8 bit
+        values. As the header cannot tell, these files are treated as 8 bit if no
+        color of the whole file (regardless of `las_point_stride`) exceeds 255.
+        LAS 1.4 and the files written by labelCloud always use 16 bit.
+        """
+        if header.version >= (1, 4) or header.generating_software == "labelCloud":
+            return 65535
+        records = cls.read_records(path, header)
+        for name in ("red", "green", "blue"):
+            if records[name].max(initial=0) > 255:
+                return 65535
+        return 255
+
+    @staticmethod
+    def read_records(path: Path, header: LasHeader, stride: int = 1) -> np.ndarray:
+        """Memory-map the point records and return every `stride`-th of them."""
+        if header.point_count == 0:
+            return np.empty(0, dtype=header.dtype)
+        records = np.memmap(
+            path,
+            dtype=header.dtype,
+            mode="r",
+            offset=header.point_offset,
+            shape=(header.point_count,),
+        )
+        return records[::stride]
+
+    def read_point_cloud(self, path: Path) -> Tuple[npt.NDArray, Optional[npt.NDArray]]:
+        """Read scaled points relative to `get_origin` and colors.
+
+        The points are decimated by `las_point_stride`.
+        """
+        super().read_point_cloud(path)
+        header = self.read_header(path)
+        records = self.read_records(path, header, self.stride)
+
+        # Subtract the origin in double precision, before casting to float32
+        offset = header.offset - self.get_origin(path)
+        points = np.empty((len(records), 3), dtype=np.float32)
+        for i, axis in enumerate("XYZ"):
+            points[:, i] = records[axis] * header.scale[i] + offset[i]
+
+        colors = None
+        if "red" in records.dtype.names:  # type: ignore
+            colors = np.empty((len(records), 3), dtype=np.float32)
+            for i, name in enumerate(("red", "green", "blue")):
+                colors[:, i] = records[name]
+            colors /= self.get_color_scale(path, header)
+        return points, colors
+
+    def read_info(self, path: Path) -> PointCloudInfo:
+        header = self.read_header(path)
+        return PointCloudInfo(
+            header.point_count,
+            (header.point_format & 0x7F) in (2, 3),  # formats with rgb
+            header.mins.tolist(),
+            header.maxs.tolist(),
+        )
+
+    def write_point_cloud(self, path: Path, pointcloud: "PointCloud") -> None:
+        """Write points (and colors) as LAS 1.2 with point data format 0 (or 2).
+
+        The origin of the point cloud is added again to the written coordinates.
+        """
+        super().write_point_cloud(path, pointcloud)
+        logging.warning(
+            "Only writing point coordinates and colors, any other point attributes will be dropped."
+        )
+        point_format = 0 if pointcloud.colors is None else 2
+        dtype = np.dtype(POINT_FORMATS[point_format])
+        mins = np.amin(pointcloud.points, axis=0) + pointcloud.origin
+        maxs = np.amax(pointcloud.points, axis=0) + pointcloud.origin
+        scale = np.full(3, 0.001)
+        offset = np.floor(mins)
+
+        records = np.zeros(len(pointcloud.points), dtype=dtype)
+        for i, axis in enumerate("XYZ"):
+            # Relative to the offset, the coordinates are small enough for float32
+            relative = pointcloud.points[:, i] - (offset[i] - pointcloud.origin[i])
+            records[axis] = np.rint(relative / scale[i])
+        if pointcloud.colors is not None:
+            rgb = np.rint(
+                np.clip(normalize_colors(pointcloud.colors), 0, 1) * 65535
+            ).astype(np.uint16)
+            for i, name in enumerate(("red", "green", "blue")):
+                records[name] = rgb[:, i]
+
+        header = bytearray(HEADER_SIZE_V12)
+        header[0:4] = b"LASF"
+        struct.pack_into("<BB", header, 24, 1, 2)
+        header[26:58] = b"labelCloud".ljust(32, b"\0")
+        header[58:90] = b"labelCloud".ljust(32, b"\0")
+        struct.pack_into(
+            "<HIIBHI",
+            header,
+            94,
+            HEADER_SIZE_V12,
+            HEADER_SIZE_V12,
+            0,
+            point_format,
+            dtype.itemsize,
+            len(records),
+        )
+        struct.pack_into("<I", header, 111, len(records))  # all points as 1st return
+        struct.pack_into("<3d", header, 131, *scale)
+        struct.pack_into("<3d", header, 155, *offset)
+        struct.pack_into(
+            "<6d", header, 179, maxs[0], mins[0], maxs[1], mins[1], maxs[2], mins[2]
+        )
+        with path.open("wb") as stream:
+            stream.write(header)
+            stream.write(records.tobytes())
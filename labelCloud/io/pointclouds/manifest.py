@@ -0,0 +1,296 @@
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .base import BasePointCloudHandler
+
+MANIFEST_FOLDER = ".labelCloud"  # excluded from the folder walk
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 2
+SAVE_INTERVAL = 200  # number of scanned files after which the manifest is saved
+BATCH_SIZE = 1000  # number of found files that are passed on at once
+
+
+@dataclass
+class ManifestEntry:
+    size: int
+    mtime_ns: int
+    scanned: bool = False
+    # Only as far as stored in the file header (see `PointCloudInfo`)
+    point_count: Optional[int] = None
+    mins: Optional[List[float]] = None
+    maxs: Optional[List[float]] = None
+    has_colors: Optional[bool] = None
+
+    @classmethod
+    def from_path(cls, path: Path) -> "ManifestEntry":
+        stat = path.stat()
+        return cls(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+
+    @property
+    def is_scanned(self) -> bool:
+        return self.scanned
+
+    def matches(self, other: "ManifestEntry") -> bool:
+        return (self.size, self.mtime_ns) == (other.size, other.mtime_ns)
+
+    def describe(self) -> str:
+        if not self.is_scanned:
+            return "not scanned yet"
+        details = []
+        if self.point_count is not None:
+            details.append(f"{self.point_count:,} points")
+        if self.has_colors is not None:
+            details.append("colored" if self.has_colors else "colorless")
+        if self.mins is not None and self.maxs is not None:
+            extent = " × ".join(
+                f"{high - low:.1f}" for low, high in zip(self.mins, self.maxs)
+            )
+            details.append(f"extent {extent} m")
+        return ", ".join(details) or f"{self.size / 2**20:.1f} MB"
+
+
+class DatasetManifest(object):
+    """Keeps file stats, point count, bounds and color presence of all point clouds.
+
+    The manifest is stored as `.labelCloud/manifest.json` in the point cloud folder
+    together with the modification times of all subfolders. As long as none of them
+    changed, the file list is taken from the manifest without walking the folder.
+    Missing and changed entries are scanned by a background pool, which only reads
+    the file headers (see `BasePointCloudHandler.read_info`).
+    """
+
+    def __init__(self, folder: Path, extensions: Iterable[str]) -> None:
+        self.folder = folder
+        self.extensions = set(extensions)
+        self.path = folder / MANIFEST_FOLDER / MANIFEST_NAME
+        self.entries: Dict[str, ManifestEntry] = {}  # relative posix path -> entry
+        self.folders: Dict[str, int] = {}  # relative posix path -> mtime_ns
+        self.lock = threading.RLock()
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.stopped = threading.Event()
+        self.remaining = 0  # number of queued scans
+        self.changed_count = 0  # number of entries updated by the current scan
+        # Called with the relative path of each newly scanned entry (from a worker)
+        self.scanned_callback: Optional[Callable[[str], None]] = None
+
+    # PERSISTENCE
+
+    def load(self) -> bool:
+        try:
+            with self.path.open("r") as stream:
+                data = json.load(stream)
+            if data["version"] != MANIFEST_VERSION:
+                return False
+            entries = {
+                name: ManifestEntry(**entry) for name, entry in data["entries"].items()
+            }
+            folders = {name: int(mtime) for name, mtime in data["folders"].items()}
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError) as exception:
+            logging.warning("Ignoring invalid manifest %s (%s).", self.path, exception)
+            return False
+
+        with self.lock:
+            self.entries, self.folders = entries, folders
+        return True
+
+    def save(self) -> None:
+        with self.lock:
+            data = {
+                "version": MANIFEST_VERSION,
+                "folders": dict(self.folders),
+                "entries": {name: asdict(e) for name, e in self.entries.items()},
+            }
+        tmp_path = self.path.with_name(f"{self.path.name}.{threading.get_ident()}.tmp")
+        try:
+            self.path.parent.mkdir(exist_ok=True)
+            with tmp_path.open("w") as stream:
+                json.dump(data, stream, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as exception:
+            logging.warning("Could not save manifest %s (%s).", self.path, exception)
+
+    # FILE LIST
+
+    def get_relative_name(self, path: Path) -> str:
+        return path.relative_to(self.folder).as_posix()
+
+    def folders_changed(self) -> bool:
+        """Checks the stored folder modification times (one stat per folder)."""
+        if not self.folders:
+            return True
+        for name, mtime_ns in self.folders.items():
+            try:
+                if (self.folder / name).stat().st_mtime_ns != mtime_ns:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def enumerate_folder(
+        self, found_callback: Optional[Callable[[List[Path]], None]] = None
+    ) -> bool:
+        """Walks the folder with `os.scandir` and keeps the entries of unchanged files.
+
+        Found files are passed to `found_callback` in batches (unsorted) while walking,
+        the first file is passed on immediately. Returns False if it was stopped.
+        """
+        folders: Dict[str, int] = {}
+        entries: Dict[str, ManifestEntry] = {}
+        batch: List[Path] = []
+        directories = [self.folder]
+        while directories:
+            if self.stopped.is_set():
+                return False
+            directory = directories.pop()
+            try:
+                folders[self.get_relative_name(directory)] = (
+                    directory.stat().st_mtime_ns
+                )
+                with os.scandir(directory) as iterator:
+                    for dir_entry in iterator:
+                        if self.stopped.is_set():
+                            return False
+                        if dir_entry.is_dir():
+                            if dir_entry.name != MANIFEST_FOLDER:
+                                directories.append(Path(dir_entry.path))
+                            continue
+                        if os.path.splitext(dir_entry.name)[1] not in self.extensions:
+                            continue
+
+                        path = Path(dir_entry.path)
+                        name = self.get_relative_name(path)
+                        stat = dir_entry.stat()
+                        entry = ManifestEntry(stat.st_size, stat.st_mtime_ns)
+                        previous = self.entries.get(name)
+                        entries[name] = (
+                            previous
+                            if previous is not None and previous.matches(entry)
+                            else entry
+                        )
+
+                        batch.append(path)
+                        if found_callback is not None and (
+                            len(batch) >= BATCH_SIZE or len(entries) == 1
+                        ):
+                            found_callback(batch)
+                            batch = []
+            except OSError as exception:
+                logging.warning("Could not list %s (%s).", directory, exception)
+
+        if found_callback is not None and batch:
+            found_callback(batch)
+        with self.lock:
+            self.folders = folders
+            self.entries = dict(sorted(entries.items(), key=lambda e: Path(e[0])))
+        return True
+
+    def is_up_to_date(self) -> bool:
+        """Loads the manifest and checks if its file list is still valid."""
+        if self.load() and not self.folders_changed():
+            logging.info("Using file list of %s.", self.path)
+            return True
+        with suppress(OSError):  # create it first, as it changes the folder mtime
+            self.path.parent.mkdir(exist_ok=True)
+        return False
+
+    def update_file_list(
+        self, found_callback: Optional[Callable[[List[Path]], None]] = None
+    ) -> bool:
+        """Enumerates the folder and saves the manifest, returns False if stopped."""
+        if not self.enumerate_folder(found_callback):
+            return False
+        self.save()
+        return True
+
+    def read_file_list(self) -> List[Path]:
+        """Returns all point cloud files, walking the folder only if it changed."""
+        if not self.is_up_to_date():
+            self.update_file_list()
+        return self.get_paths()
+
+    def get_paths(self) -> List[Path]:
+        with self.lock:
+            return [self.folder / name for name in self.entries]
+
+    def get_entry(self, path: Path) -> Optional[ManifestEntry]:
+        with self.lock:
+            return self.entries.get(self.get_relative_name(path))
+
+    # SCANNING
+
+    @staticmethod
+    def scan_file(path: Path) -> ManifestEntry:
+        entry = ManifestEntry.from_path(path)
+        entry.scanned = True
+        info = BasePointCloudHandler.get_handler(path.suffix).read_info(path)
+        if info is not None:
+            entry.point_count = info.point_count
+            entry.has_colors = info.has_colors
+            entry.mins, entry.maxs = info.mins, info.maxs
+        return entry
+
+    def scan_entry(self, name: str) -> None:
+        changed = False
+        try:
+            changed = not self.stopped.is_set() and self.update_entry(name)
+            if changed and self.scanned_callback is not None:
+                self.scanned_callback(name)
+        finally:
+            with self.lock:
+                self.remaining -= 1
+                self.changed_count += changed
+                save = self.changed_count > 0 and (
+                    self.remaining == 0
+                    or (changed and self.changed_count % SAVE_INTERVAL == 0)
+                )
+            if save:
+                self.save()
+
+    def update_entry(self, name: str) -> bool:
+        """Scans the file if it changed since the last scan, returns True if it did."""
+        path = self.folder / name
+        try:
+            current = ManifestEntry.from_path(path)
+            with self.lock:
+                entry = self.entries.get(name)
+            if entry is not None and entry.is_scanned and entry.matches(current):
+                return False
+            entry = self.scan_file(path)
+        except Exception as exception:
+            logging.warning("Could not scan %s for the manifest (%s).", name, exception)
+            return False
+
+        with self.lock:
+            if name not in self.entries:
+                return False  # file list was updated in the meantime
+            self.entries[name] = entry
+        return True
+
+    def start_scan(self, max_workers: int = 2) -> None:
+        """Scans missing and changed entries in the background."""
+        self.stopped.clear()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pcd-manifest"
+        )
+        with self.lock:
+            names = list(self.entries)
+            self.remaining = len(names)
+            self.changed_count = 0
+        for name in names:
+            self.executor.submit(self.scan_entry, name)
+
+    def stop(self) -> None:
+        """Skips all pending scans, the last finishing scan saves the manifest."""
+        self.stopped.set()
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
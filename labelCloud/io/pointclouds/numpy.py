@@ -5,24 +5,53 @@ from typing import TYPE_CHECKING, Tuple
 import numpy as np
 import numpy.typing as npt
 
-from . import BasePointCloudHandler
+from ...control.config_manager import config
+from . import BasePointCloudHandler, PointCloudInfo
 
 if TYPE_CHECKING:
     from ...model import PointCloud
 
 
+def drop_nan_points(points: npt.NDArray) -> npt.NDArray:
+    """Remove points with nan coordinates, only copying if there are any."""
+    # min() propagates nan without allocating a full-size boolean mask
+    if points.size == 0 or not np.isnan(points.min()):
+        return points
+    return points[~np.isnan(points).any(axis=1)]
+
+
 class NumpyHandler(BasePointCloudHandler):
     EXTENSIONS = {".bin"}
+    CACHE_DECODED = False
 
     def __init__(self) -> None:
         super().__init__()
 
+    @property
+    def memory_map(self) -> bool:
+        return config.getboolean("POINTCLOUD", "memory_map_binary", fallback=True)
+
     def read_point_cloud(self, path: Path) -> Tuple[npt.NDArray, None]:
-        """Read point cloud file as array and drop reflection and nan values."""
+        """Read point cloud file as array and drop reflection and nan values.
+
+        With `memory_map_binary` the file is memory-mapped and the returned points
+        are a strided read-only view on the xyz columns of the file.
+        """
         super().read_point_cloud(path)
-        points = np.fromfile(path, dtype=np.float32)
+        if path.stat().st_size == 0:  # np.memmap cannot map empty files
+            return (np.empty((0, 3), dtype=np.float32), None)
+        points: npt.NDArray[np.float32]
+        if self.memory_map:
+            points = np.memmap(path, dtype=np.float32, mode="r")
+        else:
+            points = np.fromfile(path, dtype=np.float32)
         points = points.reshape((-1, 4 if len(points) % 4 == 0 else 3))[:, 0:3]
-        return (points[~np.isnan(points).any(axis=1)], None)
+        return (drop_nan_points(points), None)
+
+    def read_info(self, path: Path) -> PointCloudInfo:
+        """Count the points from the file size (without dropping nan points)."""
+        values = path.stat().st_size // np.dtype(np.float32).itemsize
+        return PointCloudInfo(values // (4 if values % 4 == 0 else 3), False)
 
     def write_point_cloud(self, path: Path, pointcloud: "PointCloud") -> None:
         """Write point cloud points into binary file."""
@@ -30,4 +59,12 @@ class NumpyHandler(BasePointCloudHandler):
         logging.warning(
             "Only writing point coordinates, any previous reflection values will be dropped."
         )
-        pointcloud.points.tofile(path)
+        if pointcloud.origin.any():
+            logging.warning(
+                "Adding the origin back to the points, the coordinates lose precision as float32."
+            )
+        # Copy first, the points might be a memory-mapped view on the target file
+        points = np.array(
+            pointcloud.points + pointcloud.origin, dtype=np.float32, order="C"
+        )
+        points.tofile(path)
@@ -1,25 +1,29 @@
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Set, Tuple
 
 import numpy as np
 import numpy.typing as npt
-import open3d as o3d
 
+from ...utils.color import normalize_colors
 from . import BasePointCloudHandler
 
 if TYPE_CHECKING:
+    import open3d as o3d
+
     from ...model import PointCloud
 
 
 class Open3DHandler(BasePointCloudHandler):
-    EXTENSIONS = {".pcd", ".ply", ".pts", ".xyz", ".xyzn", ".xyzrgb"}
+    """Uses open3d, which is only imported on first usage as it is slow to load."""
+
+    EXTENSIONS: Set[str] = set()  # only used as fallback and for transformations
 
     def __init__(self) -> None:
         super().__init__()
 
     @staticmethod
     def to_point_cloud(
-        pointcloud: o3d.geometry.PointCloud,
+        pointcloud: "o3d.geometry.PointCloud",
     ) -> Tuple[npt.NDArray, Optional[npt.NDArray]]:
         return (
             np.asarray(pointcloud.points).astype("float32"),
@@ -27,19 +31,30 @@ class Open3DHandler(BasePointCloudHandler):
         )
 
     @staticmethod
-    def to_open3d_point_cloud(pointcloud: "PointCloud") -> o3d.geometry.PointCloud:
+    def to_open3d_point_cloud(pointcloud: "PointCloud") -> "o3d.geometry.PointCloud":
+        import open3d as o3d
+
         o3d_pointcloud = o3d.geometry.PointCloud(
             o3d.utility.Vector3dVector(pointcloud.points)
         )
-        o3d_pointcloud.colors = o3d.utility.Vector3dVector(pointcloud.colors)
+        if pointcloud.colors is not None:
+            o3d_pointcloud.colors = o3d.utility.Vector3dVector(
+                normalize_colors(pointcloud.colors)
+            )
         return o3d_pointcloud
 
     def read_point_cloud(self, path: Path) -> Tuple[npt.NDArray, Optional[npt.NDArray]]:
+        import open3d as o3d
+
         super().read_point_cloud(path)
         return self.to_point_cloud(
             o3d.io.read_point_cloud(str(path), remove_nan_points=True)
         )
 
     def write_point_cloud(self, path: Path, pointcloud: "PointCloud") -> None:
+        import open3d as o3d
+
         super().write_point_cloud(path, pointcloud)
-        o3d.io.write_point_cloud(str(path), self.to_open3d_point_cloud(pointcloud))
+        o3d_pointcloud = self.to_open3d_point_cloud(pointcloud)
+        o3d_pointcloud.translate(pointcloud.origin)
+        o3d.io.write_point_cloud(str(path), o3d_pointcloud)
@@ -0,0 +1,215 @@
+import logging
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ...utils.color import to_byte_colors
+from . import BasePointCloudHandler, PointCloudInfo
+
+if TYPE_CHECKING:
+    from ...model import PointCloud
+
+
+PCD_TYPES = {"F": "f", "I": "i", "U": "u"}
+COLOR_FIELDS = ("rgb", "rgba")
+
+
+def lzf_decompress(data: bytes, uncompressed_size: int) -> bytes:
+    """Decompress a LZF compressed buffer (as used by binary_compressed PCDs)."""
+    output = bytearray(uncompressed_size)
+    ip = op = 0
+    while ip < len(data):
+        ctrl = data[ip]
+        ip += 1
+        if ctrl < 32:  # literal run of ctrl + 1 bytes
+            output[op : op + ctrl + 1] = data[ip : ip + ctrl + 1]
+            ip += ctrl + 1
+            op += ctrl + 1
+            continue
+
+        length = ctrl >> 5  # back reference
+        if length == 7:
+            length += data[ip]
+            ip += 1
+        ref = op - ((ctrl & 0x1F) << 8) - data[ip] - 1
+        ip += 1
+        length += 2
+        if ref < 0 or op + length > uncompressed_size:
+            raise ValueError("Invalid back reference in LZF compressed data.")
+
+        if op - ref >= length:
+            output[op : op + length] = output[ref : ref + length]
+        else:  # overlapping reference repeats the last bytes
+            for i in range(length):
+                output[op + i] = output[ref + i]
+        op += length
+
+    if op != uncompressed_size:
+        raise ValueError(
+            f"LZF decompression yielded {op} instead of {uncompressed_size} bytes."
+        )
+    return bytes(output)
+
+
+class PcdHeader(object):
+    def __init__(self, fields: Dict[str, List[str]]) -> None:
+        self.fields = fields["FIELDS"]
+        self.sizes = [int(size) for size in fields["SIZE"]]
+        self.types = fields["TYPE"]
+        self.counts = [int(c) for c in fields.get("COUNT", ["1"] * len(self.fields))]
+        if "POINTS" in fields:
+            self.points = int(fields["POINTS"][0])
+        else:
+            self.points = int(fields["WIDTH"][0]) * int(fields["HEIGHT"][0])
+        self.data = fields["DATA"][0].lower()
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Structured dtype of one point record, unnamed padding fields are numbered."""
+        names = [name if name != "_" else f"_{i}" for i, name in enumerate(self.fields)]
+        formats = [
+            (
+                np.dtype(f"<{PCD_TYPES[pcd_type]}{size}"),
+                (count,) if count > 1 else (),
+            )
+            for pcd_type, size, count in zip(self.types, self.sizes, self.counts)
+        ]
+        return np.dtype(
+            [(name, fmt, shape) for name, (fmt, shape) in zip(names, formats)]
+        )
+
+
+class PcdHandler(BasePointCloudHandler):
+    EXTENSIONS = {".pcd"}
+
+    def __init__(self) -> None:
+        super().__init__()
+
+    @staticmethod
+    def read_header(stream) -> PcdHeader:
+        fields: Dict[str, List[str]] = {}
+        while "DATA" not in fields:
+            line = stream.readline()
+            if not line:
+                raise ValueError("PCD header is missing the DATA entry.")
+            line = line.decode("ascii").strip()
+            if not line or line.startswith("#"):
+                continue
+            key, *values = line.split()
+            fields[key.upper()] = values
+        return PcdHeader(fields)
+
+    @staticmethod
+    def read_records(stream, header: PcdHeader) -> np.ndarray:
+        dtype = header.dtype
+        if header.data == "ascii":
+            values = np.loadtxt(stream, dtype=np.float64, ndmin=2)
+            records = np.empty(len(values), dtype=dtype)
+            column = 0
+            for name, count in zip(dtype.names, header.counts):  # type: ignore
+                field_values = values[:, column : column + count]
+                records[name] = field_values if count > 1 else field_values[:, 0]
+                column += count
+            return records
+
+        if header.data == "binary":
+            buffer = stream.read(header.points * dtype.itemsize)
+            return np.frombuffer(buffer, dtype=dtype, count=header.points)
+
+        if header.data == "binary_compressed":
+            compressed_size, uncompressed_size = struct.unpack("<II", stream.read(8))
+            buffer = lzf_decompress(stream.read(compressed_size), uncompressed_size)
+            # Compressed data is stored field by field instead of point by point
+            records = np.empty(header.points, dtype=dtype)
+            offset = 0
+            for name in dtype.names:  # type: ignore
+                field_dtype = dtype.fields[name][0]  # type: ignore
+                records[name] = np.frombuffer(
+                    buffer, dtype=field_dtype, count=header.points, offset=offset
+                )
+                offset += field_dtype.itemsize * header.points
+            return records
+
+        raise ValueError(f"Unsupported PCD data format {header.data}.")
+
+    def read_info(self, path: Path) -> PointCloudInfo:
+        with path.open("rb") as stream:
+            header = self.read_header(stream)
+        has_colors = any(field in header.fields for field in COLOR_FIELDS)
+        return PointCloudInfo(header.points, has_colors)
+
+    @staticmethod
+    def get_colors(records: np.ndarray) -> Optional[npt.NDArray[np.float32]]:
+        for color_field in COLOR_FIELDS:
+            if color_field in records.dtype.names:
+                packed = np.ascontiguousarray(records[color_field])
+                if packed.dtype.kind == "f":
+                    packed = packed.astype(np.float32)
+                packed = packed.view(np.uint32)
+                rgb = np.stack(
+                    [(packed >> 16) & 0xFF, (packed >> 8) & 0xFF, packed & 0xFF],
+                    axis=1,
+                )
+                return rgb.astype(np.float32) / 255
+        return None
+
+    def read_point_cloud(self, path: Path) -> Tuple[npt.NDArray, Optional[npt.NDArray]]:
+        """Read points and packed rgb colors, other fields are dropped."""
+        super().read_point_cloud(path)
+        with path.open("rb") as stream:
+            header = self.read_header(stream)
+            records = self.read_records(stream, header)
+
+        points = np.empty((len(records), 3), dtype=np.float32)
+        for i, axis in enumerate("xyz"):
+            points[:, i] = records[axis]
+        colors = self.get_colors(records)
+
+        if np.isnan(points.min(initial=0)):
+            valid = ~np.isnan(points).any(axis=1)
+            points = points[valid]
+            colors = colors[valid] if colors is not None else None
+        return points, colors
+
+    def write_point_cloud(self, path: Path, pointcloud: "PointCloud") -> None:
+        """Write points and colors as binary PCD.
+
+        The origin of the point cloud is added again, as double if it is not zero.
+        """
+        super().write_point_cloud(path, pointcloud)
+        coordinate_format = "<f8" if pointcloud.origin.any() else "<f4"
+        fields = [(axis, coordinate_format) for axis in "xyz"]
+        if pointcloud.colors is not None:
+            fields.append(("rgb", "<u4"))
+
+        records = np.empty(len(pointcloud.points), dtype=fields)
+        for i, axis in enumerate("xyz"):
+            records[axis] = np.add(
+                pointcloud.points[:, i], pointcloud.origin[i], dtype=np.float64
+            )
+        if pointcloud.colors is not None:
+            rgb = to_byte_colors(pointcloud.colors).astype(np.uint32)
+            records["rgb"] = (rgb[:, 0] << 16) | (rgb[:, 1] << 8) | rgb[:, 2]
+
+        header = "\n".join(
+            [
+                "# .PCD v0.7 - Point Cloud Data file format",
+                "VERSION 0.7",
+                "FIELDS " + " ".join(name for name, _ in fields),
+                "SIZE " + " ".join(str(np.dtype(fmt).itemsize) for _, fmt in fields),
+                "TYPE " + " ".join("F" if fmt[1] == "f" else "U" for _, fmt in fields),
+                "COUNT " + " ".join("1" for _ in fields),
+                f"WIDTH {len(records)}",
+                "HEIGHT 1",
+                "VIEWPOINT 0 0 0 1 0 0 0",
+                f"POINTS {len(records)}",
+                "DATA binary",
+            ]
+        )
+        with path.open("wb") as stream:
+            stream.write((header + "\n").encode("ascii"))
+            stream.write(records.tobytes())
+        logging.info("Wrote %s points as binary PCD.", len(records))
@@ -0,0 +1,208 @@
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from ...utils.color import to_byte_colors
+from . import BasePointCloudHandler, PointCloudInfo
+from .open3d import Open3DHandler
+
+if TYPE_CHECKING:
+    from ...model import PointCloud
+
+
+PLY_TYPES = {
+    "char": "i1",
+    "uchar": "u1",
+    "short": "i2",
+    "ushort": "u2",
+    "int": "i4",
+    "uint": "u4",
+    "float": "f4",
+    "double": "f8",
+    "int8": "i1",
+    "uint8": "u1",
+    "int16": "i2",
+    "uint16": "u2",
+    "int32": "i4",
+    "uint32": "u4",
+    "float32": "f4",
+    "float64": "f8",
+}
+PLY_FORMATS = {"binary_little_endian": "<", "binary_big_endian": ">"}
+COLOR_PROPERTIES = [("red", "green", "blue"), ("r", "g", "b")]
+
+
+class PlyElement(object):
+    def __init__(self, name: str, count: int) -> None:
+        self.name = name
+        self.count = count
+        self.properties: List[Tuple[str, str]] = []  # (name, ply type)
+        self.has_list_property = False
+
+    def dtype(self, byte_order: str) -> np.dtype:
+        return np.dtype(
+            [
+                (name, byte_order + PLY_TYPES[ply_type])
+                for name, ply_type in self.properties
+            ]
+        )
+
+
+class PlyHeader(object):
+    def __init__(self, data_format: str, elements: List[PlyElement], size: int) -> None:
+        self.data_format = data_format
+        self.elements = elements
+        self.size = size  # in bytes, including "end_header"
+
+    @property
+    def byte_order(self) -> Optional[str]:
+        return PLY_FORMATS.get(self.data_format)
+
+    def get_vertex_offset(self) -> Optional[int]:
+        """Offset of the vertex data, None if it can not be computed without parsing."""
+        if self.byte_order is None:
+            return None
+        offset = self.size
+        for element in self.elements:
+            if element.has_list_property:
+                return None
+            if element.name == "vertex":
+                return offset
+            offset += element.count * element.dtype(self.byte_order).itemsize  # type: ignore
+        return None
+
+    @property
+    def vertex(self) -> PlyElement:
+        for element in self.elements:
+            if element.name == "vertex":
+                return element
+        raise ValueError("PLY file does not contain a vertex element.")
+
+
+class PlyHandler(BasePointCloudHandler):
+    EXTENSIONS = {".ply"}
+
+    def __init__(self) -> None:
+        super().__init__()
+
+    @staticmethod
+    def read_header(path: Path) -> PlyHeader:
+        elements: List[PlyElement] = []
+        data_format = ""
+        with path.open("rb") as stream:
+            if stream.readline().strip() != b"ply":
+                raise ValueError(f"{path} is not a PLY file.")
+            for line in iter(stream.readline, b""):
+                words = line.decode("ascii").split()
+                if not words or words[0] in ("comment", "obj_info"):
+                    continue
+                if words[0] == "format":
+                    data_format = words[1]
+                elif words[0] == "element":
+                    elements.append(PlyElement(words[1], int(words[2])))
+                elif words[0] == "property" and words[1] == "list":
+                    elements[-1].has_list_property = True
+                elif words[0] == "property":
+                    elements[-1].properties.append((words[2], words[1]))
+                elif words[0] == "end_header":
+                    return PlyHeader(data_format, elements, stream.tell())
+        raise ValueError(f"PLY header of {path} is missing `end_header`.")
+
+    def read_vertices(self, path: Path) -> Optional[np.ndarray]:
+        """Read all vertex properties into a structured array with a single read.
+
+        Returns None for PLY variants that can not be mapped onto a fixed dtype
+        (ascii files, list properties before or in the vertex element).
+        """
+        header = self.read_header(path)
+        offset = header.get_vertex_offset()
+        if offset is None:
+            return None
+        vertex = header.vertex
+        return np.fromfile(
+            path,
+            dtype=vertex.dtype(header.byte_order),  # type: ignore
+            count=vertex.count,
+            offset=offset,
+        )
+
+    def read_info(self, path: Path) -> PointCloudInfo:
+        vertex = self.read_header(path).vertex
+        names = [name for name, _ in vertex.properties]
+        has_colors = any(
+            all(name in names for name in color_properties)
+            for color_properties in COLOR_PROPERTIES
+        )
+        return PointCloudInfo(vertex.count, has_colors)
+
+    @staticmethod
+    def get_colors(vertices: np.ndarray) -> Optional[npt.NDArray]:
+        """Return byte colors as uint8 (see `normalize_colors`), others as float32."""
+        names = vertices.dtype.names
+        for color_properties in COLOR_PROPERTIES:
+            if all(name in names for name in color_properties):  # type: ignore
+                dtype = vertices.dtype[color_properties[0]]
+                colors = np.column_stack([vertices[name] for name in color_properties])
+                if dtype == np.uint8:
+                    return colors
+                float_colors = colors.astype(np.float32)
+                if dtype.kind == "u":
+                    float_colors /= np.iinfo(dtype).max
+                return float_colors
+        return None
+
+    def read_point_cloud(self, path: Path) -> Tuple[npt.NDArray, Optional[npt.NDArray]]:
+        super().read_point_cloud(path)
+        vertices = self.read_vertices(path)
+        if vertices is None:
+            logging.info("Falling back to open3d for reading %s.", path.name)
+            return Open3DHandler().read_point_cloud(path)
+
+        points = np.empty((len(vertices), 3), dtype=np.float32)
+        for i, axis in enumerate("xyz"):
+            points[:, i] = vertices[axis]
+        colors = self.get_colors(vertices)
+
+        if np.isnan(points.min(initial=0)):
+            valid = ~np.isnan(points).any(axis=1)
+            points = points[valid]
+            colors = colors[valid] if colors is not None else None
+        return points, colors
+
+    def write_point_cloud(self, path: Path, pointcloud: "PointCloud") -> None:
+        """Write points and colors as binary little endian PLY.
+
+        The origin of the point cloud is added again, as double if it is not zero.
+        """
+        super().write_point_cloud(path, pointcloud)
+        coordinate_type = "double" if pointcloud.origin.any() else "float"
+        properties = [(axis, coordinate_type) for axis in "xyz"]
+        if pointcloud.colors is not None:
+            properties += [("red", "uchar"), ("green", "uchar"), ("blue", "uchar")]
+        element = PlyElement("vertex", len(pointcloud.points))
+        element.properties = properties
+
+        vertices = np.empty(element.count, dtype=element.dtype("<"))
+        for i, axis in enumerate("xyz"):
+            vertices[axis] = np.add(
+                pointcloud.points[:, i], pointcloud.origin[i], dtype=np.float64
+            )
+        if pointcloud.colors is not None:
+            rgb = to_byte_colors(pointcloud.colors)
+            for i, name in enumerate(("red", "green", "blue")):
+                vertices[name] = rgb[:, i]
+
+        header = [
+            "ply",
+            "format binary_little_endian 1.0",
+            "comment Created by labelCloud",
+            f"element vertex {element.count}",
+            *[f"property {ply_type} {name}" for name, ply_type in properties],
+            "end_header",
+        ]
+        with path.open("wb") as stream:
+            stream.write(("\n".join(header) + "\n").encode("ascii"))
+            stream.write(vertices.tobytes())
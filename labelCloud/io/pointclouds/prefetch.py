@@ -0,0 +1,125 @@
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from .cache import read_point_cloud
+
+if TYPE_CHECKING:
+    from ...model.octree import Octree
+
+
+def get_modification_time(path: Path) -> int:
+    return path.stat().st_mtime_ns
+
+
+@dataclass
+class PrefetchedPointCloud:
+    points: npt.NDArray[np.float32]
+    colors: Optional[npt.NDArray]
+    octree: "Octree"  # chunks the points for drawing and picking
+
+
+class PointCloudPrefetcher(object):
+    """Decodes point cloud files on worker threads ahead of their usage.
+
+    The octree of the points is built on the worker as well, so that only the
+    upload of the vertices is left to the GUI thread. Decoded point clouds are kept
+    in a bounded LRU cache. Entries are
+    validated against the modification time of the file, so that rewritten point
+    clouds are decoded again.
+    """
+
+    def __init__(self, capacity: int, max_workers: int = 2) -> None:
+        self.capacity = capacity
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pcd-prefetch"
+        )
+        self.lock = threading.RLock()  # futures may call back while holding it
+        self.cache: "OrderedDict[Path, Tuple[int, PrefetchedPointCloud]]" = (
+            OrderedDict()
+        )
+        self.pending: Dict[Path, Tuple[int, Future]] = {}
+
+    @staticmethod
+    def decode(path: Path) -> PrefetchedPointCloud:
+        from ...model.octree import Octree  # the model imports the prefetcher
+
+        points, colors = read_point_cloud(path)
+        return PrefetchedPointCloud(points, colors, Octree.from_points(points))
+
+    def read_point_cloud(self, path: Path) -> PrefetchedPointCloud:
+        """Return the decoded file, waiting for a running prefetch."""
+        mtime = get_modification_time(path)
+        with self.lock:
+            cached = self.cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                self.cache.move_to_end(path)
+                logging.info("Using prefetched point cloud %s.", path.name)
+                return cached[1]
+            pending = self.pending.get(path)
+
+        if pending is not None and pending[0] == mtime and not pending[1].cancelled():
+            try:
+                data = pending[1].result()
+                logging.info("Waited for prefetch of point cloud %s.", path.name)
+                self._store(path, mtime, data)
+                return data
+            except Exception:
+                logging.exception("Prefetching %s failed, decoding again.", path)
+
+        data = self.decode(path)
+        self._store(path, mtime, data)
+        return data
+
+    def prefetch(self, paths: Iterable[Path]) -> None:
+        """Schedule decoding of the given files and cancel outdated requests."""
+        paths = list(paths)
+        with self.lock:
+            for path, (_, future) in list(self.pending.items()):
+                if path not in paths:
+                    future.cancel()  # removes itself from pending when cancelled
+
+            for path in paths:
+                try:
+                    mtime = get_modification_time(path)
+                except OSError:
+                    continue
+                cached = self.cache.get(path)
+                pending = self.pending.get(path)
+                if (cached is not None and cached[0] == mtime) or (
+                    pending is not None and pending[0] == mtime
+                ):
+                    continue
+                future = self.executor.submit(self.decode, path)
+                self.pending[path] = (mtime, future)
+                future.add_done_callback(partial(self._on_done, path, mtime))
+
+    def clear(self) -> None:
+        with self.lock:
+            for _, future in list(self.pending.values()):
+                future.cancel()
+            self.pending.clear()
+            self.cache.clear()
+
+    def _on_done(self, path: Path, mtime: int, future: Future) -> None:
+        with self.lock:
+            if self.pending.get(path, (None, None))[1] is future:
+                del self.pending[path]
+        if future.cancelled() or future.exception() is not None:
+            return
+        self._store(path, mtime, future.result())
+
+    def _store(self, path: Path, mtime: int, data: PrefetchedPointCloud) -> None:
+        with self.lock:
+            self.cache[path] = (mtime, data)
+            self.cache.move_to_end(path)
+            while len(self.cache) > self.capacity:
+                self.cache.popitem(last=False)
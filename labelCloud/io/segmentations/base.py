@@ -11,6 +11,12 @@ from ..labels.config import LabelConfig
 
 class BaseSegmentationHandler(object, metaclass=SingletonABCMeta):
     EXTENSIONS: Set[str] = set()  # should be set in subclasses
+    _registry: Dict[str, Type["BaseSegmentationHandler"]] = {}  # extension -> handler
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        for extension in cls.EXTENSIONS:
+            BaseSegmentationHandler._registry.setdefault(extension, cls)
 
     @property
     def default_label(self) -> int:
@@ -48,9 +54,8 @@ class BaseSegmentationHandler(object, metaclass=SingletonABCMeta):
 
     @classmethod
     def get_handler(cls, file_extension: str) -> Type["BaseSegmentationHandler"]:
-        for subclass in cls.__subclasses__():
-            if file_extension in subclass.EXTENSIONS:
-                return subclass
+        if file_extension in BaseSegmentationHandler._registry:
+            return BaseSegmentationHandler._registry[file_extension]
         raise NotImplementedError(
             f"{file_extension} is not supported for segmentation labels."
         )
@@ -7,14 +7,7 @@ import numpy.typing as npt
 import OpenGL.GL as GL
 
 from ..control.config_manager import config
-from ..definitions import (
-    BBOX_EDGES,
-    BBOX_SIDES,
-    Color3f,
-    Dimensions3D,
-    Point3D,
-    Rotations3D,
-)
+from ..definitions import BBOX_SIDES, Color3f, Dimensions3D, Point3D, Rotations3D
 from ..io.labels.config import LabelConfig
 from ..utils import math3d, oglhelper
 
@@ -70,6 +63,11 @@ class BBox(object):
     def get_classname(self) -> str:
         return self.classname
 
+    def get_color(self, highlighted: bool = False) -> Color3f:
+        if highlighted:
+            return self.HIGHLIGHTED_COLOR
+        return LabelConfig().get_class_color(self.classname)
+
     def get_vertices(self) -> npt.NDArray:
         rotated_vertices = math3d.rotate_bbox_around_center(
             self.get_axis_aligned_vertices(),
@@ -79,6 +77,7 @@ class BBox(object):
         return np.array(rotated_vertices)
 
     def get_axis_aligned_vertices(self) -> List[Point3D]:
+        self.set_axis_aligned_verticies()
         coords = []
         for vertex in self.verticies:  # Translate relative bbox to center
             coords.append(math3d.translate_point(vertex, *self.center))
@@ -157,25 +156,9 @@ class BBox(object):
             ]
         )
 
-    # Draw the BBox using verticies
-    def draw_bbox(self, highlighted: bool = False) -> None:
+    def draw_orientation(self, crossed_side: bool = True) -> None:
         self.set_axis_aligned_verticies()
 
-        GL.glPushMatrix()
-        bbox_color = LabelConfig().get_class_color(self.classname)
-        if highlighted:
-            bbox_color = self.HIGHLIGHTED_COLOR
-
-        vertices = self.get_vertices()
-        drawing_sequence = []
-        for edge in BBOX_EDGES:
-            for vertex_id in edge:
-                drawing_sequence.append(vertices[vertex_id])
-
-        oglhelper.draw_lines(drawing_sequence, color=Color3f.to_rgba(bbox_color))
-        GL.glPopMatrix()
-
-    def draw_orientation(self, crossed_side: bool = True) -> None:
         # Get object coordinates for arrow
         arrow_length = self.length * 0.4
         bp2 = [arrow_length, 0, 0]
@@ -188,7 +171,6 @@ class BBox(object):
         third_edge = [arrow_length * 0.8, 0, arrow_length * 0.3]
 
         GL.glPushMatrix()
-        GL.glLineWidth(5)
 
         # Apply translation and rotation
         GL.glTranslate(*self.get_center())
@@ -197,21 +179,15 @@ class BBox(object):
         GL.glRotate(self.get_y_rotation(), 0.0, 1.0, 0.0)
         GL.glRotate(self.get_x_rotation(), 1.0, 0.0, 0.0)
 
-        GL.glBegin(GL.GL_LINES)
-        GL.glVertex3fv([0, 0, 0])
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(first_edge)
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(second_edge)
-        GL.glVertex3fv(bp2)
-        GL.glVertex3fv(third_edge)
+        arrow = np.array(
+            [[0, 0, 0], bp2, bp2, first_edge, bp2, second_edge, bp2, third_edge]
+        )
         if crossed_side:
-            GL.glVertex3fv(self.verticies[BBOX_SIDES["right"][0]])
-            GL.glVertex3fv(self.verticies[BBOX_SIDES["right"][2]])
-            GL.glVertex3fv(self.verticies[BBOX_SIDES["right"][1]])
-            GL.glVertex3fv(self.verticies[BBOX_SIDES["right"][3]])
-        GL.glEnd()
+            side = [BBOX_SIDES["right"][i] for i in (0, 2, 1, 3)]
+            arrow = np.vstack([arrow, self.verticies[side]])
+        oglhelper.draw_lines(
+            arrow, color=Color3f.to_rgba(self.HIGHLIGHTED_COLOR), line_width=5
+        )
         GL.glLineWidth(1)
         GL.glPopMatrix()
 
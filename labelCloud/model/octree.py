@@ -0,0 +1,153 @@
+from typing import List, Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+MAX_DEPTH = 21  # bits per axis of the 63 bit Morton codes
+CHUNK_SIZE = 16384  # maximum number of points in an octree leaf (if not at max depth)
+
+
+def spread_bits(values: npt.NDArray[np.uint64]) -> npt.NDArray[np.uint64]:
+    """Insert two zero bits between each of the lower 21 bits."""
+    values = values & np.uint64(0x1FFFFF)
+    for shift, mask in [
+        (32, 0x1F00000000FFFF),
+        (16, 0x1F0000FF0000FF),
+        (8, 0x100F00F00F00F00F),
+        (4, 0x10C30C30C30C30C3),
+        (2, 0x1249249249249249),
+    ]:
+        values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+    return values
+
+
+def get_morton_codes(
+    points: npt.NDArray, mins: npt.NDArray, size: float
+) -> npt.NDArray[np.uint64]:
+    """Interleave the octree cell indices of the points (x as most significant bit)."""
+    cells = np.floor((points - mins) / size * (1 << MAX_DEPTH))
+    cells = np.clip(cells, 0, (1 << MAX_DEPTH) - 1).astype(np.uint64)
+    return (
+        (spread_bits(cells[:, 0]) << np.uint64(2))
+        | (spread_bits(cells[:, 1]) << np.uint64(1))
+        | spread_bits(cells[:, 2])
+    )
+
+
+def get_morton_order(
+    points: npt.NDArray,
+) -> Tuple[npt.NDArray[np.int32], npt.NDArray[np.uint64]]:
+    """Return the order sorting the points by Morton code and the sorted codes."""
+    mins = np.amin(points, axis=0)
+    size = max(float(np.amax(np.amax(points, axis=0) - mins)), 1e-6)
+    codes = get_morton_codes(points, mins, size)
+    order = np.argsort(codes).astype(np.int32)
+    return order, codes[order]
+
+
+def split_leaves(
+    codes: npt.NDArray[np.uint64], max_points: int
+) -> List[Tuple[int, int]]:
+    """Subdivide the sorted codes into ranges of octree leaves with few points."""
+    leaves = []
+    nodes = [(0, len(codes), 0)]  # start, end, depth
+    while nodes:
+        start, end, depth = nodes.pop()
+        if end - start <= max_points or depth == MAX_DEPTH:
+            leaves.append((start, end))
+            continue
+        shift = np.uint64(3 * (MAX_DEPTH - depth - 1))
+        prefix = (codes[start] >> shift) & ~np.uint64(7)
+        bounds = np.searchsorted(
+            codes[start:end],
+            [(prefix | np.uint64(child)) << shift for child in range(8)] + [codes[end - 1] + np.uint64(1)],  # type: ignore
+        )
+        for child in reversed(range(8)):  # keeps the leaves in Morton order
+            if bounds[child + 1] > bounds[child]:
+                nodes.append(
+                    (start + bounds[child], start + bounds[child + 1], depth + 1)
+                )
+    return leaves
+
+
+class Octree(object):
+    """Splits a point cloud into spatial chunks (octree leaves) of consecutive points.
+
+    `order` sorts the points by chunk; inside each chunk the points are shuffled (if
+    not disabled), so that the first points of every chunk are a random subset of it.
+    """
+
+    def __init__(
+        self,
+        order: npt.NDArray[np.int32],
+        starts: npt.NDArray[np.int32],
+        counts: npt.NDArray[np.int32],
+        mins: npt.NDArray[np.float32],
+        maxs: npt.NDArray[np.float32],
+    ) -> None:
+        self.order = order
+        self.starts = starts
+        self.counts = counts
+        self.mins = mins
+        self.maxs = maxs
+
+    @classmethod
+    def from_points(
+        cls,
+        points: npt.NDArray[np.float32],
+        max_points: int = CHUNK_SIZE,
+        seed=0,
+        shuffle: bool = True,
+    ) -> "Octree":
+        order, sorted_codes = get_morton_order(points)
+        leaves = split_leaves(sorted_codes, max_points)
+        del sorted_codes
+
+        if shuffle:
+            rng = np.random.default_rng(seed)
+            for start, end in leaves:
+                rng.shuffle(order[start:end])
+
+        starts = np.array([start for start, _ in leaves], dtype=np.int32)
+        counts = np.array([end - start for start, end in leaves], dtype=np.int32)
+        sorted_points = points[order]
+        return cls(
+            order,
+            starts,
+            counts,
+            np.minimum.reduceat(sorted_points, starts, axis=0),
+            np.maximum.reduceat(sorted_points, starts, axis=0),
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def get_visible_chunks(self, planes: npt.NDArray) -> npt.NDArray[np.bool_]:
+        """Check which chunk bounds are (partially) inside the frustum planes."""
+        normals = planes[:, np.newaxis, :3]
+        # Corner of each box that lies furthest in direction of the plane normal
+        corners = np.where(normals >= 0, self.maxs, self.mins)
+        distances = np.sum(corners * normals, axis=2) + planes[:, 3:]
+        return np.all(distances >= 0, axis=0)
+
+    def get_indices(self, selected: npt.NDArray[np.bool_]) -> npt.NDArray[np.int32]:
+        """Return the (sorted) point positions of the selected chunks."""
+        starts, counts = self.starts[selected], self.counts[selected]
+        offsets: npt.NDArray[np.int32] = np.repeat(
+            starts - np.cumsum(counts, dtype=np.int32) + counts, counts
+        )
+        return offsets + np.arange(counts.sum(), dtype=np.int32)
+
+    def get_draw_ranges(
+        self, visible: npt.NDArray[np.bool_], point_budget: int = 0
+    ) -> Tuple[npt.NDArray[np.int32], npt.NDArray[np.int32]]:
+        """Return first index and point count of the visible chunks.
+
+        With a `point_budget`, only a prefix of each chunk is drawn, so that the
+        visible chunks together contain about `point_budget` points.
+        """
+        starts, counts = self.starts[visible], self.counts[visible]
+        total = counts.sum()
+        if 0 < point_budget < total:
+            counts = np.ceil(counts * (point_budget / total)).astype(np.int32)
+        return starts, counts
@@ -1,7 +1,9 @@
 import ctypes
 import logging
+import time
+import weakref
 from pathlib import Path
-from typing import List, Optional, Tuple, cast
+from typing import Hashable, List, Optional, Tuple
 
 import numpy as np
 import numpy.typing as npt
@@ -11,15 +13,62 @@ from PyQt5.QtWidgets import QMessageBox
 from labelCloud.io.labels.config import LabelConfig
 
 from ..control.config_manager import config
-from ..definitions import LabelingMode, Point3D, Rotations3D, Translation3D
+from ..definitions import (
+    Color3f,
+    LabelingMode,
+    Point3D,
+    Rotations3D,
+    Translation3D,
+)
 from ..io.pointclouds import BasePointCloudHandler
+from ..io.pointclouds.cache import read_point_cloud
+from ..io.pointclouds.prefetch import PointCloudPrefetcher
 from ..io.segmentations import BaseSegmentationHandler
-from ..utils.color import colorize_points_with_height
+from ..utils import math3d
+from ..utils.buffer_pool import BufferPool
+from ..utils.color import (
+    colorize_points_with_height,
+    normalize_colors,
+    to_byte_colors,
+)
 from ..utils.logger import end_section, green, print_column, red, start_section, yellow
+from ..utils.shaders import PALETTE_SIZE, LabelShader
 from . import Perspective
+from .octree import Octree
+from .point_picker import PointPicker
 
-# Get size of float (4 bytes) for VBOs
-SIZE_OF_FLOAT = ctypes.sizeof(ctypes.c_float)
+
+def get_vertex_format(quantized: bool, colored: bool = True) -> np.dtype:
+    """Interleaved vertex layout, colors are normalized by OpenGL."""
+    fields: List[tuple] = [("color", np.uint8, 4)] if colored else []
+    if quantized:
+        fields += [("position", np.int16, 3), ("padding", np.int16)]
+    else:
+        fields.append(("position", np.float32, 3))
+    return np.dtype(fields)
+
+
+VERTEX = get_vertex_format(quantized=False)
+QUANTIZED_VERTEX = get_vertex_format(quantized=True)
+QUANTIZED_MAX = np.iinfo(np.int16).max
+UPLOAD_CHUNK_SIZE = 2**16  # number of vertices uploaded with one `glBufferSubData`
+UPLOAD_TIME_BUDGET = 0.02  # seconds per frame spent on uploading vertices
+
+
+def to_color_bytes(colors: npt.NDArray) -> npt.NDArray[np.uint8]:
+    """Convert rgb colors (float or byte, see `normalize_colors`) to opaque rgba bytes."""
+    rgba = np.full((len(colors), 4), 255, dtype=np.uint8)
+    rgba[:, :3] = to_byte_colors(colors)
+    return rgba
+
+
+def get_label_palette() -> npt.NDArray[np.float32]:
+    """Colors of the classes, indexed by class id (see `LabelShader`)."""
+    palette = np.zeros((PALETTE_SIZE, 3), dtype=np.float32)
+    for label_class in LabelConfig().classes:
+        if 0 <= label_class.id < PALETTE_SIZE:
+            palette[label_class.id] = label_class.color[:3]
+    return palette
 
 
 def calculate_init_translation(
@@ -52,12 +101,20 @@ class PointCloud(object):
         segmentation_labels: Optional[npt.NDArray[np.int8]] = None,
         init_translation: Optional[Tuple[float, float, float]] = None,
         init_rotation: Optional[Tuple[float, float, float]] = None,
-        write_buffer: bool = True,
+        origin: Optional[npt.NDArray[np.float64]] = None,
+        point_stride: int = 1,
+        octree: Optional[Octree] = None,
     ) -> None:
+        if len(points) == 0:
+            raise ValueError(f"The point cloud {path.name} contains no points.")
         start_section(f"Loading {path.name}")
         self.path = path
         self.points = points
+        # Offset of the points in the file, which is added again when writing
+        self.origin = np.zeros(3) if origin is None else origin
+        self.point_stride = point_stride  # only every n-th point of the file is read
         self.colors = colors if type(colors) == np.ndarray and len(colors) > 0 else None
+        self.constant_color: Optional[Color3f] = None  # of colorless point clouds
 
         self.labels = None
         if LabelConfig().type == LabelingMode.SEMANTIC_SEGMENTATION:
@@ -65,7 +122,18 @@ class PointCloud(object):
             self.validate_segmentation_label()
             self.mix_ratio = config.getfloat("POINTCLOUD", "label_color_mix_ratio")
 
-        self.vbo = None
+        # GPU buffers with the vertices and labels in render order
+        self.buffer_pool: Optional[BufferPool] = None
+        self.vertex_vbo: Optional[int] = None
+        self.label_vbo: Optional[int] = None
+        self.blend_labels = False  # label buffer holds colors blended on the CPU
+        self.uploaded_count = 0  # vertices in the buffer (in render order)
+        self.label_version = 0  # incremented with each update of the label buffer
+        # Spatial chunks of the points in the GPU buffers (for culling and LOD)
+        self.octree: Optional[Octree] = None
+        self.picker: Optional[PointPicker] = None  # finds the points under the cursor
+        if octree is not None:  # built by the prefetcher
+            self.set_octree(octree)
         self.center: Point3D = tuple(np.sum(points[:, i]) / len(points) for i in range(3))  # type: ignore
         self.pcd_mins: npt.NDArray[np.float32] = np.amin(points, axis=0)
         self.pcd_maxs: npt.NDArray[np.float32] = np.amax(points, axis=0)
@@ -88,18 +156,10 @@ class PointCloud(object):
                     "Generated colors for colorless point cloud based on height."
                 )
             else:
-                colorless_color = np.array(
-                    config.getlist("POINTCLOUD", "COLORLESS_COLOR")
-                )
-                self.colors = (np.ones_like(self.points) * colorless_color).astype(
-                    np.float32
+                self.constant_color = Color3f(
+                    *config.getlist("POINTCLOUD", "COLORLESS_COLOR")
                 )
-                logging.info(
-                    "Generated colors for colorless point cloud based on `colorless_color`."
-                )
-        if write_buffer:
-            self.create_buffers()
-
+                logging.info("Using `colorless_color` for colorless point cloud.")
         logging.info(green(f"Successfully loaded point cloud from {path}!"))
         self.print_details()
         end_section()
@@ -108,32 +168,149 @@ class PointCloud(object):
     def point_size(self) -> float:
         return config.getfloat("POINTCLOUD", "point_size")
 
-    def create_buffers(self) -> None:
-        """Create 3 different buffers holding points, colors and label colors information"""
-        self.colors = cast(npt.NDArray[np.float32], self.colors)
-        (
-            self.position_vbo,
-            self.color_vbo,
-            self.label_vbo,
-        ) = GL.glGenBuffers(3)
-        for data, vbo in [
-            (self.points, self.position_vbo),
-            (self.colors, self.color_vbo),
-            (self.label_colors, self.label_vbo),
-        ]:
-            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, vbo)
-            GL.glBufferData(GL.GL_ARRAY_BUFFER, data.nbytes, data, GL.GL_DYNAMIC_DRAW)
-            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+    @property
+    def point_budget(self) -> int:
+        return config.getint("POINTCLOUD", "point_budget", fallback=2000000)
+
+    def in_render_order(self, data: np.ndarray) -> np.ndarray:
+        """Sort per point data by octree chunk, as it is stored in the GPU buffers."""
+        assert self.octree is not None
+        return data[self.octree.order]
 
     @property
-    def label_colors(self) -> npt.NDArray[np.float32]:
-        """blend the points with label color map"""
-        self.colors = cast(npt.NDArray[np.float32], self.colors)
-        if self.labels is not None:
-            colors = LabelConfig().color_map[LabelConfig().class_order[self.labels]]
-            return colors * self.mix_ratio + self.colors * (1 - self.mix_ratio)
+    def quantize_positions(self) -> bool:
+        return config.getboolean("POINTCLOUD", "quantize_positions", fallback=False)
+
+    def get_vertex_format(self) -> np.dtype:
+        """Colors are only stored per vertex if the point cloud has colors."""
+        return get_vertex_format(self.quantize_positions, self.colors is not None)
+
+    def get_vertices(self, start: int = 0, end: Optional[int] = None) -> np.ndarray:
+        """Interleave positions and colors in render order (from `start` to `end`).
+
+        Quantized positions are stored as 16 bit integers relative to the bounds and
+        scaled back with `position_offset` and `position_scale` while drawing.
+        """
+        assert self.octree is not None
+        order = self.octree.order[start:end]
+        points = self.points[order]
+        self.vertex_format = self.get_vertex_format()
+        vertices = np.zeros(len(points), dtype=self.vertex_format)
+        if self.quantize_positions:
+            self.position_offset = (self.pcd_maxs + self.pcd_mins) / 2
+            self.position_scale = (
+                np.maximum((self.pcd_maxs - self.pcd_mins) / 2, 1e-6) / QUANTIZED_MAX
+            )
+            vertices["position"] = np.clip(
+                np.rint((points - self.position_offset) / self.position_scale),
+                -QUANTIZED_MAX,
+                QUANTIZED_MAX,
+            )
         else:
-            return self.colors
+            self.position_offset = np.zeros(3)
+            self.position_scale = np.ones(3)
+            vertices["position"] = points
+        if self.colors is not None:
+            vertices["color"] = to_color_bytes(self.colors[order])
+        return vertices
+
+    def create_buffers(self, buffer_pool: BufferPool) -> None:
+        """Allocate pooled buffers for interleaved points and colors, and int8 labels.
+
+        The vertices are uploaded progressively by `upload_vertices`, the labels only
+        if they are needed (see `update_label_buffer`).
+        """
+        if self.octree is None:
+            self.set_octree(Octree.from_points(self.points))
+        self.buffer_pool = buffer_pool
+        self.vertex_format = self.get_vertex_format()
+        self.vertex_vbo = buffer_pool.acquire(
+            len(self.points) * self.vertex_format.itemsize
+        )
+        self.uploaded_count = 0
+        self.update_label_buffer()
+
+    def get_label_data(self, order: npt.NDArray[np.int32]) -> np.ndarray:
+        """Return the int8 labels of the points in `order` for the `LabelShader`.
+
+        With `blend_labels`, the point colors blended with their class colors are
+        returned instead (as rgba bytes).
+        """
+        assert self.labels is not None
+        labels = self.labels[order]
+        if not self.blend_labels:
+            return labels.astype(np.int8)
+        if self.colors is not None:
+            colors = normalize_colors(self.colors[order])
+        else:
+            colors = np.array([self.constant_color], dtype=np.float32)
+        label_colors = get_label_palette()[np.clip(labels, 0, PALETTE_SIZE - 1)]
+        return to_color_bytes(
+            label_colors * self.mix_ratio + colors * (1 - self.mix_ratio)
+        )
+
+    def update_label_buffer(self, blend_labels: Optional[bool] = None) -> None:
+        """Keep a label buffer only while segmented points are colored by label.
+
+        :param blend_labels: store blended colors instead of labels, if the
+            `LabelShader` is not available (default: as before)
+        """
+        assert self.buffer_pool is not None and self.octree is not None
+        required = self.has_label and self.color_with_label
+        outdated = blend_labels is not None and blend_labels != self.blend_labels
+        if self.label_vbo is not None and (outdated or not required):
+            self.buffer_pool.release(self.label_vbo)
+            self.buffer_pool.delete_free()
+            self.label_vbo = None
+        if blend_labels is not None:
+            self.blend_labels = blend_labels
+        if required and self.label_vbo is None:
+            data = self.get_label_data(self.octree.order)
+            self.label_vbo = self.buffer_pool.acquire(data.nbytes, data)
+
+    @property
+    def is_uploaded(self) -> bool:
+        return self.uploaded_count == len(self.points)
+
+    def upload_vertices(self, time_budget: float = UPLOAD_TIME_BUDGET) -> None:
+        """Upload the next chunks of vertices until the time budget is used up.
+
+        Very large point clouds are thereby shown while they are still uploading,
+        instead of blocking the first frame.
+        """
+        assert self.vertex_vbo is not None
+        start_time = time.perf_counter()
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vertex_vbo)
+        while not self.is_uploaded:
+            start = self.uploaded_count
+            vertices = self.get_vertices(start, start + UPLOAD_CHUNK_SIZE)
+            GL.glBufferSubData(
+                GL.GL_ARRAY_BUFFER,
+                start * vertices.itemsize,
+                vertices.nbytes,
+                vertices,
+            )
+            self.uploaded_count += len(vertices)
+            if time.perf_counter() - start_time >= time_budget:
+                break
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        if self.is_uploaded:
+            logging.info("Finished uploading %s vertices.", len(self.points))
+
+    def release_buffers(self) -> None:
+        """Return the buffers to the pool, so that the next point cloud can reuse them."""
+        if self.buffer_pool is not None:
+            for vbo in (self.vertex_vbo, self.label_vbo):
+                if vbo is not None:
+                    self.buffer_pool.release(vbo)
+        self.buffer_pool = self.vertex_vbo = self.label_vbo = None
+        self.uploaded_count = 0
+
+    def set_octree(self, octree: Octree) -> None:
+        """Chunk the points for drawing, the picker searches the same chunks."""
+        self.octree = octree
+        self.picker = PointPicker(self.points, octree)
+        logging.info("Split point cloud into %s chunks.", len(self.octree))
 
     def save_segmentation_labels(self, extension=".bin") -> None:
         label_path = (
@@ -153,19 +330,29 @@ class PointCloud(object):
         cls,
         path: Path,
         perspective: Optional[Perspective] = None,
-        write_buffer: bool = True,
+        prefetcher: Optional[PointCloudPrefetcher] = None,
     ) -> "PointCloud":
         init_translation, init_rotation = (None, None)
         if perspective:
             init_translation = perspective.translation
             init_rotation = perspective.rotation
 
-        points, colors = BasePointCloudHandler.get_handler(
-            path.suffix
-        ).read_point_cloud(path=path)
+        octree = None
+        if prefetcher is not None:
+            prefetched = prefetcher.read_point_cloud(path)
+            points, colors = prefetched.points, prefetched.colors
+            octree = prefetched.octree
+        else:
+            points, colors = read_point_cloud(path)
+        handler = BasePointCloudHandler.get_handler(path.suffix)
 
         labels = None
         if LabelConfig().type == LabelingMode.SEMANTIC_SEGMENTATION:
+            if handler.stride > 1:
+                raise ValueError(
+                    f"Segmentation labels of {path.name} do not match its decimated "
+                    "points, set `las_point_stride` to 1 for semantic segmentation."
+                )
             label_path = (
                 config.getpath("FILE", "segmentation_folder") / f"{path.stem}.bin"
             )
@@ -182,7 +369,9 @@ class PointCloud(object):
             labels,
             init_translation,
             init_rotation,
-            write_buffer,
+            handler.get_origin(path),
+            handler.stride,
+            octree,
         )
 
     def validate_segmentation_label(self) -> None:
@@ -214,7 +403,16 @@ class PointCloud(object):
         labels_to_replace = list(unique_label_ids.difference(unique_class_ids))
         self.labels[np.isin(self.labels, labels_to_replace)] = LabelConfig().default
 
+    @property
+    def is_decimated(self) -> bool:
+        return self.point_stride > 1
+
     def to_file(self, path: Optional[Path] = None) -> None:
+        if self.is_decimated:
+            raise ValueError(
+                "Decimated point clouds cannot be written, as points would be lost "
+                "(set `las_point_stride` to 1)."
+            )
         if not path:
             path = self.path
         BasePointCloudHandler.get_handler(path.suffix).write_point_cloud(
@@ -236,32 +434,33 @@ class PointCloud(object):
     def update_selected_points_in_label_vbo(
         self, points_inside: npt.NDArray[np.bool_]
     ) -> None:
-        """Send the selected updated label colors to label vbo. This function
-        assumes the `self.label_colors[points_inside]` have been altered.
-        This function only partially updates the label vbo to minimise the
-        data sent to gpu. It leverages `glBufferSubData` method to perform
-        partial update and `consecutive` method to find consecutive indexes
-        so they can be updated in one single `glBufferSubData` call.
+        """Send the updated labels of the selected points to the label vbo.
+
+        Only one byte per changed point is sent to the GPU, where the labels are
+        colored by the `LabelShader` (or the blended colors without it, see
+        `get_label_data`). Consecutive points (see `consecutive`) are updated
+        together in one `glBufferSubData` call.
         """
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.label_vbo)
-        inside_idx = np.where(points_inside)[0]
+        assert self.labels is not None and self.octree is not None
+        if self.label_vbo is None:
+            return  # written with all labels, once the buffer is needed
+        inside_idx = np.where(self.in_render_order(points_inside))[0]
         if inside_idx.shape[0] == 0:
             logging.warning("No points are found inside the selected boxes.")
             return
-        logging.debug(f"Update {len(inside_idx)} point colors in label VBO.")
-        # find contiguous points so they can be updated together in one glBufferSubData call
-        arrays = consecutive(inside_idx)
-        label_color = self.label_colors
-        stride = label_color.shape[1] * SIZE_OF_FLOAT
-        for arr in arrays:
-            colors: npt.NDArray[np.float32] = label_color[arr]
+        logging.debug(f"Update {len(inside_idx)} point labels in label VBO.")
+        self.label_version += 1
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.label_vbo)
+        for arr in consecutive(inside_idx):
+            data = self.get_label_data(self.octree.order[arr])
             # partially update label_vbo from positions arr[0] to arr[-1]
             GL.glBufferSubData(
                 GL.GL_ARRAY_BUFFER,
-                offset=arr[0] * stride,
-                size=colors.nbytes,
-                data=colors,
+                offset=arr[0] * data.nbytes // len(arr),
+                size=data.nbytes,
+                data=data,
             )
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
 
     # GETTERS AND SETTERS
     def get_no_of_points(self) -> int:
@@ -310,46 +509,117 @@ class PointCloud(object):
         self.trans_y = y
         self.trans_z = z
 
-    def set_gl_background(self) -> None:
-        GL.glTranslate(
-            self.trans_x, self.trans_y, self.trans_z
-        )  # third, pcd translation
+    def get_model_matrix(self) -> npt.NDArray:
+        """Transformation (row-major) of the point cloud by its rotation and translation.
 
+        The point cloud is rotated around the center of its bounds and then moved.
+        """
         pcd_center = np.add(
             self.pcd_mins, (np.subtract(self.pcd_maxs, self.pcd_mins) / 2)
         )
-        GL.glTranslate(*pcd_center)  # move point cloud back
-
-        GL.glRotate(self.rot_x, 1.0, 0.0, 0.0)
-        GL.glRotate(self.rot_y, 0.0, 1.0, 0.0)  # second, pcd rotation
-        GL.glRotate(self.rot_z, 0.0, 0.0, 1.0)
+        rotation = np.identity(4)  # around x, y and z axis (same as glRotate calls)
+        rotation[:3, :3] = (
+            math3d.rotate_around_x(np.identity(3), self.rot_x, degrees=True)
+            @ math3d.rotate_around_y(np.identity(3), self.rot_y, degrees=True)
+            @ math3d.rotate_around_z(np.identity(3), self.rot_z, degrees=True)
+        )
+        return (
+            math3d.get_translation_matrix(self.get_translation())
+            @ math3d.get_translation_matrix(pcd_center)
+            @ rotation
+            @ math3d.get_translation_matrix(-pcd_center)
+        )
 
-        GL.glTranslate(*(pcd_center * -1))  # move point cloud to center for rotation
-        GL.glPointSize(self.point_size)
+    def get_draw_state(self, decimated: bool = False) -> Hashable:
+        """Everything apart from the camera that changes how the points are drawn."""
+        return (
+            weakref.ref(self),
+            self.uploaded_count,
+            self.label_version,
+            self.point_size,
+            self.color_with_label and get_label_palette().tobytes(),
+            decimated and self.point_budget,
+        )
 
-    def draw_pointcloud(self) -> None:
-        self.set_gl_background()
-        stride = 3 * SIZE_OF_FLOAT
+    def draw_pointcloud(
+        self,
+        decimated: bool = False,
+        frustum_planes: Optional[npt.NDArray] = None,
+        label_shader: Optional[LabelShader] = None,
+        clip_planes: Optional[npt.NDArray] = None,
+    ) -> None:
+        """Draw the chunks inside the frustum planes (see `get_model_matrix`).
 
-        # Bind position buffer
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.position_vbo)
+        If `decimated`, only a subset limited by the point budget is drawn. Points
+        with segmentation labels are colored by the `label_shader`. Points outside of
+        the `clip_planes` (point cloud coordinates) are clipped by OpenGL.
+        """
+        assert self.octree is not None
+        if self.vertex_vbo is None:
+            return  # buffers were released
+        if clip_planes is None:
+            clip_planes = np.empty((0, 4))
+        # Set while the modelview matrix maps point cloud coordinates
+        for i, plane in enumerate(clip_planes):
+            GL.glClipPlane(GL.GL_CLIP_PLANE0 + i, plane.astype(np.float64))
+            GL.glEnable(GL.GL_CLIP_PLANE0 + i)
+        GL.glPointSize(self.point_size)
+        GL.glPushMatrix()
+        GL.glTranslate(*self.position_offset)  # undo the position quantization
+        GL.glScale(*self.position_scale)
+
+        # Bind interleaved vertex buffer
+        stride = self.vertex_format.itemsize
+        fields = self.vertex_format.fields
+        assert fields is not None  # structured dtype, see `get_vertex_format`
+        position_type: np.dtype = fields["position"][0]
+        position_offset: int = fields["position"][1]
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vertex_vbo)
         GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
-        GL.glVertexPointer(3, GL.GL_FLOAT, stride, None)
-
-        # Bind color buffer
-        if self.color_with_label:
-            color_vbo = self.label_vbo
-        else:
-            color_vbo = self.color_vbo
-        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, color_vbo)
-        GL.glEnableClientState(GL.GL_COLOR_ARRAY)
-        GL.glColorPointer(3, GL.GL_FLOAT, stride, None)
-        GL.glDrawArrays(GL.GL_POINTS, 0, self.get_no_of_points())  # Draw the points
+        GL.glVertexPointer(
+            3,
+            GL.GL_SHORT if position_type.base == np.int16 else GL.GL_FLOAT,
+            stride,
+            ctypes.c_void_p(position_offset),
+        )
+        if self.constant_color is None:
+            GL.glEnableClientState(GL.GL_COLOR_ARRAY)
+            GL.glColorPointer(4, GL.GL_UNSIGNED_BYTE, stride, None)
+        else:  # same color for all points
+            GL.glColor3f(*self.constant_color)
+        blend_labels = label_shader is None or not label_shader.is_available
+        self.update_label_buffer(blend_labels)
+        use_label_shader = self.label_vbo is not None and not blend_labels
+        if use_label_shader:
+            label_shader.bind(self.label_vbo, get_label_palette(), self.mix_ratio)  # type: ignore
+        elif self.label_vbo is not None:  # colors were blended on the CPU
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.label_vbo)
+            GL.glEnableClientState(GL.GL_COLOR_ARRAY)
+            GL.glColorPointer(4, GL.GL_UNSIGNED_BYTE, 0, None)
+
+        # Draw the points of all visible chunks in one call
+        visible = np.ones(len(self.octree), dtype=np.bool_)
+        if frustum_planes is not None:
+            visible = self.octree.get_visible_chunks(frustum_planes)
+        if len(clip_planes):
+            visible &= self.octree.get_visible_chunks(clip_planes)
+        firsts, counts = self.octree.get_draw_ranges(
+            visible, self.point_budget if decimated else 0
+        )
+        if not self.is_uploaded:  # only draw the vertices that are uploaded already
+            counts = np.clip(self.uploaded_count - firsts, 0, counts).astype(np.int32)
+        if len(firsts):
+            GL.glMultiDrawArrays(GL.GL_POINTS, firsts, counts, len(firsts))
 
+        if use_label_shader:
+            label_shader.release()  # type: ignore
         GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
         GL.glDisableClientState(GL.GL_COLOR_ARRAY)
         # Release the buffer binding
         GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        GL.glPopMatrix()
+        for i in range(len(clip_planes)):
+            GL.glDisable(GL.GL_CLIP_PLANE0 + i)
 
     def reset_perspective(self) -> None:
         self.trans_x, self.trans_y, self.trans_z = self.init_rotation
@@ -359,11 +629,10 @@ class PointCloud(object):
         self, indicies: npt.NDArray[np.bool_]
     ) -> Optional["PointCloud"]:
         assert self.points is not None
-        assert self.colors is not None
         points = self.points[indicies]
         if points.shape[0] == 0:
             return None
-        colors = self.colors[indicies]
+        colors = self.colors[indicies] if self.colors is not None else None
         labels = self.labels[indicies] if self.labels is not None else None
         path = self.path.parent / (self.path.stem + "_cropped" + self.path.suffix)
         return PointCloud(
@@ -371,7 +640,8 @@ class PointCloud(object):
             points=points,
             colors=colors,
             segmentation_labels=labels,
-            write_buffer=False,
+            origin=self.origin,
+            point_stride=self.point_stride,
         )
 
     def print_details(self) -> None:
@@ -0,0 +1,81 @@
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from ..utils import math3d
+from .octree import Octree
+
+
+class PointPicker(object):
+    """Finds the points around a cursor position without reading the depth buffer.
+
+    The points are indexed by the octree that chunks them for drawing. Only the points
+    of leaves that intersect the cone around the cursor ray are projected into the
+    window.
+    """
+
+    def __init__(
+        self, points: npt.NDArray[np.float32], octree: Optional[Octree] = None
+    ) -> None:
+        if octree is None:
+            octree = Octree.from_points(points)
+        self.octree = octree
+        self.points = points  # read through the octree order, not copied
+
+    def get_cone_chunks(
+        self, origin: npt.NDArray, direction: npt.NDArray, spread: float
+    ) -> npt.NDArray[np.bool_]:
+        """Check which chunks (partially) lie inside the cone around the ray.
+
+        :param origin: start of the ray
+        :param direction: normalized direction of the ray
+        :param spread: radius of the cone per unit of distance from the origin
+        """
+        mins, maxs = self.octree.mins, self.octree.maxs
+        # Widen each box by the cone radius at its furthest possible distance
+        far_distances = np.linalg.norm((mins + maxs) / 2 - origin, axis=1)
+        far_distances += np.linalg.norm(maxs - mins, axis=1) / 2
+        margins = (far_distances * spread)[:, np.newaxis]
+
+        with np.errstate(divide="ignore", invalid="ignore"):  # slab test
+            lower = (mins - margins - origin) / direction
+            upper = (maxs + margins - origin) / direction
+        enter = np.nanmax(np.minimum(lower, upper), axis=1)
+        leave = np.nanmin(np.maximum(lower, upper), axis=1)
+        return (enter <= leave) & (leave >= 0)
+
+    def get_window_coords(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        modelview: npt.ArrayLike,
+        projection: npt.ArrayLike,
+        viewport: npt.ArrayLike,
+        clip_planes: Optional[npt.NDArray] = None,
+    ) -> npt.NDArray:
+        """Return window x, y and depth of the points within `radius` pixels of x, y.
+
+        :param x: window x coordinate (rightward)
+        :param y: window y coordinate (upward, as in OpenGL)
+        :param clip_planes: ignore the points outside of these planes (a, b, c, d)
+        """
+        near = np.array(
+            math3d.unproject_point(x, y, 0, modelview, projection, viewport)
+        )
+        far = np.array(math3d.unproject_point(x, y, 1, modelview, projection, viewport))
+        direction = (far - near) / np.linalg.norm(far - near)
+        # Pixel size per distance of a perspective projection (focal length in pixels)
+        spread = radius * 2 / (np.asarray(projection)[1][1] * np.asarray(viewport)[3])
+
+        chunks = self.get_cone_chunks(near, direction, spread)
+        if clip_planes is not None and len(clip_planes):
+            chunks &= self.octree.get_visible_chunks(clip_planes)
+        points = self.points[self.octree.order[self.octree.get_indices(chunks)]]
+        if clip_planes is not None and len(clip_planes):
+            points = points[math3d.get_points_inside_planes(points, clip_planes)]
+        window_coords = math3d.project_points(points, modelview, projection, viewport)
+        distances = np.hypot(window_coords[:, 0] - x, window_coords[:, 1] - y)
+        visible = (window_coords[:, 2] >= 0) & (window_coords[:, 2] <= 1)
+        return window_coords[visible & (distances <= radius)]
@@ -0,0 +1,86 @@
+from pathlib import Path
+from types import SimpleNamespace
+from typing import List
+
+import numpy as np
+import pytest
+
+from labelCloud.io.pointclouds import AsciiHandler, BasePointCloudHandler, PlyHandler
+from labelCloud.io.pointclouds import ascii
+from labelCloud.utils.color import normalize_colors
+
+
+@pytest.fixture
+def handler() -> AsciiHandler:
+    return AsciiHandler()
+
+
+@pytest.mark.parametrize("extension", [".pts", ".xyz", ".xyzn", ".xyzrgb"])
+def test_get_handler(extension: str) -> None:
+    assert isinstance(BasePointCloudHandler.get_handler(extension), AsciiHandler)
+
+
+def test_chunk_boundaries(tmppath: Path) -> None:
+    path = tmppath / "foo.xyz"
+    path.write_text("1 2 3\n4 5 6\n7 8 9\n")
+    assert ascii.get_chunk_boundaries(path, 0, 4) == [0, 6, 12, 18]
+    assert ascii.get_chunk_boundaries(path, 6, 100) == [6, 18]
+
+
+def test_read_in_chunks(
+    handler: AsciiHandler, tmppath: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    points = np.random.uniform(size=(420, 3)).astype(np.float32)
+    colors = np.random.uniform(size=(420, 3)).astype(np.float32)
+    path = tmppath / "foo.xyzrgb"
+    np.savetxt(path, np.hstack([points, colors]), fmt="%.6f")
+
+    progress: List[float] = []
+    monkeypatch.setattr(ascii, "CHUNK_SIZE", 1024)
+    monkeypatch.setattr(handler, "progress_callback", lambda _, p: progress.append(p))
+    read_points, read_colors = handler.read_point_cloud(path)
+
+    assert read_points.dtype == np.float32
+    assert np.allclose(read_points, points, atol=1e-6)
+    assert np.allclose(read_colors, colors, atol=1e-6)
+    assert len(progress) > 1
+    assert progress[-1] == 1
+
+
+def test_read_pts(handler: AsciiHandler, tmppath: Path) -> None:
+    path = tmppath / "foo.pts"
+    path.write_text("2\n1 2 3 -42 255 0 0\n4 5 6 -42 0 0 255\n")
+
+    points, colors = handler.read_point_cloud(path)
+    assert (points == [[1, 2, 3], [4, 5, 6]]).all()
+    assert (colors == [[1, 0, 0], [0, 0, 1]]).all()
+
+
+@pytest.mark.parametrize("extension", [".pts", ".xyz", ".xyzn", ".xyzrgb"])
+def test_write_and_read(handler: AsciiHandler, tmppath: Path, extension: str) -> None:
+    points = np.random.uniform(size=(42, 3)).astype(np.float32)
+    colors = np.random.randint(0, 256, size=(42, 3)).astype(np.float32) / 255
+    path = tmppath / f"foo{extension}"
+    handler.write_point_cloud(path, SimpleNamespace(points=points, colors=colors, origin=np.zeros(3)))  # type: ignore
+
+    read_points, read_colors = handler.read_point_cloud(path)
+    assert np.allclose(read_points, points, atol=1e-6)
+    if extension in (".pts", ".xyzrgb"):
+        assert np.allclose(read_colors, colors, atol=1e-6)
+    else:
+        assert read_colors is None
+
+
+@pytest.mark.parametrize("extension", [".pts", ".xyzrgb"])
+def test_write_byte_colors(
+    handler: AsciiHandler, tmppath: Path, extension: str
+) -> None:
+    ply_path = Path("labelCloud/resources/examples/exemplary.ply")
+    points, colors = PlyHandler().read_point_cloud(ply_path)
+    assert colors is not None and colors.dtype == np.uint8
+    path = tmppath / f"foo{extension}"
+    handler.write_point_cloud(path, SimpleNamespace(points=points, colors=colors, origin=np.zeros(3)))  # type: ignore
+
+    read_points, read_colors = handler.read_point_cloud(path)
+    assert np.allclose(read_points, points, atol=1e-5)
+    assert np.allclose(read_colors, normalize_colors(colors), atol=1e-6)
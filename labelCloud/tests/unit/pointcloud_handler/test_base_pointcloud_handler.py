@@ -0,0 +1,56 @@
+import logging
+import subprocess
+import sys
+
+import pytest
+
+from labelCloud.io.pointclouds import (
+    AsciiHandler,
+    BasePointCloudHandler,
+    LasHandler,
+    NumpyHandler,
+    PcdHandler,
+    PlyHandler,
+)
+
+
+@pytest.mark.parametrize(
+    ("extension", "handler"),
+    [
+        (".bin", NumpyHandler),
+        (".las", LasHandler),
+        (".pcd", PcdHandler),
+        (".ply", PlyHandler),
+        (".xyz", AsciiHandler),
+    ],
+)
+def test_get_handler(extension: str, handler: type) -> None:
+    assert isinstance(BasePointCloudHandler.get_handler(extension), handler)
+
+
+def test_get_handler_unknown_extension() -> None:
+    with pytest.raises(ValueError):
+        BasePointCloudHandler.get_handler(".foo")
+
+
+def test_get_supported_extensions() -> None:
+    assert {".bin", ".las", ".pcd", ".ply", ".pts", ".xyz", ".xyzn", ".xyzrgb"} == (
+        BasePointCloudHandler.get_supported_extensions()
+    )
+
+
+def test_import_time() -> None:
+    """Importing the handlers must not import heavy backends like open3d."""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import labelCloud.io.pointclouds\n"
+        "print(time.perf_counter() - start)\n"
+        "print('open3d' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    import_time, open3d_imported = result.stdout.split()
+    logging.info("Importing the point cloud handlers took %.3f s.", float(import_time))
+    assert open3d_imported == "False"
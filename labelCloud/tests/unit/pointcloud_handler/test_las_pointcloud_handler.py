@@ -0,0 +1,157 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from labelCloud.control.config_manager import config
+from labelCloud.io.pointclouds import BasePointCloudHandler, LasHandler, PlyHandler
+
+
+@pytest.fixture
+def handler() -> LasHandler:
+    return LasHandler()
+
+
+@pytest.fixture
+def las_path(handler: LasHandler, tmppath: Path) -> Path:
+    points = np.arange(420 * 3, dtype=np.float32).reshape((-1, 3)) / 10
+    colors = np.random.randint(0, 256, size=(420, 3)).astype(np.float32) / 255
+    path = tmppath / "foo.las"
+    pointcloud = SimpleNamespace(points=points, colors=colors, origin=np.zeros(3))
+    handler.write_point_cloud(path, pointcloud)  # type: ignore
+    return path
+
+
+@pytest.fixture
+def point_stride():
+    old_value = config.get("POINTCLOUD", "las_point_stride")
+    config.set("POINTCLOUD", "las_point_stride", "4")
+    yield 4
+    config.set("POINTCLOUD", "las_point_stride", old_value)
+
+
+def test_get_handler() -> None:
+    assert isinstance(BasePointCloudHandler.get_handler(".las"), LasHandler)
+
+
+def test_read_header(handler: LasHandler, las_path: Path) -> None:
+    header = handler.read_header(las_path)
+    assert header.version == (1, 2)
+    assert header.point_format == 2
+    assert header.point_count == 420
+    assert header.dtype.itemsize == 26
+    assert np.allclose(header.maxs, [125.7, 125.8, 125.9])
+
+
+def test_read_info(handler: LasHandler, las_path: Path) -> None:
+    info = handler.read_info(las_path)
+    assert info.point_count == 420
+    assert info.has_colors
+    assert np.allclose(info.maxs, [125.7, 125.8, 125.9])  # type: ignore
+
+
+def test_read_point_cloud(handler: LasHandler, las_path: Path) -> None:
+    points, colors = handler.read_point_cloud(las_path)
+    assert points.dtype == np.float32
+    assert points.shape == (420, 3)
+    assert np.allclose(points[1], [0.3, 0.4, 0.5])
+    assert colors is not None
+    assert colors.shape == (420, 3)
+    assert 0 <= colors.min() <= colors.max() <= 1
+
+
+def test_read_decimated_point_cloud(
+    handler: LasHandler, las_path: Path, point_stride: int
+) -> None:
+    points, colors = handler.read_point_cloud(las_path)
+    assert points.shape == (420 // point_stride, 3)
+    assert np.allclose(points[1], [1.2, 1.3, 1.4])
+    assert colors is not None
+    assert colors.shape == (420 // point_stride, 3)
+
+
+def test_read_georeferenced_point_cloud(handler: LasHandler, tmppath: Path) -> None:
+    origin = np.array([500000.0, 5000000.0, 100.0])
+    points = np.array([[0.123, 0.456, 0.789], [10.001, 20.002, 30.003]])
+    path = tmppath / "foo.las"
+    pointcloud = SimpleNamespace(
+        points=points.astype(np.float32), colors=None, origin=origin
+    )
+    handler.write_point_cloud(path, pointcloud)  # type: ignore
+
+    # Read relative to a local origin, as float32 cannot store the millimeters
+    read_points, _ = handler.read_point_cloud(path)
+    read_origin = handler.get_origin(path)
+    assert (read_origin == origin).all()
+    assert np.allclose(read_points + read_origin, points + origin, rtol=0, atol=1e-3)
+
+
+def test_write_georeferenced_point_cloud_as_ply(
+    handler: LasHandler, tmppath: Path
+) -> None:
+    origin = np.array([500000.0, 5000000.0, 100.0])
+    points = np.array([[0.123, 0.456, 0.789], [10.001, 20.002, 30.003]])
+    las_path = tmppath / "foo.las"
+    pointcloud = SimpleNamespace(
+        points=points.astype(np.float32), colors=None, origin=origin
+    )
+    handler.write_point_cloud(las_path, pointcloud)  # type: ignore
+
+    read_points, read_colors = handler.read_point_cloud(las_path)
+    ply_path = tmppath / "foo.ply"
+    PlyHandler().write_point_cloud(
+        ply_path,
+        SimpleNamespace(  # type: ignore
+            points=read_points, colors=read_colors, origin=handler.get_origin(las_path)
+        ),
+    )
+
+    vertices = PlyHandler().read_vertices(ply_path)
+    assert vertices is not None
+    ply_points = np.column_stack([vertices[axis] for axis in "xyz"])
+    assert ply_points.dtype == np.float64
+    assert np.allclose(ply_points, points + origin, rtol=0, atol=1e-3)
+
+
+def write_16_bit_colors(
+    handler: LasHandler, path: Path, colors: np.ndarray, software: bytes
+) -> None:
+    points = np.zeros((len(colors), 3), dtype=np.float32)
+    pointcloud = SimpleNamespace(
+        points=points, colors=colors / 65535, origin=np.zeros(3)
+    )
+    handler.write_point_cloud(path, pointcloud)  # type: ignore
+    with path.open("r+b") as stream:
+        stream.seek(58)
+        stream.write(software.ljust(32, b"\0"))
+
+
+def test_read_dark_16_bit_colors(handler: LasHandler, tmppath: Path) -> None:
+    path = tmppath / "foo.las"
+    colors = np.full((8, 3), 100)
+    write_16_bit_colors(handler, path, colors, b"labelCloud")
+
+    _, read_colors = handler.read_point_cloud(path)
+    assert np.allclose(read_colors, colors / 65535)
+
+
+def test_guess_8_bit_colors(handler: LasHandler, tmppath: Path) -> None:
+    path = tmppath / "foo.las"
+    colors = np.full((8, 3), 100)
+    write_16_bit_colors(handler, path, colors, b"other")
+
+    _, read_colors = handler.read_point_cloud(path)
+    assert np.allclose(read_colors, colors / 255)
+
+
+def test_guess_16_bit_colors_of_whole_file(
+    handler: LasHandler, tmppath: Path, point_stride: int
+) -> None:
+    path = tmppath / "foo.las"
+    colors = np.full((8, 3), 100)
+    colors[1] = 1000  # dropped by the stride
+    write_16_bit_colors(handler, path, colors, b"other")
+
+    _, read_colors = handler.read_point_cloud(path)
+    assert np.allclose(read_colors, colors[::point_stride] / 65535)
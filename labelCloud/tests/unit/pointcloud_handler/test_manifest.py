@@ -0,0 +1,103 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from labelCloud.io.pointclouds.manifest import (
+    MANIFEST_FOLDER,
+    MANIFEST_NAME,
+    DatasetManifest,
+)
+
+
+@pytest.fixture
+def pointcloud_folder(tmppath: Path) -> Path:
+    folder = tmppath / "manifest"
+    (folder / "sub").mkdir(parents=True)
+    for i, name in enumerate(["b.bin", "a.bin", "sub/c.bin"]):
+        points = np.arange(12 * (i + 1), dtype=np.float32).reshape((-1, 4))
+        points.tofile(folder / name)
+    (folder / "notes.txt").write_text("not a point cloud")
+    return folder
+
+
+def scan(manifest: DatasetManifest) -> None:
+    manifest.start_scan()
+    manifest.executor.shutdown(wait=True)  # type: ignore
+
+
+def test_manifest_file_list(pointcloud_folder: Path) -> None:
+    manifest = DatasetManifest(pointcloud_folder, {".bin"})
+    paths = manifest.read_file_list()
+    assert paths == [
+        pointcloud_folder / "a.bin",
+        pointcloud_folder / "b.bin",
+        pointcloud_folder / "sub/c.bin",
+    ]
+    assert (pointcloud_folder / MANIFEST_FOLDER / MANIFEST_NAME).is_file()
+
+
+def test_manifest_scan(pointcloud_folder: Path) -> None:
+    manifest = DatasetManifest(pointcloud_folder, {".bin"})
+    manifest.read_file_list()
+    scan(manifest)
+
+    entry = DatasetManifest(pointcloud_folder, {".bin"})
+    assert entry.load()
+    entry = entry.get_entry(pointcloud_folder / "sub/c.bin")
+    assert entry is not None
+    assert entry.is_scanned
+    assert entry.point_count == 9
+    assert entry.mins is None  # not stored by binary files
+    assert entry.has_colors is False
+    assert entry.size == 9 * 4 * 4
+
+
+def test_manifest_reuses_file_list(pointcloud_folder: Path) -> None:
+    DatasetManifest(pointcloud_folder, {".bin"}).read_file_list()
+
+    manifest = DatasetManifest(pointcloud_folder, {".bin"})
+    manifest.enumerate_folder = None  # type: ignore
+    assert len(manifest.read_file_list()) == 3
+
+
+def test_manifest_rescans_changed_files(pointcloud_folder: Path) -> None:
+    manifest = DatasetManifest(pointcloud_folder, {".bin"})
+    manifest.read_file_list()
+    scan(manifest)
+
+    path = pointcloud_folder / "a.bin"
+    np.zeros((5, 4), dtype=np.float32).tofile(path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    np.ones((2, 4), dtype=np.float32).tofile(pointcloud_folder / "sub/d.bin")
+
+    scanned = []
+    manifest = DatasetManifest(pointcloud_folder, {".bin"})
+    manifest.scanned_callback = scanned.append
+    assert len(manifest.read_file_list()) == 4
+    scan(manifest)
+
+    assert sorted(scanned) == ["a.bin", "sub/d.bin"]
+    assert manifest.get_entry(path).point_count == 5  # type: ignore
+    assert manifest.get_entry(pointcloud_folder / "sub/d.bin").point_count == 2  # type: ignore
+
+
+def test_manifest_streams_found_files(pointcloud_folder: Path) -> None:
+    batches = []
+    manifest = DatasetManifest(pointcloud_folder, {".bin"})
+    assert not manifest.is_up_to_date()
+    assert manifest.update_file_list(batches.append)
+
+    assert len(batches[0]) == 1  # the first file is passed on immediately
+    found = [path for batch in batches for path in batch]
+    assert sorted(found) == manifest.get_paths()
+    assert manifest.is_up_to_date()
+
+
+def test_manifest_stopped_enumeration(pointcloud_folder: Path) -> None:
+    manifest = DatasetManifest(pointcloud_folder, {".bin"})
+    manifest.stop()
+    assert not manifest.update_file_list()
+    assert manifest.get_paths() == []
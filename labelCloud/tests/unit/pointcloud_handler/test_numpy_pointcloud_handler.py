@@ -0,0 +1,55 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from labelCloud.control.config_manager import config
+from labelCloud.io.pointclouds import NumpyHandler
+
+
+@pytest.fixture
+def handler() -> NumpyHandler:
+    return NumpyHandler()
+
+
+@pytest.fixture(params=[True, False])
+def memory_map(request):
+    old_value = config.get("POINTCLOUD", "memory_map_binary")
+    config.set("POINTCLOUD", "memory_map_binary", str(request.param))
+    yield request.param
+    config.set("POINTCLOUD", "memory_map_binary", old_value)
+
+
+def test_read_point_cloud(handler: NumpyHandler, memory_map: bool, tmppath: Path):
+    data = np.random.uniform(size=(420, 4)).astype(np.float32)
+    path = tmppath / "foo.bin"
+    data.tofile(path)
+
+    points, colors = handler.read_point_cloud(path)
+    assert colors is None
+    assert points.dtype == np.float32
+    assert points.shape == (420, 3)
+    assert (points == data[:, :3]).all()
+    assert isinstance(points.base, np.memmap) == memory_map
+
+
+def test_read_point_cloud_drops_nan(
+    handler: NumpyHandler, memory_map: bool, tmppath: Path
+):
+    data = np.random.uniform(size=(420, 4)).astype(np.float32)
+    data[[3, 42], 1] = np.nan
+    path = tmppath / "foo.bin"
+    data.tofile(path)
+
+    points, _ = handler.read_point_cloud(path)
+    assert points.shape == (418, 3)
+    assert not np.isnan(points).any()
+
+
+def test_read_empty_point_cloud(handler: NumpyHandler, memory_map: bool, tmppath: Path):
+    path = tmppath / "foo.bin"
+    path.touch()
+
+    points, colors = handler.read_point_cloud(path)
+    assert colors is None
+    assert points.shape == (0, 3)
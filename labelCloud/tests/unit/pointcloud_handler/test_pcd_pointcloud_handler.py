@@ -0,0 +1,97 @@
+import struct
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from labelCloud.io.pointclouds import BasePointCloudHandler, PcdHandler
+from labelCloud.io.pointclouds.pcd import lzf_decompress
+
+HEADER = """# .PCD v0.7 - Point Cloud Data file format
+VERSION 0.7
+FIELDS x y z rgb
+SIZE 4 4 4 4
+TYPE F F F U
+COUNT 1 1 1 1
+WIDTH 2
+HEIGHT 1
+VIEWPOINT 0 0 0 1 0 0 0
+POINTS 2
+DATA {data}
+"""
+
+
+def lzf_compress_literals(data: bytes) -> bytes:
+    """Encode data only with literal runs (valid, but uncompressed LZF)."""
+    compressed = bytearray()
+    for start in range(0, len(data), 32):
+        chunk = data[start : start + 32]
+        compressed += bytes([len(chunk) - 1]) + chunk
+    return bytes(compressed)
+
+
+@pytest.fixture
+def handler() -> PcdHandler:
+    return PcdHandler()
+
+
+def test_get_handler() -> None:
+    assert isinstance(BasePointCloudHandler.get_handler(".pcd"), PcdHandler)
+
+
+def test_read_ascii(handler: PcdHandler, tmppath: Path) -> None:
+    path = tmppath / "foo.pcd"
+    path.write_text(HEADER.format(data="ascii") + "1 2 3 16711680\n4 5 6 255\n")
+
+    points, colors = handler.read_point_cloud(path)
+    assert points.dtype == np.float32
+    assert (points == [[1, 2, 3], [4, 5, 6]]).all()
+    assert (colors == [[1, 0, 0], [0, 0, 1]]).all()
+
+
+def test_read_info(handler: PcdHandler, tmppath: Path) -> None:
+    path = tmppath / "foo.pcd"
+    path.write_text(HEADER.format(data="ascii") + "1 2 3 16711680\n4 5 6 255\n")
+
+    info = handler.read_info(path)
+    assert (info.point_count, info.has_colors) == (2, True)
+
+
+def test_lzf_decompress() -> None:
+    # literal "abcd", back reference of length 4 with offset 4
+    assert lzf_decompress(b"\x03abcd\x40\x03", 8) == b"abcdabcd"
+    # overlapping back references repeat the last bytes
+    assert lzf_decompress(b"\x01ab\x80\x01", 8) == b"abababab"
+    assert lzf_decompress(b"\x00a\xe0\x01\x00", 11) == b"a" * 11
+    with pytest.raises(ValueError):
+        lzf_decompress(b"\x01ab", 3)
+    with pytest.raises(ValueError):
+        lzf_decompress(b"\x01ab\x80\x05", 8)
+
+
+def test_read_binary_compressed(handler: PcdHandler, tmppath: Path) -> None:
+    xyz = np.array([[1, 2, 3], [4, 5, 6]], dtype="<f4")
+    rgb = np.array([0x00FF00, 0x0000FF], dtype="<u4")
+    data = b"".join(xyz[:, i].tobytes() for i in range(3)) + rgb.tobytes()
+    compressed = lzf_compress_literals(data)
+
+    path = tmppath / "foo.pcd"
+    with path.open("wb") as stream:
+        stream.write(HEADER.format(data="binary_compressed").encode("ascii"))
+        stream.write(struct.pack("<II", len(compressed), len(data)) + compressed)
+
+    points, colors = handler.read_point_cloud(path)
+    assert (points == xyz).all()
+    assert (colors == [[0, 1, 0], [0, 0, 1]]).all()
+
+
+def test_write_and_read_binary(handler: PcdHandler, tmppath: Path) -> None:
+    points = np.random.uniform(size=(420, 3)).astype(np.float32)
+    colors = np.random.randint(0, 256, size=(420, 3)).astype(np.float32) / 255
+    path = tmppath / "foo.pcd"
+    handler.write_point_cloud(path, SimpleNamespace(points=points, colors=colors, origin=np.zeros(3)))  # type: ignore
+
+    read_points, read_colors = handler.read_point_cloud(path)
+    assert (read_points == points).all()
+    assert np.allclose(read_colors, colors)
@@ -0,0 +1,86 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from labelCloud.io.pointclouds import BasePointCloudHandler, PlyHandler
+from labelCloud.utils.color import normalize_colors
+
+
+@pytest.fixture
+def handler() -> PlyHandler:
+    return PlyHandler()
+
+
+@pytest.fixture
+def ply_path() -> Path:
+    path = Path("labelCloud/resources/examples/exemplary.ply")
+    assert path.exists()
+    return path
+
+
+def test_get_handler() -> None:
+    assert isinstance(BasePointCloudHandler.get_handler(".ply"), PlyHandler)
+
+
+def test_read_vertices(handler: PlyHandler, ply_path: Path) -> None:
+    vertices = handler.read_vertices(ply_path)
+    assert vertices is not None
+    assert vertices.dtype.names == ("x", "y", "z", "red", "green", "blue")
+    assert vertices.shape == (86357,)
+
+
+def test_read_info(handler: PlyHandler, ply_path: Path) -> None:
+    info = handler.read_info(ply_path)
+    assert (info.point_count, info.has_colors) == (86357, True)
+
+
+def test_read_point_cloud(handler: PlyHandler, ply_path: Path) -> None:
+    points, colors = handler.read_point_cloud(ply_path)
+    assert points.dtype == np.float32
+    assert points.shape == (86357, 3)
+    assert colors is not None
+    assert colors.dtype == np.uint8  # normalized only where needed
+    assert colors.shape == (86357, 3)
+
+
+def test_read_extra_properties(handler: PlyHandler, tmppath: Path) -> None:
+    vertices = np.array(
+        [(1, 2, 3, 0.5, 255), (4, 5, 6, 0.25, 0)],
+        dtype=[
+            ("x", "<f4"),
+            ("y", "<f4"),
+            ("z", "<f4"),
+            ("intensity", "<f4"),
+            ("r", "u1"),
+        ],
+    )
+    path = tmppath / "foo.ply"
+    with path.open("wb") as stream:
+        stream.write(
+            b"ply\nformat binary_little_endian 1.0\nelement vertex 2\n"
+            b"property float x\nproperty float y\nproperty float z\n"
+            b"property float intensity\nproperty uchar r\n"
+            b"element face 0\nproperty list uchar int vertex_indices\nend_header\n"
+        )
+        stream.write(vertices.tobytes())
+
+    read_vertices = handler.read_vertices(path)
+    assert read_vertices is not None
+    assert (read_vertices["intensity"] == [0.5, 0.25]).all()
+
+    points, colors = handler.read_point_cloud(path)
+    assert (points == [[1, 2, 3], [4, 5, 6]]).all()
+    assert colors is None
+
+
+def test_write_and_read(handler: PlyHandler, tmppath: Path) -> None:
+    points = np.random.uniform(size=(420, 3)).astype(np.float32)
+    colors = np.random.randint(0, 256, size=(420, 3)).astype(np.float32) / 255
+    path = tmppath / "foo.ply"
+    handler.write_point_cloud(path, SimpleNamespace(points=points, colors=colors, origin=np.zeros(3)))  # type: ignore
+
+    read_points, read_colors = handler.read_point_cloud(path)
+    assert (read_points == points).all()
+    assert np.allclose(normalize_colors(read_colors), colors)
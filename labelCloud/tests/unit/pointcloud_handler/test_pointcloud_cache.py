@@ -0,0 +1,54 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from labelCloud.control.config_manager import config
+from labelCloud.io.pointclouds.cache import PointCloudCache, read_point_cloud
+from labelCloud.utils.color import normalize_colors
+
+
+@pytest.fixture
+def cache_folder(tmppath: Path):
+    old_value = config.get("FILE", "pointcloud_cache_folder")
+    config.set("FILE", "pointcloud_cache_folder", str(tmppath / "cache"))
+    yield tmppath / "cache"
+    config.set("FILE", "pointcloud_cache_folder", old_value)
+
+
+@pytest.fixture
+def xyzrgb_path(tmppath: Path) -> Path:
+    path = tmppath / "foo.bar.xyzrgb"
+    path.write_text("1 2 3 1 0 0\n4 5 6 0 0 1\n")
+    return path
+
+
+def test_cache_disabled_by_default() -> None:
+    assert PointCloudCache.from_config() is None
+
+
+def test_read_point_cloud_with_cache(cache_folder: Path, xyzrgb_path: Path) -> None:
+    points, colors = read_point_cloud(xyzrgb_path)
+    assert len(list(cache_folder.glob("foo.bar_*"))) == 3
+
+    cached_points, cached_colors = read_point_cloud(xyzrgb_path)
+    assert isinstance(cached_points, np.memmap)
+    assert (cached_points == points).all()
+    assert cached_colors.dtype == np.uint8  # stored as bytes
+    assert (normalize_colors(cached_colors) == colors).all()
+
+
+def test_cache_invalidation(cache_folder: Path, xyzrgb_path: Path) -> None:
+    cache = PointCloudCache(cache_folder)
+    read_point_cloud(xyzrgb_path)
+    assert cache.load(xyzrgb_path) is not None
+
+    xyzrgb_path.write_text("7 8 9 0 1 0\n")
+    stat = xyzrgb_path.stat()
+    os.utime(xyzrgb_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert cache.load(xyzrgb_path) is None
+
+    points, colors = read_point_cloud(xyzrgb_path)
+    assert (points == [[7, 8, 9]]).all()
+    assert (colors == [[0, 1, 0]]).all()
@@ -0,0 +1,51 @@
+import os
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from labelCloud.io.pointclouds.prefetch import PointCloudPrefetcher
+
+
+@pytest.fixture
+def pointcloud_paths(tmppath: Path) -> List[Path]:
+    paths = []
+    for i in range(4):
+        path = tmppath / f"{i}.bin"
+        np.full((42, 4), i, dtype=np.float32).tofile(path)
+        paths.append(path)
+    return paths
+
+
+def test_prefetch(pointcloud_paths: List[Path]) -> None:
+    prefetcher = PointCloudPrefetcher(capacity=2)
+    prefetcher.prefetch(pointcloud_paths[:2])
+    for i, path in enumerate(pointcloud_paths[:2]):
+        prefetched = prefetcher.read_point_cloud(path)
+        assert prefetched.points.shape == (42, 3)
+        assert (prefetched.points == i).all()
+        assert prefetched.colors is None
+        assert prefetched.octree.counts.sum() == 42
+    assert set(prefetcher.cache) == set(pointcloud_paths[:2])
+
+
+def test_prefetch_capacity(pointcloud_paths: List[Path]) -> None:
+    prefetcher = PointCloudPrefetcher(capacity=2)
+    for path in pointcloud_paths:
+        prefetcher.read_point_cloud(path)
+    assert list(prefetcher.cache) == pointcloud_paths[-2:]
+
+
+def test_prefetch_modified_file(pointcloud_paths: List[Path]) -> None:
+    prefetcher = PointCloudPrefetcher(capacity=2)
+    path = pointcloud_paths[0]
+    prefetcher.read_point_cloud(path)
+
+    np.full((21, 4), 42, dtype=np.float32).tofile(path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+    points = prefetcher.read_point_cloud(path).points
+    assert points.shape == (21, 3)
+    assert (points == 42).all()
@@ -0,0 +1,14 @@
+from labelCloud.utils.buffer_pool import BufferPool
+
+
+def test_reusable_buffer() -> None:
+    pool = BufferPool()
+    pool.sizes = {1: 1000, 2: 4000, 3: 300}
+    pool.free = [1, 2]
+    assert pool.bytes_allocated == 5300
+    assert pool.bytes_in_use == 300
+
+    assert pool.get_reusable_buffer(900) == 1  # smallest fitting buffer
+    assert pool.get_reusable_buffer(1500) is None  # would waste most of buffer 2
+    assert pool.get_reusable_buffer(3000) == 2
+    assert pool.get_reusable_buffer(5000) is None
@@ -0,0 +1,25 @@
+import numpy as np
+import pytest
+
+from labelCloud.utils import math3d
+from labelCloud.view.camera import Camera
+
+
+def test_camera_unproject() -> None:
+    camera = Camera(0.1, 300)
+    camera.set_viewport(640, 480)
+    camera.modelview = math3d.get_translation_matrix([-1, -2, -20]).T
+    assert camera.projection == pytest.approx(
+        math3d.get_perspective_matrix(45, 640 / 480, 0.1, 300).T
+    )
+
+    point = np.array([[2.0, 1.0, 5.0]])
+    x, y, z = math3d.project_points(
+        point, camera.modelview, camera.projection, camera.viewport
+    )[0]
+    assert camera.unproject(x, y, z) == pytest.approx(point[0])
+
+    near, far = camera.get_pick_ray(x, y)
+    direction = np.subtract(far, near)
+    offset = np.cross(point[0] - near, direction)
+    assert np.linalg.norm(offset) / np.linalg.norm(direction) == pytest.approx(0)
@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from labelCloud.utils import math3d
+
+
+def test_plane() -> None:
+    plane = math3d.get_plane((0, 0, 2), (0, 0, 4))
+    assert plane == pytest.approx([0, 0, 1, -2])
+
+    points = np.array([[0, 0, 1], [5, -3, 2], [1, 1, 3]], dtype=np.float32)
+    assert list(math3d.get_points_inside_planes(points, plane[np.newaxis])) == [
+        False,
+        True,
+        True,
+    ]
+
+
+def test_slab_planes() -> None:
+    planes = math3d.get_slab_planes((1, 1, 1), (1, 1, 0), np.sqrt(2))
+    points = np.array([[1, 1, 1], [1.4, 1.4, 9], [1.6, 1.6, 1], [0, 0, 0]])
+
+    assert list(math3d.get_points_inside_planes(points, planes)) == [
+        True,
+        True,
+        False,
+        False,
+    ]
+
+
+def test_no_planes() -> None:
+    points = np.zeros((3, 3))
+    assert math3d.get_points_inside_planes(points, np.empty((0, 4))).all()
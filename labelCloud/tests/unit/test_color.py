@@ -1,6 +1,12 @@
 import numpy as np
+import pytest
 
-from labelCloud.utils.color import colorize_points_with_height, get_distinct_colors
+from labelCloud.utils.color import (
+    colorize_points_with_height,
+    get_distinct_colors,
+    normalize_colors,
+    to_byte_colors,
+)
 
 
 def test_get_distinct_colors() -> None:
@@ -20,3 +26,14 @@ def test_colorize_points_with_height() -> None:
     assert colors.dtype == np.float32
     assert colors.shape == (num_points, 3)
     assert 0 <= colors.max() <= 1
+
+
+def test_convert_byte_colors() -> None:
+    byte_colors = np.array([[0, 51, 255]], dtype=np.uint8)
+    float_colors = normalize_colors(byte_colors)
+    assert float_colors.dtype == np.float32
+    assert float_colors[0] == pytest.approx([0, 0.2, 1])
+
+    assert to_byte_colors(byte_colors) is byte_colors
+    assert (to_byte_colors(float_colors) == byte_colors).all()
+    assert normalize_colors(float_colors) is float_colors
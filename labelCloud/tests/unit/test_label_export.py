@@ -3,6 +3,7 @@ import json
 import os
 from pathlib import Path
 
+import numpy as np
 import pytest
 from labelCloud.control.label_manager import LabelManager
 from labelCloud.model.bbox import BBox
@@ -96,3 +97,20 @@ def test_kitti_export(bounding_box, tmppath):
         data = read_file.readlines()
 
     assert data == ["test_bbox 0 0 0 0 0 0 0 1 1 1 0 0 0 -1.57079633\n"]
+
+
+def test_export_and_import_with_origin(bounding_box, tmppath):
+    label_manager = LabelManager(strategy="centroid_abs", path_to_label_folder=tmppath)
+    pcd_path = Path("testfolder/testpcd.las")
+    origin = np.array([500000.0, 5000000.0, 100.0])
+    label_manager.export_labels(pcd_path, [bounding_box], origin)
+
+    with tmppath.joinpath("testpcd.json").open("r") as read_file:
+        data = json.load(read_file)
+
+    # Labels are stored in the coordinates of the file, the box itself is unchanged
+    assert data["objects"][0]["centroid"] == {"x": 500000, "y": 5000000, "z": 100}
+    assert bounding_box.get_center() == (0, 0, 0)
+
+    bbox = label_manager.import_labels(pcd_path, origin)[0]
+    assert bbox.get_center() == (0, 0, 0)
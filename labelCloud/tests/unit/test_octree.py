@@ -0,0 +1,69 @@
+import numpy as np
+
+from labelCloud.model.octree import Octree, get_morton_codes
+from labelCloud.utils.math3d import get_frustum_planes
+
+
+def test_morton_codes() -> None:
+    points = np.array([[0, 0, 0], [0, 0, 0.6], [0, 0.6, 0], [0.6, 0, 0], [1, 1, 1]])
+    codes = get_morton_codes(points, mins=np.zeros(3), size=1.0)
+    top_octants = codes >> np.uint64(60)
+    assert top_octants.tolist() == [0, 1, 2, 4, 7]
+
+
+def test_octree_chunks() -> None:
+    points = np.random.default_rng(0).random((5000, 3), dtype=np.float32)
+    octree = Octree.from_points(points, max_points=100)
+
+    assert np.array_equal(np.sort(octree.order), np.arange(5000))
+    assert octree.order.dtype == octree.starts.dtype == np.int32
+    assert octree.counts.max() <= 100
+    assert octree.counts.sum() == 5000
+    assert np.array_equal(octree.starts[1:], np.cumsum(octree.counts)[:-1])
+    for start, count, mins, maxs in zip(
+        octree.starts, octree.counts, octree.mins, octree.maxs
+    ):
+        chunk = points[octree.order[start : start + count]]
+        assert (chunk >= mins).all() and (chunk <= maxs).all()
+
+
+def test_octree_draw_ranges_with_budget() -> None:
+    points = np.random.default_rng(0).random((5000, 3), dtype=np.float32)
+    octree = Octree.from_points(points, max_points=100)
+    visible = np.ones(len(octree), dtype=np.bool_)
+
+    _, counts = octree.get_draw_ranges(visible)
+    assert counts.sum() == 5000
+    _, counts = octree.get_draw_ranges(visible, point_budget=500)
+    assert 500 <= counts.sum() < 500 + len(octree)
+
+
+def test_frustum_culling() -> None:
+    # Orthographic projection of the unit cube around the origin, camera at the origin
+    projection = np.identity(4)
+    modelview = np.identity(4)
+    planes = get_frustum_planes(modelview, projection)
+
+    points = np.array(
+        [[0, 0, 0], [0.5, 0.5, 0.5], [3, 0, 0], [3.5, 0, 0], [0, -3, 0], [0, -3.5, 0]],
+        dtype=np.float32,
+    )
+    octree = Octree.from_points(points, max_points=2)
+    visible = octree.get_visible_chunks(planes)
+    for start, count, is_visible in zip(octree.starts, octree.counts, visible):
+        chunk = points[octree.order[start : start + count]]
+        assert is_visible == (np.abs(chunk) <= 1).all()
+
+
+def test_octree_indices_of_selected_chunks() -> None:
+    points = np.random.default_rng(0).random((5000, 3), dtype=np.float32)
+    octree = Octree.from_points(points, max_points=100, shuffle=False)
+    selected = np.zeros(len(octree), dtype=np.bool_)
+    selected[[1, 4]] = True
+
+    indices = octree.get_indices(selected)
+    expected = [
+        np.arange(start, start + count)
+        for start, count in zip(octree.starts[[1, 4]], octree.counts[[1, 4]])
+    ]
+    assert np.array_equal(indices, np.concatenate(expected))
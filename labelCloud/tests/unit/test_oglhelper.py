@@ -0,0 +1,42 @@
+import numpy as np
+
+from labelCloud.definitions import BBOX_EDGES
+from labelCloud.model.bbox import BBox
+from labelCloud.utils.oglhelper import get_bbox_edge_vertices, get_xy_plane_vertices
+
+
+def test_xy_plane_vertices() -> None:
+    vertices = get_xy_plane_vertices(-1, 0, 1, 2)
+
+    assert vertices.dtype == np.float32
+    assert vertices.shape == ((3 + 3) * 2, 3)
+    assert np.all(vertices[:, 2] == 0)
+    lines = vertices.reshape((-1, 2, 3))
+    assert lines[0].tolist() == [[-1, 0, 0], [1, 0, 0]]  # first x-line
+    assert lines[-1].tolist() == [[1, 0, 0], [1, 2, 0]]  # last y-line
+
+
+def test_bbox_edge_vertices() -> None:
+    bbox = BBox(1, 2, 3, 4, 2, 1)
+    bbox.set_rotations(10, 20, 30)
+
+    edges = get_bbox_edge_vertices(
+        [bbox.get_center()], [bbox.get_dimensions()], [bbox.get_rotations()]
+    )
+
+    expected = bbox.get_vertices()[np.ravel(BBOX_EDGES)]
+    assert edges.shape == (1, 24, 3)
+    np.testing.assert_allclose(edges[0], expected, atol=1e-6)
+
+
+def test_bbox_edge_vertices_after_resize() -> None:
+    bbox = BBox(1, 2, 3, 1, 1, 1)
+    bbox.set_dimensions(4, 2, 1)
+    bbox.change_side("top", 1)
+
+    edges = get_bbox_edge_vertices(
+        [bbox.get_center()], [bbox.get_dimensions()], [bbox.get_rotations()]
+    )
+
+    expected = bbox.get_vertices()[np.ravel(BBOX_EDGES)]
+    np.testing.assert_allclose(edges[0], expected, atol=1e-6)
@@ -0,0 +1,159 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from labelCloud.control.config_manager import config
+from labelCloud.io.labels.config import LabelConfig
+from labelCloud.model.octree import Octree
+from labelCloud.model.point_cloud import (
+    QUANTIZED_VERTEX,
+    VERTEX,
+    PointCloud,
+    get_label_palette,
+    to_color_bytes,
+)
+from labelCloud.utils.shaders import PALETTE_SIZE
+
+
+@pytest.fixture
+def points() -> np.ndarray:
+    return np.random.default_rng(0).uniform(-50, 50, (1000, 3)).astype(np.float32)
+
+
+@pytest.fixture
+def colors() -> np.ndarray:
+    return np.random.default_rng(1).random((1000, 3), dtype=np.float32)
+
+
+@pytest.fixture
+def pointcloud_config(monkeypatch: pytest.MonkeyPatch):
+    """Set options of the POINTCLOUD section, restored after the test."""
+    return lambda key, value: monkeypatch.setitem(config["POINTCLOUD"], key, value)
+
+
+@pytest.fixture(params=[True, False])
+def quantize_positions(request, pointcloud_config) -> bool:
+    pointcloud_config("quantize_positions", str(request.param))
+    return request.param
+
+
+def test_to_color_bytes() -> None:
+    colors = np.array([[0, 0.5, 1], [-1, 2, 0.2]], dtype=np.float32)
+    assert to_color_bytes(colors).tolist() == [[0, 128, 255, 255], [0, 255, 51, 255]]
+
+
+def test_vertices(
+    quantize_positions: bool, points: np.ndarray, colors: np.ndarray
+) -> None:
+    pointcloud = PointCloud(Path("foo.bin"), points, colors)
+    pointcloud.octree = Octree.from_points(points)
+
+    vertices = pointcloud.get_vertices()
+    assert vertices.dtype == (QUANTIZED_VERTEX if quantize_positions else VERTEX)
+    assert vertices.dtype.itemsize == (12 if quantize_positions else 16)
+
+    positions = (
+        vertices["position"] * pointcloud.position_scale + pointcloud.position_offset
+    )
+    expected = pointcloud.in_render_order(points)
+    tolerance = 100 / 65534 if quantize_positions else 0
+    assert np.abs(positions - expected).max() <= tolerance
+    assert np.array_equal(
+        vertices["color"], to_color_bytes(pointcloud.in_render_order(colors))
+    )
+
+
+def test_colorless_vertices(
+    quantize_positions: bool, points: np.ndarray, pointcloud_config
+) -> None:
+    pointcloud_config("colorless_colorize", "False")
+    pointcloud = PointCloud(Path("foo.bin"), points)
+    pointcloud.octree = Octree.from_points(points)
+
+    assert pointcloud.colors is None
+    assert pointcloud.constant_color == pytest.approx(
+        config.getlist("POINTCLOUD", "colorless_color")
+    )
+    vertices = pointcloud.get_vertices()
+    assert vertices.dtype.names == (
+        ("position", "padding") if quantize_positions else ("position",)
+    )
+    assert vertices.dtype.itemsize == (8 if quantize_positions else 12)
+
+
+def test_vertex_chunks(quantize_positions: bool, points: np.ndarray) -> None:
+    pointcloud = PointCloud(Path("foo.bin"), points)
+    pointcloud.octree = Octree.from_points(points, max_points=100)
+
+    vertices = pointcloud.get_vertices()
+    chunks = [
+        pointcloud.get_vertices(start, start + 300) for start in (0, 300, 600, 900)
+    ]
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    assert np.array_equal(np.concatenate(chunks), vertices)
+
+
+def test_label_palette() -> None:
+    palette = get_label_palette()
+    assert palette.shape == (PALETTE_SIZE, 3)
+    for label_class in LabelConfig().classes:
+        assert palette[label_class.id].tolist() == pytest.approx(
+            list(label_class.color)
+        )
+
+
+def test_blended_label_colors(points: np.ndarray, colors: np.ndarray) -> None:
+    pointcloud = PointCloud(Path("foo.bin"), points, colors)
+    pointcloud.octree = Octree.from_points(points)
+    pointcloud.labels = np.full(1000, LabelConfig().classes[0].id, dtype=np.int8)
+    pointcloud.mix_ratio = 0.5
+    order = pointcloud.octree.order[:10]
+
+    assert pointcloud.get_label_data(order).dtype == np.int8
+    pointcloud.blend_labels = True  # without label shader
+    label_color = get_label_palette()[LabelConfig().classes[0].id]
+    expected = to_color_bytes((colors[order] + label_color) / 2)
+    assert np.abs(pointcloud.get_label_data(order) - expected.astype(int)).max() <= 1
+
+
+def test_model_matrix() -> None:
+    points = np.array([[0, 0, 0], [2, 4, 6]], dtype=np.float32)
+    pointcloud = PointCloud(Path("foo.bin"), points)
+    pointcloud.set_rotations(90, 0, 0)
+    pointcloud.set_translations(0, 0, -20)
+
+    model = pointcloud.get_model_matrix()
+    # Rotated by 90° around the x axis through the center (1, 2, 3), then moved
+    assert model @ [1, 2, 3, 1] == pytest.approx([1, 2, -17, 1])
+    assert model @ [1, 2, 4, 1] == pytest.approx([1, 1, -17, 1])
+
+
+def test_draw_state(points: np.ndarray, pointcloud_config) -> None:
+    pointcloud = PointCloud(Path("foo.bin"), points)
+    state = pointcloud.get_draw_state()
+    assert pointcloud.get_draw_state() == state
+    assert pointcloud.get_draw_state(decimated=True) != state
+    assert PointCloud(Path("foo.bin"), points).get_draw_state() != state
+
+    pointcloud_config(
+        "point_size", str(config.getfloat("POINTCLOUD", "point_size") + 1)
+    )
+    assert pointcloud.get_draw_state() != state
+
+
+def test_decimated_point_cloud_is_not_written(
+    tmppath: Path, points: np.ndarray
+) -> None:
+    pointcloud = PointCloud(Path("foo.las"), points, point_stride=4)
+    assert pointcloud.is_decimated
+    with pytest.raises(ValueError):
+        pointcloud.to_file(tmppath / "foo.bin")
+    assert not (tmppath / "foo.bin").exists()
+
+
+def test_empty_point_cloud_is_rejected(tmppath: Path) -> None:
+    path = tmppath / "foo.bin"
+    path.touch()
+    with pytest.raises(ValueError, match="contains no points"):
+        PointCloud.from_file(path)
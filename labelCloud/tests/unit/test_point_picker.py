@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from labelCloud.model.point_picker import PointPicker
+from labelCloud.utils import math3d
+
+VIEWPORT = (0, 0, 640, 480)
+
+
+@pytest.fixture
+def camera():
+    modelview = np.eye(4)
+    modelview[3, :3] = [-5, -5, -20]  # column-major translation
+    return modelview, math3d.get_perspective_matrix(45, 640 / 480, 0.1, 300).T
+
+
+def test_project_unproject(camera) -> None:
+    modelview, projection = camera
+    points = np.array([[0, 0, 0], [5, 5, 0], [8, 2, 3]], dtype=np.float64)
+
+    window_coords = math3d.project_points(points, modelview, projection, VIEWPORT)
+    assert window_coords[1, :2] == pytest.approx([320, 240])
+    for point, (x, y, z) in zip(points, window_coords):
+        unprojected = math3d.unproject_point(x, y, z, modelview, projection, VIEWPORT)
+        assert unprojected == pytest.approx(point)
+
+
+def test_point_picker(camera) -> None:
+    modelview, projection = camera
+    grid = np.stack(np.meshgrid(np.arange(0, 10, 0.05), np.arange(0, 10, 0.05)), -1)
+    points = np.column_stack([grid.reshape((-1, 2)), np.zeros(len(grid) ** 2)])
+    points = np.concatenate([points, [[5, 5, 1]]]).astype(np.float32)
+
+    picker = PointPicker(points)
+    assert picker.points is points  # no sorted copy
+    window_coords = picker.get_window_coords(
+        320, 240, 4, modelview, projection, VIEWPORT
+    )
+
+    expected = math3d.project_points(points, modelview, projection, VIEWPORT)
+    distances = np.hypot(expected[:, 0] - 320, expected[:, 1] - 240)
+    assert len(window_coords) == np.sum(distances <= 4)
+    # The raised point in the center is closest to the camera
+    assert np.min(window_coords[:, 2]) == pytest.approx(expected[-1, 2])
+
+
+def test_point_picker_clip_planes(camera) -> None:
+    modelview, projection = camera
+    points = np.array([[5, 5, 0], [5, 5, 1]], dtype=np.float32)
+    picker = PointPicker(points)
+
+    # The raised point is above the height band and ignored
+    planes = math3d.get_slab_planes((0, 0, 0), (0, 0, 1), 1)
+    window_coords = picker.get_window_coords(
+        320, 240, 4, modelview, projection, VIEWPORT, planes
+    )
+    expected = math3d.project_points(points, modelview, projection, VIEWPORT)
+    assert window_coords == pytest.approx(expected[:1])
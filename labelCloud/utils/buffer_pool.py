@@ -0,0 +1,76 @@
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+import OpenGL.GL as GL
+
+
+class BufferPool(object):
+    """Array buffers of one OpenGL context, which are reused for the next point cloud.
+
+    Released buffers stay allocated. When new data fits into one of them, it is
+    orphaned and refilled; otherwise a released buffer is reallocated with the new
+    size. Released buffers that were not needed again are deleted by `delete_free`.
+    """
+
+    MIN_USAGE = 0.5  # smaller data gets a smaller buffer, to free the unused memory
+
+    def __init__(self) -> None:
+        self.sizes: Dict[int, int] = {}  # buffer -> allocated bytes
+        self.free: List[int] = []  # released buffers
+
+    @property
+    def bytes_allocated(self) -> int:
+        return sum(self.sizes.values())
+
+    @property
+    def bytes_in_use(self) -> int:
+        return self.bytes_allocated - sum(self.sizes[buffer] for buffer in self.free)
+
+    def get_reusable_buffer(self, nbytes: int) -> Optional[int]:
+        """Return the smallest released buffer that fits the data without much waste."""
+        fitting = [
+            buffer
+            for buffer in self.free
+            if self.MIN_USAGE * self.sizes[buffer] <= nbytes <= self.sizes[buffer]
+        ]
+        return min(fitting, key=self.sizes.__getitem__, default=None)
+
+    def acquire(self, nbytes: int, data: Optional[np.ndarray] = None) -> int:
+        """Return a released or new buffer with room for `nbytes`.
+
+        Its content is undefined, unless `data` is given to fill the buffer.
+        """
+        buffer = self.get_reusable_buffer(nbytes)
+        if buffer is not None:
+            self.free.remove(buffer)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, buffer)
+            # Orphan the old storage, so that drawing from it does not stall
+            GL.glBufferData(
+                GL.GL_ARRAY_BUFFER, self.sizes[buffer], None, GL.GL_DYNAMIC_DRAW
+            )
+            if data is not None:
+                GL.glBufferSubData(GL.GL_ARRAY_BUFFER, 0, data.nbytes, data)
+        else:
+            buffer = self.free.pop() if self.free else int(GL.glGenBuffers(1))
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, buffer)
+            GL.glBufferData(GL.GL_ARRAY_BUFFER, nbytes, data, GL.GL_DYNAMIC_DRAW)
+            self.sizes[buffer] = nbytes
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        return buffer
+
+    def release(self, buffer: int) -> None:
+        """Return the buffer to the pool, its data may be overwritten from now on."""
+        assert buffer in self.sizes and buffer not in self.free
+        self.free.append(buffer)
+
+    def delete_free(self) -> None:
+        """Delete all released buffers."""
+        if self.free:
+            GL.glDeleteBuffers(len(self.free), self.free)
+            for buffer in self.free:
+                del self.sizes[buffer]
+            self.free = []
+        logging.info(
+            "Point cloud buffers use %.1f MB of GPU memory.", self.bytes_in_use / 2**20
+        )
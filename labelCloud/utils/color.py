@@ -40,10 +40,22 @@ def colorize_points_with_height(
     )
     palette_len = len(palette) - 1
 
-    colors = np.zeros(points.shape)
-    for ind, height in enumerate(points[:, 2]):
-        colors[ind] = palette[round((height - z_min) / (z_max - z_min) * palette_len)]
-    return colors.astype(np.float32)
+    palette_ids = np.rint((points[:, 2] - z_min) / (z_max - z_min) * palette_len)
+    return palette[palette_ids.astype(np.int64)].astype(np.float32)
+
+
+def normalize_colors(colors: npt.NDArray) -> npt.NDArray[np.float32]:
+    """Return rgb colors between 0 and 1, byte colors (0 to 255) are scaled."""
+    if colors.dtype == np.uint8:
+        return colors.astype(np.float32) / 255
+    return colors.astype(np.float32, copy=False)
+
+
+def to_byte_colors(colors: npt.NDArray) -> npt.NDArray[np.uint8]:
+    """Return rgb colors as bytes (0 to 255), float colors (0 to 1) are scaled."""
+    if colors.dtype == np.uint8:
+        return colors
+    return np.rint(np.clip(colors, 0, 1) * 255).astype(np.uint8)
 
 
 def hex_to_rgb(hex: str) -> Color3f:
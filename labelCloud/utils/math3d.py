@@ -37,7 +37,9 @@ def radians_to_degrees(radians: float) -> float:
     return radians * (180 / np.pi)
 
 
-def rotate_around_x(point: Point3D, angle: float, degrees: bool = False) -> npt.NDArray:
+def rotate_around_x(
+    point: Union[Point3D, npt.NDArray], angle: float, degrees: bool = False
+) -> npt.NDArray:
     if degrees:
         angle = degrees_to_radians(angle)
     r_matrix = np.array(
@@ -94,6 +96,13 @@ def rotate_around_zyx(
     )
 
 
+def get_rotation_matrix(
+    x_angle: float, y_angle: float, z_angle: float, degrees: bool = False
+) -> npt.NDArray:
+    """Matrix of the rotation applied by `rotate_around_zyx`."""
+    return rotate_around_zyx(np.eye(3), x_angle, y_angle, z_angle, degrees)  # type: ignore
+
+
 def rotate_bbox_around_center(
     vertices: List[Point3D], center: Point3D, rotations: Rotations3D
 ) -> List[Point3D]:
@@ -201,3 +210,129 @@ def get_line_plane_intersection(
         return np.add(p0, u)
     else:
         return None  # The segment is parallel to plane.
+
+
+# CLIPPING PLANES
+def get_plane(point: npt.ArrayLike, normal: npt.ArrayLike) -> npt.NDArray:
+    """Plane (a, b, c, d) through the point, keeping the side the normal faces."""
+    normal = np.asarray(normal, dtype=np.float64) / np.linalg.norm(normal)
+    return np.append(normal, -np.dot(normal, point))
+
+
+def get_slab_planes(
+    center: npt.ArrayLike, normal: npt.ArrayLike, thickness: float
+) -> npt.NDArray:
+    """Two planes keeping the slab of the given thickness around the center."""
+    offset = np.asarray(normal, dtype=np.float64) / np.linalg.norm(normal)
+    offset *= thickness / 2
+    return np.array(
+        [
+            get_plane(np.subtract(center, offset), offset),
+            get_plane(np.add(center, offset), -offset),
+        ]
+    )
+
+
+def get_points_inside_planes(
+    points: npt.NDArray, planes: npt.NDArray
+) -> npt.NDArray[np.bool_]:
+    """Check which points are on the inner side of all planes (a, b, c, d)."""
+    return np.all(points @ planes[:, :3].T + planes[:, 3] >= 0, axis=1)
+
+
+# FRUSTUM
+def get_frustum_planes(
+    modelview: npt.ArrayLike, projection: npt.ArrayLike
+) -> npt.NDArray:
+    """Extract the six clipping planes (a, b, c, d) of the view frustum.
+
+    :param modelview: modelview matrix (column-major, as returned by OpenGL)
+    :param projection: projection matrix (column-major, as returned by OpenGL)
+    :return: 6x4 array of plane equations in model coordinates, with normals facing inside
+    """
+    clip = np.transpose(projection) @ np.transpose(modelview)
+    return np.array(
+        [
+            clip[3] + clip[0],  # left
+            clip[3] - clip[0],  # right
+            clip[3] + clip[1],  # bottom
+            clip[3] - clip[1],  # top
+            clip[3] + clip[2],  # near
+            clip[3] - clip[2],  # far
+        ]
+    )
+
+
+# TRANSFORMATION MATRICES
+def get_translation_matrix(translation: npt.ArrayLike) -> npt.NDArray:
+    """Homogeneous 4x4 translation matrix (row-major)."""
+    matrix = np.identity(4)
+    matrix[:3, 3] = translation
+    return matrix
+
+
+def get_perspective_matrix(
+    fovy: float, aspect: float, near: float, far: float
+) -> npt.NDArray:
+    """Perspective projection matrix (row-major), as set by `gluPerspective`."""
+    f = 1 / np.tan(np.deg2rad(fovy) / 2)
+    return np.array(
+        [
+            [f / aspect, 0, 0, 0],
+            [0, f, 0, 0],
+            [0, 0, (far + near) / (near - far), 2 * far * near / (near - far)],
+            [0, 0, -1, 0],
+        ]
+    )
+
+
+# PROJECTION
+def project_points(
+    points: npt.ArrayLike,
+    modelview: npt.ArrayLike,
+    projection: npt.ArrayLike,
+    viewport: npt.ArrayLike,
+) -> npt.NDArray:
+    """Transform model coordinates into window coordinates (like `gluProject`).
+
+    :param points: Nx3 array of points in model coordinates (float32 is faster)
+    :param modelview: modelview matrix (column-major, as returned by OpenGL)
+    :param projection: projection matrix (column-major, as returned by OpenGL)
+    :param viewport: x, y, width and height of the viewport
+    :return: Nx3 array of window x, y and depth; NaN for points behind the camera
+    """
+    points = np.asarray(points)
+    clip = (np.transpose(projection) @ np.transpose(modelview)).astype(points.dtype)
+    homogeneous = points @ clip[:, :3].T + clip[:, 3]
+    w = homogeneous[:, 3:]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ndc = np.where(w > 0, homogeneous[:, :3] / w, np.nan)
+    x, y, width, height = np.asarray(viewport, dtype=np.float64).tolist()
+    return np.column_stack(
+        [
+            x + (ndc[:, 0] + 1) * width / 2,
+            y + (ndc[:, 1] + 1) * height / 2,
+            (ndc[:, 2] + 1) / 2,
+        ]
+    )
+
+
+def unproject_point(
+    window_x: float,
+    window_y: float,
+    window_z: float,
+    modelview: npt.ArrayLike,
+    projection: npt.ArrayLike,
+    viewport: npt.ArrayLike,
+) -> Point3D:
+    """Transform window coordinates into model coordinates (like `gluUnProject`)."""
+    clip = np.transpose(projection) @ np.transpose(modelview)
+    x, y, width, height = np.asarray(viewport, dtype=np.float64).tolist()
+    ndc = [
+        (window_x - x) / width * 2 - 1,
+        (window_y - y) / height * 2 - 1,
+        window_z * 2 - 1,
+        1,
+    ]
+    point = np.linalg.solve(clip, ndc)
+    return tuple(point[:3] / point[3])  # type: ignore
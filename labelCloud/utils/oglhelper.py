@@ -1,16 +1,17 @@
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+import ctypes
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import numpy.typing as npt
 
 import OpenGL.GL as GL
-from OpenGL import GLU
 
 from . import math3d
-from ..definitions import BBOX_SIDES, Color4f, Point3D
+from ..definitions import BBOX_EDGES, BBOX_SIDES, Color3f, Color4f, Point3D
 
 if TYPE_CHECKING:
     from ..model import BBox, PointCloud
+    from ..view.camera import Camera
 
 
 DEVICE_PIXEL_RATIO: Optional[float] = (
@@ -18,38 +19,40 @@ DEVICE_PIXEL_RATIO: Optional[float] = (
 )
 
 
+def draw_vertex_array(
+    mode: int, vertices: Union[Sequence[Point3D], npt.NDArray], color: Color4f
+) -> None:
+    """Draw the vertices with a single call from a client-side vertex array."""
+    vertices = np.ascontiguousarray(vertices, dtype=np.float32).reshape((-1, 3))
+    if len(vertices) == 0:
+        return
+    GL.glColor4d(*color)
+    GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+    GL.glVertexPointer(3, GL.GL_FLOAT, 0, vertices)
+    GL.glDrawArrays(mode, 0, len(vertices))
+    GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+
+
 def draw_points(
     points: Union[List[Point3D], npt.NDArray],
     color: Color4f = (0, 1, 1, 1),
     point_size: int = 10,
 ) -> None:
-    GL.glColor4d(*color)
     GL.glPointSize(point_size)
-    GL.glBegin(GL.GL_POINTS)
-    for point in points:
-        GL.glVertex3d(*point)
-    GL.glEnd()
+    draw_vertex_array(GL.GL_POINTS, points, color)
 
 
 def draw_lines(
-    points: List[Point3D],
+    points: Union[List[Point3D], npt.NDArray],
     color: Color4f = (0, 1, 1, 1),
     line_width: int = 2,
 ) -> None:
-    GL.glColor4d(*color)
     GL.glLineWidth(line_width)
-    GL.glBegin(GL.GL_LINES)
-    for point in points:
-        GL.glVertex3d(*point)
-    GL.glEnd()
+    draw_vertex_array(GL.GL_LINES, points, color)
 
 
 def draw_triangles(vertices: List[Point3D], color: Color4f = (0, 1, 1, 1)) -> None:
-    GL.glColor4d(*color)
-    GL.glBegin(GL.GL_TRIANGLES)
-    for vertex in vertices:
-        GL.glVertex3d(*vertex)
-    GL.glEnd()
+    draw_vertex_array(GL.GL_TRIANGLES, vertices, color)
 
 
 def draw_rectangles(
@@ -57,12 +60,8 @@ def draw_rectangles(
     color: Color4f = (0, 1, 1, 1),
     line_width: int = 2,
 ) -> None:
-    GL.glColor4d(*color)
     GL.glLineWidth(line_width)
-    GL.glBegin(GL.GL_QUADS)
-    for vertex in vertices:
-        GL.glVertex3d(*vertex)
-    GL.glEnd()
+    draw_vertex_array(GL.GL_QUADS, vertices, color)
 
 
 def draw_cuboid(
@@ -84,75 +83,235 @@ def draw_cuboid(
 def draw_crosshair(
     cx: float, cy: float, cz: float, color: Color4f = (0, 1, 0, 1)
 ) -> None:
-    GL.glBegin(GL.GL_LINES)
-    GL.glColor4d(*color)
-    GL.glVertex3d(cx + 0.1, cy, cz)  # x-line
-    GL.glVertex3d(cx - 0.1, cy, cz)
-    GL.glVertex3d(cx, cy + 0.1, cz)  # y-line
-    GL.glVertex3d(cx, cy - 0.1, cz)
-    GL.glVertex3d(cx, cy, cz + 0.1)  # z-line
-    GL.glVertex3d(cx, cy, cz - 0.1)
-    GL.glEnd()
-
-
-def draw_xy_plane(pcd: "PointCloud") -> None:
-    mins, maxs = pcd.get_mins_maxs()
-    x_min, y_min = np.floor(mins[:2]).astype(int)
-    x_max, y_max = np.ceil(maxs[:2]).astype(int)
-    GL.glColor3d(0.5, 0.5, 0.5)
-    GL.glBegin(GL.GL_LINES)
-    for y in range(y_min, y_max + 1):  # x-lines
-        GL.glVertex3d(x_min, y, 0)
-        GL.glVertex3d(x_max, y, 0)
-
-    for x in range(x_min, x_max + 1):  # y-lines
-        GL.glVertex3d(x, y_min, 0)
-        GL.glVertex3d(x, y_max, 0)
-    GL.glEnd()
+    offsets = np.array(
+        [
+            [0.1, 0, 0],  # x-line
+            [-0.1, 0, 0],
+            [0, 0.1, 0],  # y-line
+            [0, -0.1, 0],
+            [0, 0, 0.1],  # z-line
+            [0, 0, -0.1],
+        ]
+    )
+    draw_vertex_array(GL.GL_LINES, offsets + [cx, cy, cz], color)
+
+
+def get_xy_plane_vertices(
+    x_min: int, y_min: int, x_max: int, y_max: int
+) -> npt.NDArray[np.float32]:
+    """Return the line vertices of a grid with 1 m spacing in the x-y-plane."""
+    ys = np.arange(y_min, y_max + 1)
+    xs = np.arange(x_min, x_max + 1)
+    x_lines = np.stack(
+        [
+            np.column_stack([np.full_like(ys, x_min), ys]),
+            np.column_stack([np.full_like(ys, x_max), ys]),
+        ],
+        axis=1,
+    )
+    y_lines = np.stack(
+        [
+            np.column_stack([xs, np.full_like(xs, y_min)]),
+            np.column_stack([xs, np.full_like(xs, y_max)]),
+        ],
+        axis=1,
+    )
+    lines = np.concatenate([x_lines, y_lines]).reshape((-1, 2))
+    return np.column_stack([lines, np.zeros(len(lines))]).astype(np.float32)
+
+
+class FloorGrid(object):
+    """Keeps the floor grid (x-y-plane) in a buffer, it is rebuilt if the bounds change.
+
+    The buffer belongs to the current OpenGL context, create a new grid for a new one.
+    """
+
+    def __init__(self) -> None:
+        self.vbo: Optional[int] = None
+        self.bounds: Optional[Tuple[int, int, int, int]] = None
+        self.vertex_count = 0
+
+    def update(self, pcd: "PointCloud") -> None:
+        mins, maxs = pcd.get_mins_maxs()
+        x_min, y_min = np.floor(mins[:2]).astype(int)
+        x_max, y_max = np.ceil(maxs[:2]).astype(int)
+        bounds = (int(x_min), int(y_min), int(x_max), int(y_max))
+        if bounds == self.bounds:
+            return
+
+        vertices = get_xy_plane_vertices(*bounds)
+        if self.vbo is None:
+            self.vbo = GL.glGenBuffers(1)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vbo)
+        GL.glBufferData(
+            GL.GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL.GL_STATIC_DRAW
+        )
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+        self.bounds, self.vertex_count = bounds, len(vertices)
+
+    def draw(self, pcd: "PointCloud") -> None:
+        self.update(pcd)
+        GL.glColor3d(0.5, 0.5, 0.5)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vbo)
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glVertexPointer(3, GL.GL_FLOAT, 0, None)
+        GL.glDrawArrays(GL.GL_LINES, 0, self.vertex_count)
+        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
+
+# Edges of a cube with side length 1 around the origin (vertex order of `BBox`)
+UNIT_CUBE_EDGES = np.array(
+    [[-0.5, -0.5, -0.5], [-0.5, 0.5, -0.5], [0.5, 0.5, -0.5], [0.5, -0.5, -0.5]]
+    + [[-0.5, -0.5, 0.5], [-0.5, 0.5, 0.5], [0.5, 0.5, 0.5], [0.5, -0.5, 0.5]]
+)[np.ravel(BBOX_EDGES)]
+BBOX_VERTEX = np.dtype([("color", np.uint8, 4), ("position", np.float32, 3)])
+
+
+def get_bbox_edge_vertices(
+    centers: npt.ArrayLike, dimensions: npt.ArrayLike, rotations: npt.ArrayLike
+) -> npt.NDArray:
+    """Transform the unit cube edges into the edges of each bounding box (N x 24 x 3).
+
+    :param centers: bounding box centers (N x 3)
+    :param dimensions: length, width and height of the bounding boxes (N x 3)
+    :param rotations: x, y and z rotations in degrees (N x 3)
+    """
+    matrices = np.array(
+        [
+            math3d.get_rotation_matrix(x_angle, y_angle, z_angle, degrees=True)
+            for x_angle, y_angle, z_angle in np.reshape(rotations, (-1, 3))
+        ]
+    ).reshape((-1, 3, 3)) * np.reshape(dimensions, (-1, 1, 3))
+    return np.einsum("nij,ej->nei", matrices, UNIT_CUBE_EDGES) + np.reshape(
+        centers, (-1, 1, 3)
+    )
+
+
+class BBoxRenderer(object):
+    """Draws the edges of all bounding boxes with a single call.
+
+    Each box is an instance of the unit cube edge mesh, transformed by its center,
+    dimensions and rotations and stored with its color in a buffer. Only the ranges
+    of boxes that changed since the last frame are transformed and uploaded again.
+    """
+
+    def __init__(self) -> None:
+        self.vbo: Optional[int] = None
+        self.capacity = 0  # number of boxes the buffer can hold
+        self.instances: List[tuple] = []  # center, dimensions, rotations and color
+
+    @staticmethod
+    def get_instance(bbox: "BBox", highlighted: bool = False) -> tuple:
+        color: Color3f = bbox.get_color(highlighted)
+        return (
+            bbox.get_center(),
+            bbox.get_dimensions(),
+            bbox.get_rotations(),
+            tuple(color),
+        )
+
+    def update(self, bboxes: List["BBox"], highlighted_id: int = -1) -> None:
+        instances = [
+            self.get_instance(bbox, index == highlighted_id)
+            for index, bbox in enumerate(bboxes)
+        ]
+        if self.vbo is None:
+            self.vbo = GL.glGenBuffers(1)
+        if len(instances) > self.capacity:  # grow the buffer, all boxes are uploaded
+            self.capacity = max(len(instances), 2 * self.capacity, 16)
+            GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vbo)
+            GL.glBufferData(
+                GL.GL_ARRAY_BUFFER,
+                self.capacity * len(UNIT_CUBE_EDGES) * BBOX_VERTEX.itemsize,
+                None,
+                GL.GL_DYNAMIC_DRAW,
+            )
+            self.instances = []
+
+        changed = [
+            index
+            for index, instance in enumerate(instances)
+            if index >= len(self.instances) or instance != self.instances[index]
+        ]
+        self.instances = instances
+        if not changed:
+            return
+
+        first, last = changed[0], changed[-1] + 1
+        centers, dimensions, rotations, colors = zip(*instances[first:last])
+        vertices = np.empty((last - first, len(UNIT_CUBE_EDGES)), dtype=BBOX_VERTEX)
+        vertices["position"] = get_bbox_edge_vertices(centers, dimensions, rotations)
+        vertices["color"][:, :, :3] = np.rint(np.clip(colors, 0, 1) * 255).reshape(
+            (-1, 1, 3)
+        )
+        vertices["color"][:, :, 3] = 255
+
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vbo)
+        GL.glBufferSubData(
+            GL.GL_ARRAY_BUFFER,
+            first * len(UNIT_CUBE_EDGES) * BBOX_VERTEX.itemsize,
+            vertices.nbytes,
+            vertices,
+        )
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
+
+    def draw(self, bboxes: List["BBox"], highlighted_id: int = -1) -> None:
+        """Draw the bounding boxes, the one at `highlighted_id` in the highlight color."""
+        self.update(bboxes, highlighted_id)
+        if not self.instances:
+            return
+
+        GL.glLineWidth(2)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vbo)
+        GL.glEnableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glEnableClientState(GL.GL_COLOR_ARRAY)
+        stride = BBOX_VERTEX.itemsize
+        GL.glColorPointer(4, GL.GL_UNSIGNED_BYTE, stride, None)
+        GL.glVertexPointer(
+            3, GL.GL_FLOAT, stride, ctypes.c_void_p(BBOX_VERTEX.fields["position"][1])  # type: ignore
+        )
+        GL.glDrawArrays(GL.GL_LINES, 0, len(self.instances) * len(UNIT_CUBE_EDGES))
+        GL.glDisableClientState(GL.GL_COLOR_ARRAY)
+        GL.glDisableClientState(GL.GL_VERTEX_ARRAY)
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, 0)
 
 
 # RAY PICKING
 
 
-def get_pick_ray(x: float, y: float, modelview, projection) -> Tuple[Point3D, Point3D]:
+def get_pick_ray(x: float, y: float, camera: "Camera") -> Tuple[Point3D, Point3D]:
     """
     :param x: rightward screen coordinate
     :param y: downward screen coordinate
-    :param modelview: modelview matrix
-    :param projection: projection matrix
+    :param camera: camera of the last frame
     :return: two points of the pick ray from the closest and furthest frustum
     """
     x *= DEVICE_PIXEL_RATIO  # type: ignore
     y *= DEVICE_PIXEL_RATIO  # type: ignore
 
-    viewport = GL.glGetIntegerv(GL.GL_VIEWPORT)
-    real_y = viewport[3] - y  # adjust for down-facing y positions
-
-    # Unproject screen coords into world coordsdd
-    p_front = GLU.gluUnProject(x, real_y, 0, modelview, projection, viewport)
-    p_back = GLU.gluUnProject(x, real_y, 1, modelview, projection, viewport)
-    return p_front, p_back
+    real_y = camera.viewport[3] - y  # adjust for down-facing y positions
+    return camera.get_pick_ray(x, real_y)
 
 
 def get_intersected_bboxes(
-    x: float, y: float, bboxes: List["BBox"], modelview, projection
+    x: float, y: float, bboxes: List["BBox"], camera: "Camera"
 ) -> Union[int, None]:
     """Checks if the picking ray intersects any bounding box from bboxes.
 
     :param x: x screen coordinate
     :param y: y screen coordinate
     :param bboxes: list of bounding boxes
-    :param modelview: modelview matrix
-    :param projection: projection matrix
+    :param camera: camera of the last frame
     :return: Id of the intersected bounding box or None if no bounding box is intersected
     """
     intersected_bboxes = {}  # bbox_index: bbox
     for index, bbox in enumerate(bboxes):
-        intersection_point, _ = get_intersected_sides(x, y, bbox, modelview, projection)
+        intersection_point, _ = get_intersected_sides(x, y, bbox, camera)
         if intersection_point is not None:
             intersected_bboxes[index] = intersection_point[2]
 
-    p0, p1 = get_pick_ray(x, y, modelview, projection)  # Calculate picking ray
+    p0, p1 = get_pick_ray(x, y, camera)  # Calculate picking ray
     if intersected_bboxes and (
         p0[2] >= p1[2]
     ):  # Calculate which intersected bbox is closer to screen
@@ -164,18 +323,17 @@ def get_intersected_bboxes(
 
 
 def get_intersected_sides(
-    x: float, y: float, bbox: "BBox", modelview, projection
+    x: float, y: float, bbox: "BBox", camera: "Camera"
 ) -> Union[Tuple[List[int], str], Tuple[None, None]]:
     """Checks if and with which side of the given bounding box the picking ray intersects.
 
     :param x: x screen coordinate
     :param y: y screen coordinate:
     :param bbox: bounding box to check for intersection
-    :param modelview: modelview matrix
-    :param projection: projection matrix
+    :param camera: camera of the last frame
     :return: intersection point, name of intersected side [top, bottom, right, back, left, front]
     """
-    p0, p1 = get_pick_ray(x, y, modelview, projection)  # Calculate picking ray
+    p0, p1 = get_pick_ray(x, y, camera)  # Calculate picking ray
     vertices = bbox.get_vertices()
 
     intersections: List[Tuple[list, str]] = (
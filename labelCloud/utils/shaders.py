@@ -0,0 +1,137 @@
+import logging
+from typing import Optional
+
+import numpy as np
+import numpy.typing as npt
+import OpenGL.GL as GL
+from OpenGL.GL import shaders
+
+PALETTE_SIZE = 128  # number of class ids that fit into the int8 segmentation labels
+
+# Blends the point colors with the color of their class (fixed-function transform)
+LABEL_VERTEX_SHADER = """
+#version 120
+
+uniform vec3 palette[128];
+uniform float mix_ratio;
+attribute float label;
+
+void main() {
+    vec3 label_color = palette[int(clamp(label, 0.0, 127.0))];
+    gl_FrontColor = vec4(mix(gl_Color.rgb, label_color, mix_ratio), gl_Color.a);
+    gl_Position = ftransform();
+    gl_ClipVertex = gl_ModelViewMatrix * gl_Vertex;  // for the user clip planes
+}
+"""
+LABEL_FRAGMENT_SHADER = """
+#version 120
+
+void main() {
+    gl_FragColor = gl_Color;
+}
+"""
+
+# Copies color and depth textures to the screen (vertices in clip coordinates)
+LAYER_VERTEX_SHADER = """
+#version 120
+
+varying vec2 texture_coords;
+
+void main() {
+    texture_coords = gl_Vertex.xy * 0.5 + 0.5;
+    gl_Position = vec4(gl_Vertex.xy, 0.0, 1.0);
+}
+"""
+LAYER_FRAGMENT_SHADER = """
+#version 120
+
+uniform sampler2D color_texture;
+uniform sampler2D depth_texture;
+varying vec2 texture_coords;
+
+void main() {
+    gl_FragColor = texture2D(color_texture, texture_coords);
+    gl_FragDepth = texture2D(depth_texture, texture_coords).r;
+}
+"""
+
+
+def compile_program(vertex_shader: str, fragment_shader: str) -> Optional[int]:
+    """Compile the program in the current context, returns None if it failed."""
+    try:
+        return shaders.compileProgram(
+            shaders.compileShader(vertex_shader, GL.GL_VERTEX_SHADER),
+            shaders.compileShader(fragment_shader, GL.GL_FRAGMENT_SHADER),
+            validate=False,
+        )
+    except (RuntimeError, GL.GLError) as exception:
+        logging.warning("Could not compile shader program (%s).", exception)
+        return None
+
+
+class LabelShader(object):
+    """Colors points by the class id in their `label` attribute on the GPU.
+
+    The class colors and the mix ratio are uniforms, which are only updated if they
+    changed. The program belongs to the current OpenGL context; if it can not be
+    compiled, `program` is None and the point cloud blends the colors on the CPU.
+    """
+
+    def __init__(self) -> None:
+        self.program: Optional[int] = None
+        self.palette: Optional[npt.NDArray[np.float32]] = None
+        self.mix_ratio: Optional[float] = None
+        self.program = compile_program(LABEL_VERTEX_SHADER, LABEL_FRAGMENT_SHADER)
+        if self.program is None:
+            logging.warning("Label colors are blended on the CPU instead.")
+            return
+        self.label_location = GL.glGetAttribLocation(self.program, "label")
+        self.palette_location = GL.glGetUniformLocation(self.program, "palette")
+        self.mix_ratio_location = GL.glGetUniformLocation(self.program, "mix_ratio")
+
+    @property
+    def is_available(self) -> bool:
+        return self.program is not None
+
+    def bind(
+        self, label_vbo: int, palette: npt.NDArray[np.float32], mix_ratio: float
+    ) -> None:
+        """Use the program with the int8 labels of `label_vbo` as attribute."""
+        assert self.program is not None
+        GL.glUseProgram(self.program)
+        if self.palette is None or not np.array_equal(palette, self.palette):
+            GL.glUniform3fv(self.palette_location, PALETTE_SIZE, palette)
+            self.palette = palette
+        if mix_ratio != self.mix_ratio:
+            GL.glUniform1f(self.mix_ratio_location, mix_ratio)
+            self.mix_ratio = mix_ratio
+
+        GL.glBindBuffer(GL.GL_ARRAY_BUFFER, label_vbo)
+        GL.glEnableVertexAttribArray(self.label_location)
+        GL.glVertexAttribPointer(
+            self.label_location, 1, GL.GL_BYTE, GL.GL_FALSE, 1, None
+        )
+
+    def release(self) -> None:
+        GL.glDisableVertexAttribArray(self.label_location)
+        GL.glUseProgram(0)
+
+
+class LayerShader(object):
+    """Draws a color texture with its depth texture, as if it was rendered directly.
+
+    The textures are bound to the texture units 0 (color) and 1 (depth).
+    """
+
+    def __init__(self) -> None:
+        self.program = compile_program(LAYER_VERTEX_SHADER, LAYER_FRAGMENT_SHADER)
+        if self.program is None:
+            return
+        GL.glUseProgram(self.program)
+        GL.glUniform1i(GL.glGetUniformLocation(self.program, "color_texture"), 0)
+        GL.glUniform1i(GL.glGetUniformLocation(self.program, "depth_texture"), 1)
+        GL.glUseProgram(0)
+
+    @property
+    def is_available(self) -> bool:
+        return self.program is not None
@@ -0,0 +1,63 @@
+from typing import TYPE_CHECKING, Tuple
+
+import numpy as np
+import numpy.typing as npt
+import OpenGL.GL as GL
+
+from ..definitions import Point3D
+from ..utils import math3d
+
+if TYPE_CHECKING:
+    from ..model import PointCloud
+
+
+class Camera(object):
+    """Modelview and projection matrices and the viewport of the point cloud viewer.
+
+    The matrices are computed with numpy and loaded into OpenGL, so picking,
+    unprojection and culling never have to read them back. They are stored
+    column-major (as `glGetDoublev` returns them) for OpenGL and `math3d`.
+    """
+
+    FIELD_OF_VIEW = 45.0  # vertical, in degrees
+
+    def __init__(self, near_plane: float, far_plane: float) -> None:
+        self.near_plane = near_plane
+        self.far_plane = far_plane
+        self.viewport = np.array([0, 0, 1, 1])  # x, y, width and height
+        self.projection: npt.NDArray = np.identity(4)
+        self.modelview: npt.NDArray = np.identity(4)
+
+    def set_viewport(self, width: int, height: int) -> None:
+        self.viewport = np.array([0, 0, width, height])
+        self.projection = math3d.get_perspective_matrix(
+            Camera.FIELD_OF_VIEW,
+            width / max(height, 1),
+            self.near_plane,
+            self.far_plane,
+        ).T
+
+    def set_pointcloud(self, pointcloud: "PointCloud") -> None:
+        """Look at the point cloud with its current rotation and translation."""
+        self.modelview = pointcloud.get_model_matrix().T
+
+    def load(self) -> None:
+        """Set viewport and matrices in OpenGL, leaving the modelview matrix active."""
+        GL.glViewport(*self.viewport)
+        GL.glMatrixMode(GL.GL_PROJECTION)
+        GL.glLoadMatrixd(self.projection)
+        GL.glMatrixMode(GL.GL_MODELVIEW)
+        GL.glLoadMatrixd(self.modelview)
+
+    def get_frustum_planes(self) -> npt.NDArray:
+        return math3d.get_frustum_planes(self.modelview, self.projection)
+
+    def unproject(self, x: float, y: float, z: float) -> Point3D:
+        """Transform window coordinates (y upwards, depth 0 to 1) into the model."""
+        return math3d.unproject_point(
+            x, y, z, self.modelview, self.projection, self.viewport
+        )
+
+    def get_pick_ray(self, x: float, y: float) -> Tuple[Point3D, Point3D]:
+        """Points on the near and far plane behind the window coordinates."""
+        return self.unproject(x, y, 0), self.unproject(x, y, 1)
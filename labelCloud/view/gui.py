@@ -115,6 +115,16 @@ STYLESHEET = """
 
 
 class GUI(QtWidgets.QMainWindow):
+    REPAINT_EVENTS = {
+        QEvent.KeyPress,
+        QEvent.KeyRelease,
+        QEvent.MouseMove,
+        QEvent.MouseButtonPress,
+        QEvent.MouseButtonRelease,
+        QEvent.MouseButtonDblClick,
+        QEvent.Wheel,
+    }
+
     def __init__(self, control: "Controller") -> None:
         super(GUI, self).__init__()
         uic.loadUi(
@@ -157,6 +167,11 @@ class GUI(QtWidgets.QMainWindow):
         self.act_align_pcd: QtWidgets.QAction
         self.act_change_settings: QtWidgets.QAction
 
+        # Clipping
+        self.act_clip_height_band: QtWidgets.QAction
+        self.act_clip_box_slab: QtWidgets.QAction
+        self.act_clip_cut_plane: QtWidgets.QAction
+
         # STATUS BAR
         self.status_bar: QtWidgets.QStatusBar
         self.status_manager = StatusManager(self.status_bar)
@@ -242,6 +257,9 @@ class GUI(QtWidgets.QMainWindow):
 
         self.label_volume: QtWidgets.QLabel
 
+        # Dialog to jump to a point cloud (see `ask_custom_index`)
+        self.input_pcd: Optional[QInputDialog] = None
+
         self.controller = control
 
         # Connect all events to functions
@@ -262,11 +280,26 @@ class GUI(QtWidgets.QMainWindow):
         # Connect with controller
         self.controller.startup(self)
 
-        # Start event cycle
+        # Start event cycle, frames are only rendered on request (see `request_repaint`)
         self.timer = QtCore.QTimer(self)
-        self.timer.setInterval(20)  # period, in milliseconds
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(20)  # minimum period between frames, in milliseconds
         self.timer.timeout.connect(self.controller.loop_gui)
-        self.timer.start()
+        self.request_repaint()
+
+        # Report the number of rendered frames per second in the status bar
+        self.fps_timer = QtCore.QTimer(self)
+        self.fps_timer.setInterval(1000)
+        self.fps_timer.timeout.connect(
+            lambda: self.status_manager.set_fps(self.gl_widget.pop_frame_count())
+        )
+        if config.getboolean("USER_INTERFACE", "show_fps", fallback=False):
+            self.fps_timer.start()
+
+    def request_repaint(self) -> None:
+        """Schedules a frame, requests within the timer interval are combined."""
+        if not self.timer.isActive():
+            self.timer.start()
 
     # Event connectors
     def connect_events(self) -> None:
@@ -396,6 +429,14 @@ class GUI(QtWidgets.QMainWindow):
         self.act_save_perspective.toggled.connect(set_keep_perspective)
         self.act_align_pcd.toggled.connect(self.controller.align_mode.change_activation)
         self.act_change_settings.triggered.connect(self.show_settings_dialog)
+        self.act_clip_height_band.toggled.connect(self.change_clip_height_band)
+        self.act_clip_box_slab.toggled.connect(self.change_clip_box_slab)
+        self.act_clip_cut_plane.toggled.connect(self.change_clip_cut_plane)
+
+        # Auto-repeating buttons change the boxes without further input events
+        for button in self.findChildren(QtWidgets.QAbstractButton):
+            if button.autoRepeat():
+                button.pressed.connect(self.request_repaint)
 
     def set_checkbox_states(self) -> None:
         self.act_propagate_labels.setChecked(
@@ -416,6 +457,12 @@ class GUI(QtWidgets.QMainWindow):
 
     # Collect, filter and forward events to viewer
     def eventFilter(self, event_object, event) -> bool:
+        # Any user input can change the scene, so a new frame is rendered afterwards
+        if event.type() in GUI.REPAINT_EVENTS and (
+            event.type() != QEvent.MouseMove or event_object == self.gl_widget
+        ):
+            self.request_repaint()
+
         # Keyboard Events
         if (event.type() == QEvent.KeyPress) and event_object in [
             self,
@@ -439,6 +486,11 @@ class GUI(QtWidgets.QMainWindow):
         ):
             self.controller.mouse_double_clicked(event)
             return True
+        elif (event.type() == QEvent.ToolTip) and (
+            event_object == self.progressbar_pcds
+        ):
+            self.show_progress_tooltip(event)
+            return True
         elif (event.type() == QEvent.MouseButtonPress) and (
             event_object == self.gl_widget
         ):
@@ -454,7 +506,9 @@ class GUI(QtWidgets.QMainWindow):
     def closeEvent(self, a0: QtGui.QCloseEvent) -> None:
         logging.info("Closing window after saving ...")
         self.controller.save()
+        self.controller.pcd_manager.stop_manifest_scan()
         self.timer.stop()
+        self.fps_timer.stop()
         a0.accept()
 
     def show_settings_dialog(self) -> None:
@@ -518,10 +572,25 @@ class GUI(QtWidgets.QMainWindow):
     def init_progress(self, min_value, max_value):
         self.progressbar_pcds.setMinimum(min_value)
         self.progressbar_pcds.setMaximum(max_value)
+        if self.input_pcd is not None:  # grows while the folder is enumerated
+            self.input_pcd.setIntMaximum(max_value)
 
     def update_progress(self, value) -> None:
         self.progressbar_pcds.setValue(value)
 
+    def show_progress_tooltip(self, event: QtGui.QHelpEvent) -> None:
+        """Shows the metadata of the point cloud below the cursor."""
+        pcds = self.controller.pcd_manager.pcds
+        if not pcds:
+            return
+        ratio = event.pos().x() / max(self.progressbar_pcds.width(), 1)
+        pcd_index = min(max(int(ratio * len(pcds)), 0), len(pcds) - 1)
+        QtWidgets.QToolTip.showText(
+            event.globalPos(),
+            f"{pcd_index}: {self.controller.pcd_manager.get_pcd_info(pcd_index)}",
+            self.progressbar_pcds,
+        )
+
     def update_current_class_dropdown(self) -> None:
         self.controller.pcd_manager.populate_class_dropdown()
 
@@ -664,8 +733,42 @@ class GUI(QtWidgets.QMainWindow):
         self.update_dialog_pcd(0)
 
     def update_dialog_pcd(self, value: int) -> None:
-        pcd_path = self.controller.pcd_manager.pcds[value]
-        self.input_pcd.setLabelText(f"Insert Point Cloud number: {pcd_path.name}")
+        if self.input_pcd is None:
+            return
+        pcd_info = self.controller.pcd_manager.get_pcd_info(value)
+        self.input_pcd.setLabelText(f"Insert Point Cloud number: {pcd_info}")
+
+    def change_clip_height_band(self, checked: bool) -> None:
+        band = None
+        if checked:
+            pointcloud = self.controller.pcd_manager.pointcloud
+            z_min, z_max = pointcloud.pcd_mins[2], pointcloud.pcd_maxs[2]  # type: ignore
+            text, ok = QInputDialog.getText(
+                self,
+                "labelCloud",
+                "Only show points between the heights (min, max):",
+                text=f"{z_min:.2f}, {z_max:.2f}",
+            )
+            try:
+                band = tuple(sorted(float(value) for value in text.split(",")))
+            except ValueError:
+                band = None
+            if not ok or len(band or ()) != 2:
+                self.act_clip_height_band.setChecked(False)
+                return
+        self.controller.clip_manager.set_height_band(band)  # type: ignore
+        self.request_repaint()
+
+    def change_clip_box_slab(self, checked: bool) -> None:
+        self.controller.clip_manager.set_box_slab(checked)
+        self.request_repaint()
+
+    def change_clip_cut_plane(self, checked: bool) -> None:
+        if checked:
+            self.controller.clip_manager.cut_at_cursor()
+        else:
+            self.controller.clip_manager.remove_cut_plane()
+        self.request_repaint()
 
     def change_label_color(self):
         bbox = self.controller.bbox_controller.get_active_bbox()
@@ -689,9 +792,7 @@ class GUI(QtWidgets.QMainWindow):
             return
 
         try:
-            path = Path(file_name)
-            handler = BasePointCloudHandler.get_handler(path.suffix)
-            handler.write_point_cloud(path, pointcloud)
+            pointcloud.to_file(Path(file_name))
         except Exception as e:
             msg = QMessageBox()
             msg.setWindowTitle("Failed to save a point cloud")
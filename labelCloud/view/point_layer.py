@@ -0,0 +1,137 @@
+import logging
+from typing import Callable, Hashable, Optional, Tuple
+
+import OpenGL.GL as GL
+
+from ..utils import oglhelper
+from ..utils.shaders import LayerShader
+
+# Full screen quad in clip coordinates
+SCREEN_QUAD = [(-1, -1, 0), (1, -1, 0), (-1, 1, 0), (1, 1, 0)]
+
+
+class PointLayer(object):
+    """Offscreen color and depth of the drawn point cloud, reused while it is unchanged.
+
+    Frames that only change overlays (crosshair, highlighted sides, boxes) copy the
+    layer to the screen instead of drawing all points again. Its depth is copied as
+    well, so that the overlays are still hidden behind the points. Without
+    framebuffer support the points are drawn directly.
+    """
+
+    def __init__(self, default_framebuffer: int = 0) -> None:
+        self.shader = LayerShader()
+        self.default_framebuffer = default_framebuffer  # of the widget
+        self.framebuffer: Optional[int] = None
+        self.color_texture: Optional[int] = None
+        self.depth_texture: Optional[int] = None
+        self.size: Tuple[int, int] = (0, 0)
+        self.state: Optional[Hashable] = None  # of the cached points
+        self.is_available = self.shader.is_available and bool(GL.glGenFramebuffers)
+
+    def create_textures(self, width: int, height: int) -> None:
+        self.delete()
+        self.size = (int(width), int(height))
+        self.color_texture, self.depth_texture = GL.glGenTextures(2)
+        for texture, internal_format, data_format, data_type in [
+            (self.color_texture, GL.GL_RGBA8, GL.GL_RGBA, GL.GL_UNSIGNED_BYTE),
+            (
+                self.depth_texture,
+                GL.GL_DEPTH_COMPONENT24,
+                GL.GL_DEPTH_COMPONENT,
+                GL.GL_UNSIGNED_INT,
+            ),
+        ]:
+            GL.glBindTexture(GL.GL_TEXTURE_2D, texture)
+            GL.glTexParameteri(
+                GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MIN_FILTER, GL.GL_NEAREST
+            )
+            GL.glTexParameteri(
+                GL.GL_TEXTURE_2D, GL.GL_TEXTURE_MAG_FILTER, GL.GL_NEAREST
+            )
+            GL.glTexImage2D(
+                GL.GL_TEXTURE_2D,
+                0,
+                internal_format,
+                width,
+                height,
+                0,
+                data_format,
+                data_type,
+                None,
+            )
+        GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
+
+        self.framebuffer = GL.glGenFramebuffers(1)
+        GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, self.framebuffer)
+        GL.glFramebufferTexture2D(
+            GL.GL_FRAMEBUFFER,
+            GL.GL_COLOR_ATTACHMENT0,
+            GL.GL_TEXTURE_2D,
+            self.color_texture,
+            0,
+        )
+        GL.glFramebufferTexture2D(
+            GL.GL_FRAMEBUFFER,
+            GL.GL_DEPTH_ATTACHMENT,
+            GL.GL_TEXTURE_2D,
+            self.depth_texture,
+            0,
+        )
+        status = GL.glCheckFramebufferStatus(GL.GL_FRAMEBUFFER)
+        GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, self.default_framebuffer)
+        if status != GL.GL_FRAMEBUFFER_COMPLETE:
+            logging.warning(
+                "Point layer framebuffer is incomplete (%s), points are drawn directly.",
+                status,
+            )
+            self.delete()
+            self.is_available = False
+
+    def delete(self) -> None:
+        if self.framebuffer is not None:
+            GL.glDeleteFramebuffers(1, [self.framebuffer])
+            GL.glDeleteTextures(2, [self.color_texture, self.depth_texture])
+        self.framebuffer = self.color_texture = self.depth_texture = None
+        self.state = None
+
+    def draw(
+        self,
+        state: Hashable,
+        draw_points: Callable[[], None],
+        width: int,
+        height: int,
+    ) -> None:
+        """Draw the points into the layer if the `state` changed, then copy it."""
+        if not self.is_available:
+            draw_points()
+            return
+        if self.size != (width, height) or self.framebuffer is None:
+            self.create_textures(width, height)
+            if not self.is_available:
+                draw_points()
+                return
+
+        if state != self.state:
+            GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, self.framebuffer)
+            GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
+            draw_points()
+            GL.glBindFramebuffer(GL.GL_FRAMEBUFFER, self.default_framebuffer)
+            self.state = state
+
+        # Copy color and depth by drawing a textured screen quad
+        GL.glActiveTexture(GL.GL_TEXTURE1)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, self.depth_texture)
+        GL.glActiveTexture(GL.GL_TEXTURE0)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, self.color_texture)
+        GL.glUseProgram(self.shader.program)
+        GL.glDisable(GL.GL_BLEND)
+        GL.glDepthFunc(GL.GL_ALWAYS)
+        oglhelper.draw_vertex_array(GL.GL_TRIANGLE_STRIP, SCREEN_QUAD, (1, 1, 1, 1))
+        GL.glDepthFunc(GL.GL_LESS)
+        GL.glEnable(GL.GL_BLEND)
+        GL.glUseProgram(0)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
+        GL.glActiveTexture(GL.GL_TEXTURE1)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
+        GL.glActiveTexture(GL.GL_TEXTURE0)
@@ -25,6 +25,9 @@ class StatusManager:
 
         self.msg_context = Context.DEFAULT
 
+        # Permanent frame rate label, only added if it is used
+        self.fps_label: Optional[QtWidgets.QLabel] = None
+
     def set_mode(self, mode: Mode) -> None:
         self.mode_label.setText(mode.value)
 
@@ -33,6 +36,23 @@ class StatusManager:
             self.message_label.setText(message)
             self.msg_context = context
 
+    def set_fps(self, fps: int) -> None:
+        if self.fps_label is None:
+            self.fps_label = QtWidgets.QLabel()
+            self.fps_label.setStyleSheet("font-size: 14px;")
+            self.status_bar.addPermanentWidget(self.fps_label)
+        self.fps_label.setText(f"{fps} FPS")
+
+    def set_progress(self, message: str, progress: float) -> None:
+        """Shows the progress of a task that blocks the event loop."""
+        if QtCore.QThread.currentThread() is not self.status_bar.thread():
+            return  # widgets must only be updated from the GUI thread
+        if progress < 1:
+            self.set_message(f"{message} ({progress:.0%}) ...")
+        else:
+            self.clear_message(Context.DEFAULT)
+        self.message_label.repaint()  # the event loop can not process the update
+
     def clear_message(self, context: Optional[Context] = None):
         if context == None or context == self.msg_context:
             self.msg_context = Context.DEFAULT
@@ -1,20 +1,25 @@
 import logging
+import time
 from contextlib import contextmanager
 from typing import Optional, Tuple, Union
 
 import numpy as np
 import numpy.typing as npt
 import OpenGL.GL as GL
-from OpenGL import GLU
 from PyQt5 import QtGui, QtOpenGL
 
 from ..control.alignmode import AlignMode
 from ..control.bbox_controller import BoundingBoxController
+from ..control.clipping import ClipManager
 from ..control.config_manager import config
 from ..control.drawing_manager import DrawingManager
 from ..control.pcd_manager import PointCloudManger
 from ..definitions.types import Color4f, Point2D
-from ..utils import oglhelper
+from ..utils import math3d, oglhelper
+from ..utils.buffer_pool import BufferPool
+from ..utils.shaders import LabelShader
+from .camera import Camera
+from .point_layer import PointLayer
 
 
 @contextmanager
@@ -30,6 +35,9 @@ def ignore_depth_mask():
 class GLWidget(QtOpenGL.QGLWidget):
     NEAR_PLANE = config.getfloat("USER_INTERFACE", "near_plane")
     FAR_PLANE = config.getfloat("USER_INTERFACE", "far_plane")
+    MOTION_TIMEOUT = 0.15  # seconds after the last camera change to draw all points
+    PICK_RADIUS = 15  # pixels around the cursor that are searched for points
+    CORRECTION_RADIUS = 4  # pixels around the cursor to snap to the closest point
 
     def __init__(self, parent=None) -> None:
         QtOpenGL.QGLWidget.__init__(self, parent)
@@ -37,8 +45,11 @@ class GLWidget(QtOpenGL.QGLWidget):
             True
         )  # mouseMoveEvent is called also without button pressed
 
-        self.modelview: Optional[npt.NDArray] = None
-        self.projection: Optional[npt.NDArray] = None
+        self.camera = Camera(GLWidget.NEAR_PLANE, GLWidget.FAR_PLANE)
+        self.last_camera: Optional[Tuple[float, ...]] = None
+        self.last_camera_motion = 0.0
+        self.decimated = False  # if the last frame only showed a part of the points
+        self.frame_count = 0  # frames rendered since the last `pop_frame_count`
         self.DEVICE_PIXEL_RATIO: float = (
             self.devicePixelRatioF()
         )  # 1 = normal; 2 = retina display
@@ -48,12 +59,18 @@ class GLWidget(QtOpenGL.QGLWidget):
 
         self.pcd_manager: PointCloudManger = None  # type: ignore
         self.bbox_controller: BoundingBoxController = None  # type: ignore
+        self.clip_manager: Optional[ClipManager] = None
 
         # Objects to be drawn
         self.crosshair_pos: Point2D = (0, 0)
         self.crosshair_col: Color4f = (0, 1, 0, 1)
         self.selected_side_vertices: npt.NDArray = np.array([])
         self.drawing_mode: DrawingManager = None  # type: ignore
+        self.floor_grid = oglhelper.FloorGrid()
+        self.bbox_renderer = oglhelper.BBoxRenderer()
+        self.label_shader: Optional[LabelShader] = None
+        self.buffer_pool: Optional[BufferPool] = None  # point cloud buffers
+        self.point_layer: Optional[PointLayer] = None  # cached image of the points
         self.align_mode: Union[AlignMode, None] = None
 
     def set_pointcloud_controller(self, pcd_manager: PointCloudManger) -> None:
@@ -75,33 +92,57 @@ class GLWidget(QtOpenGL.QGLWidget):
         GL.glBlendFunc(GL.GL_SRC_ALPHA, GL.GL_ONE_MINUS_SRC_ALPHA)
         logging.info("Intialized widget.")
 
+        # Buffers of previous contexts are invalid
+        self.floor_grid = oglhelper.FloorGrid()
+        self.bbox_renderer = oglhelper.BBoxRenderer()
+        self.label_shader = LabelShader()
+        self.buffer_pool = BufferPool()
+        # QGLWidget has no defaultFramebufferObject(), the binding is read only once
+        self.point_layer = PointLayer(int(GL.glGetIntegerv(GL.GL_FRAMEBUFFER_BINDING)))
+
         # Must be written again, due to buffer clearing
-        self.pcd_manager.pointcloud.create_buffers()  # type: ignore
+        self.pcd_manager.pointcloud.create_buffers(self.buffer_pool)  # type: ignore
 
     def resizeGL(self, width, height) -> None:
         logging.info("Resized widget.")
-        GL.glViewport(0, 0, width, height)
-        GL.glMatrixMode(GL.GL_PROJECTION)
-        GL.glLoadIdentity()
-        aspect = width / float(height)
-
-        GLU.gluPerspective(45.0, aspect, GLWidget.NEAR_PLANE, GLWidget.FAR_PLANE)
-        GL.glMatrixMode(GL.GL_MODELVIEW)
+        self.camera.set_viewport(width, height)
 
     def paintGL(self) -> None:
         GL.glClear(GL.GL_COLOR_BUFFER_BIT | GL.GL_DEPTH_BUFFER_BIT)
-        GL.glPushMatrix()  # push the current matrix to the current stack
-
-        # Draw point cloud
-        self.pcd_manager.pointcloud.draw_pointcloud()  # type: ignore
 
-        # Get actual matrices for click unprojection
-        self.modelview = GL.glGetDoublev(GL.GL_MODELVIEW_MATRIX)
-        self.projection = GL.glGetDoublev(GL.GL_PROJECTION_MATRIX)
+        # Matrices for drawing, click unprojection and culling
+        pointcloud = self.pcd_manager.pointcloud
+        self.camera.set_pointcloud(pointcloud)  # type: ignore
+        self.camera.load()
+
+        # Large point clouds are shown while their vertices are uploaded
+        if not pointcloud.is_uploaded:  # type: ignore
+            pointcloud.upload_vertices()  # type: ignore
+
+        # Draw visible point cloud chunks (decimated while the camera is moving),
+        # they are only drawn again if the camera or the points changed
+        camera_moving = self.is_camera_moving()
+        self.decimated = camera_moving or not pointcloud.is_uploaded  # type: ignore
+        clip_planes = self.get_clip_planes()
+        self.point_layer.draw(  # type: ignore
+            (
+                self.camera.modelview.tobytes(),
+                self.camera.projection.tobytes(),
+                clip_planes.tobytes(),
+                pointcloud.get_draw_state(camera_moving),  # type: ignore
+            ),
+            lambda: pointcloud.draw_pointcloud(  # type: ignore
+                decimated=camera_moving,
+                frustum_planes=self.camera.get_frustum_planes(),
+                label_shader=self.label_shader,
+                clip_planes=clip_planes,
+            ),
+            *self.camera.viewport[2:],
+        )
 
         with ignore_depth_mask():  # Do not write decoration and preview elements in depth buffer
             if config.getboolean("USER_INTERFACE", "show_floor"):
-                oglhelper.draw_xy_plane(self.pcd_manager.pointcloud)  # type: ignore
+                self.floor_grid.draw(self.pcd_manager.pointcloud)  # type: ignore
 
             # Draw crosshair/ cursor in 3D world
             if self.crosshair_pos:
@@ -121,17 +162,75 @@ class GLWidget(QtOpenGL.QGLWidget):
                     self.selected_side_vertices, color=(0, 1, 0, 0.3)
                 )
 
-        # Draw active bbox
-        if self.bbox_controller.has_active_bbox():
-            self.bbox_controller.get_active_bbox().draw_bbox(highlighted=True)  # type: ignore
-            if config.getboolean("USER_INTERFACE", "show_orientation"):
-                self.bbox_controller.get_active_bbox().draw_orientation()  # type: ignore
-
-        # Draw labeled bboxes
-        for bbox in self.bbox_controller.bboxes:  # type: ignore
-            bbox.draw_bbox()
+        # Draw labeled bboxes, the active one highlighted
+        self.bbox_renderer.draw(
+            self.bbox_controller.bboxes,
+            highlighted_id=self.bbox_controller.active_bbox_id,
+        )
+        if self.bbox_controller.has_active_bbox() and config.getboolean(
+            "USER_INTERFACE", "show_orientation"
+        ):
+            self.bbox_controller.get_active_bbox().draw_orientation()  # type: ignore
+
+        self.frame_count += 1
+
+    def pop_frame_count(self) -> int:
+        frame_count, self.frame_count = self.frame_count, 0
+        return frame_count
+
+    def is_camera_moving(self) -> bool:
+        """Checks if the point cloud was rotated or translated in the last frames."""
+        pointcloud = self.pcd_manager.pointcloud
+        camera = (*pointcloud.get_rotations(), *pointcloud.get_translation())  # type: ignore
+        now = time.monotonic()
+        if camera != self.last_camera:
+            self.last_camera = camera
+            self.last_camera_motion = now
+        return now - self.last_camera_motion < GLWidget.MOTION_TIMEOUT
+
+    def get_clip_planes(self) -> npt.NDArray:
+        """Planes (n x 4) in point cloud coordinates, outside of which points are hidden."""
+        if self.clip_manager is None:
+            return np.empty((0, 4))
+        return self.clip_manager.get_planes()
+
+    def get_cursor_depth(self, x: float, y: float, correction: bool = False) -> float:
+        """Window depth of the points at the cursor, found on the CPU by the picker.
+
+        Uses the closest point under the cursor (or within `CORRECTION_RADIUS` with
+        correction), else the median depth of the points within `PICK_RADIUS`.
+        """
+        pointcloud = self.pcd_manager.pointcloud
+        if pointcloud is None or pointcloud.picker is None:
+            return 1
+        clip_planes = self.get_clip_planes()
+
+        def get_window_coords(radius: float) -> npt.NDArray:
+            return pointcloud.picker.get_window_coords(  # type: ignore
+                x,
+                y,
+                radius,
+                self.camera.modelview,
+                self.camera.projection,
+                self.camera.viewport,
+                clip_planes,
+            )
 
-        GL.glPopMatrix()  # restore the previous modelview matrix
+        # Points are drawn as squares of the point size
+        half_size = pointcloud.point_size / 2
+        window_coords = get_window_coords(
+            max(GLWidget.CORRECTION_RADIUS, half_size * np.sqrt(2))
+        )
+        offsets = np.abs(window_coords[:, :2] - [x, y])
+        depths = window_coords[:, 2]
+        under_cursor = np.max(offsets, axis=1) <= half_size
+        if not np.any(under_cursor):  # search the wider (and slower) radius
+            depths = get_window_coords(GLWidget.PICK_RADIUS)[:, 2]
+            return float(np.median(depths)) if len(depths) else 1
+        if correction:
+            near_cursor = np.hypot(*offsets.T) <= GLWidget.CORRECTION_RADIUS
+            return float(np.min(depths[near_cursor | under_cursor]))
+        return float(np.min(depths[under_cursor]))
 
     # Translates the 2D cursor position from screen plane into 3D world space coordinates
     def get_world_coords(
@@ -140,61 +239,10 @@ class GLWidget(QtOpenGL.QGLWidget):
         x *= self.DEVICE_PIXEL_RATIO  # For fixing mac retina bug
         y *= self.DEVICE_PIXEL_RATIO
 
-        # Stored projection matrices are taken from loop
-        viewport = GL.glGetIntegerv(GL.GL_VIEWPORT)
-        real_y = viewport[3] - y  # adjust for down-facing y positions
+        # Camera matrices are taken from the last frame
+        real_y = self.camera.viewport[3] - y  # adjust for down-facing y positions
 
         if z is None:
-            buffer_size = 21
-            center = buffer_size // 2 + 1
-            depths = GL.glReadPixels(
-                x - center + 1,
-                real_y - center + 1,
-                buffer_size,
-                buffer_size,
-                GL.GL_DEPTH_COMPONENT,
-                GL.GL_FLOAT,
-            )
-            z = depths[center][center]  # Read selected pixel from depth buffer
+            z = self.get_cursor_depth(x, real_y, correction)
 
-            if z == 1:
-                z = depth_smoothing(depths, center)
-            elif correction:
-                z = depth_min(depths, center)
-
-        mod_x, mod_y, mod_z = GLU.gluUnProject(
-            x, real_y, z, self.modelview, self.projection, viewport
-        )
-        return mod_x, mod_y, mod_z
-
-
-# Creates a circular mask with radius around center
-def circular_mask(arr_length, center, radius) -> np.ndarray:
-    dx = np.arange(arr_length)
-    return (dx[np.newaxis, :] - center) ** 2 + (
-        dx[:, np.newaxis] - center
-    ) ** 2 < radius**2
-
-
-# Returns the minimum (closest) depth for a specified radius around the center
-def depth_min(depths, center, r=4) -> float:
-    selected_depths = depths[circular_mask(len(depths), center, r)]
-    filtered_depths = selected_depths[(0 < selected_depths) & (selected_depths < 1)]
-    if 0 in depths:  # Check if cursor is at widget border
-        return 1
-    elif len(filtered_depths) > 0:
-        return np.min(filtered_depths)
-    else:
-        return 0.5
-
-
-# Returns the mean depth for a specified radius around the center
-def depth_smoothing(depths, center, r=15) -> float:
-    selected_depths = depths[circular_mask(len(depths), center, r)]
-    if 0 in depths:  # Check if cursor is at widget border
-        return 1
-    elif np.isnan(
-        selected_depths[selected_depths < 1]
-    ).all():  # prevent mean of empty slice
-        return 1
-    return np.nanmedian(selected_depths[selected_depths < 1])
+        return self.camera.unproject(x, real_y, z)